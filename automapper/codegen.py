@@ -0,0 +1,206 @@
+import keyword
+import linecache
+import re
+from copy import copy
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .plan import ATTRIBUTE, CONSTANT, GETTER, IMMEDIATE_TYPES, ITEM, MappingPlan
+
+if TYPE_CHECKING:
+    from .mapper import Mapper
+
+MappingFunction = Callable[["Mapper", Any, Set[int]], Any]
+# Appends values of `target class` fields mapped from source object to columns, see `automapper.columnar`.
+# Receives mapper, source object, visited stack, append methods of columns and custom mapping of the call
+ColumnsFunction = Callable[
+    [
+        "Mapper",
+        Any,
+        Set[int],
+        Tuple[Callable[[Any], None], ...],
+        Optional[Dict[str, Any]],
+    ],
+    None,
+]
+
+
+def _is_keyword_argument(field_name: str) -> bool:
+    return field_name.isidentifier() and not keyword.iskeyword(field_name)
+
+
+def _read_expression(field_name: str, access: int) -> str:
+    if access == ITEM:
+        return f"_obj[{field_name!r}]"
+    if _is_keyword_argument(field_name):
+        return f"_obj.{field_name}"
+    return f"getattr(_obj, {field_name!r})"
+
+
+def _value_expression(plan: MappingPlan[Any], index: int) -> str:
+    variable = f"_v{index}"
+    if plan.copy_policies is not None:
+        copy_policy = plan.copy_policies[index]
+    else:
+        copy_policy = "map" if plan.options.use_deepcopy else "reference"
+    if copy_policy == "reference":
+        return variable
+    copy_call = {
+        "map": f"_map_subobject({variable}, _visited_stack, _options)",
+        "shallow": f"_shallow_copy({variable})",
+        "deep": f"_mapper._copier.copy({variable})",
+    }[copy_policy]
+    return f"{variable} if type({variable}) in _immediate_types else {copy_call}"
+
+
+def _function_name(plan: MappingPlan[Any], prefix: str = "map") -> str:
+    name = f"{prefix}_{plan.source_cls.__name__}_to_{plan.target_cls.__name__}"
+    return re.sub(r"\W", "_", name)
+
+
+def _read_lines(plan: MappingPlan[Any], fallback_call: str) -> List[str]:
+    """Generates lines reading values of all fields into `_v<index>` variables"""
+    lines: List[str] = []
+    if plan.options.use_deepcopy or "map" in (plan.copy_policies or ()):
+        lines.append("    _map_subobject = _mapper._map_subobject")
+
+    read_fields = [
+        (index, field_name, access)
+        for index, (field_name, access) in enumerate(plan.fields)
+        if access in (ATTRIBUTE, ITEM)
+    ]
+    if read_fields:
+        lines.append("    try:")
+        for index, field_name, access in read_fields:
+            lines.append(f"        _v{index} = {_read_expression(field_name, access)}")
+        lines.append("    except (AttributeError, KeyError):")
+        lines.append(f"        return {fallback_call}")
+    # fields registered in fields mapping are read after the fallback, so getters are called once
+    for index, (_, access) in enumerate(plan.fields):
+        if access == GETTER:
+            lines.append(f"    _v{index} = _field_sources[{index}](_obj)")
+        elif access == CONSTANT:
+            lines.append(f"    _v{index} = _field_sources[{index}]")
+    return lines
+
+
+def generate_source(plan: MappingPlan[Any]) -> str:
+    """Generates source code of a function specialized for mapping plan.
+    Generated function reads all fields of source object and calls `target class` constructor directly.
+    If any of the fields is missing in source object, it falls back to generic mapping of the plan.
+    """
+    lines: List[str] = [f"def {_function_name(plan)}(_mapper, _obj, _visited_stack):"]
+    lines.extend(_read_lines(plan, "_fallback(_mapper, _obj, _visited_stack)"))
+
+    # objects created by constructor function or trusted initializer get dictionary of mapped values
+    construct = plan.constructor is not None or plan.initializer is not None
+    if plan.options.skip_none_values:
+        lines.append("    _kwargs = {}")
+        for index, (field_name, _) in enumerate(plan.fields):
+            lines.append(f"    if _v{index} is not None:")
+            lines.append(
+                f"        _kwargs[{field_name!r}] = {_value_expression(plan, index)}"
+            )
+        if construct:
+            lines.append("    return _construct(_kwargs)")
+        else:
+            lines.append("    return _target_cls(**_kwargs)")
+        return "\n".join(lines) + "\n"
+
+    if construct:
+        lines.append("    return _construct({")
+        for index, (field_name, _) in enumerate(plan.fields):
+            lines.append(f"        {field_name!r}: {_value_expression(plan, index)},")
+        lines.append("    })")
+        return "\n".join(lines) + "\n"
+
+    keyword_arguments: List[str] = []
+    extra_arguments: List[str] = []
+    for index, (field_name, _) in enumerate(plan.fields):
+        value = _value_expression(plan, index)
+        if _is_keyword_argument(field_name):
+            keyword_arguments.append(f"        {field_name}={value},")
+        else:
+            extra_arguments.append(f"{field_name!r}: {value}")
+    if extra_arguments:
+        keyword_arguments.append(f"        **{{{', '.join(extra_arguments)}}},")
+
+    lines.append("    return _target_cls(")
+    lines.extend(keyword_arguments)
+    lines.append("    )")
+    return "\n".join(lines) + "\n"
+
+
+def generate_columns_source(
+    plan: MappingPlan[Any], factories: Tuple[Optional[Callable[[], Any]], ...]
+) -> str:
+    """Generates source code of a function that appends mapped values of all fields to columns.
+    Skipped None values are replaced with default values or results of default factories of fields.
+    """
+    arguments = "_mapper, _obj, _visited_stack, _appends"
+    lines: List[str] = [
+        f"def {_function_name(plan, 'columns')}({arguments}, _custom_mapping=None):",
+        "    if _custom_mapping:",
+        f"        return _fallback({arguments}, _custom_mapping)",
+    ]
+    lines.extend(_read_lines(plan, f"_fallback({arguments}, None)"))
+    for index in range(len(plan.fields)):
+        value = _value_expression(plan, index)
+        if plan.options.skip_none_values:
+            if factories[index] is not None:
+                default = f"_factories[{index}]()"
+            else:
+                default = f"_defaults[{index}]"
+            value = f"{default} if _v{index} is None else {value}"
+        lines.append(f"    _appends[{index}]({value})")
+    return "\n".join(lines) + "\n"
+
+
+def _compile(
+    plan: MappingPlan[Any], name: str, source: str, namespace: Dict[str, Any]
+) -> Any:
+    filename = f"<automapper {name} {id(plan):x}>"
+    namespace.update(
+        {
+            "_target_cls": plan.target_cls,
+            "_immediate_types": IMMEDIATE_TYPES,
+            "_options": plan.options,
+            "_field_sources": plan.field_sources,
+            "_shallow_copy": copy,
+        }
+    )
+    exec(compile(source, filename, "exec"), namespace)
+    # register source code so tracebacks and debuggers can show generated lines
+    linecache.cache[filename] = (len(source), None, source.splitlines(True), filename)
+    return namespace[name]
+
+
+def compile_plan(plan: MappingPlan[Any]) -> Tuple[MappingFunction, str]:
+    """Compiles specialized mapping function for mapping plan with `exec`.
+    Returns function and its source code.
+    """
+    source = generate_source(plan)
+    namespace: Dict[str, Any] = {
+        "_construct": plan.constructor or plan.construct,
+        "_fallback": plan.map_generic,
+    }
+    function: MappingFunction = _compile(plan, _function_name(plan), source, namespace)
+    return function, source
+
+
+def compile_columns_plan(
+    plan: MappingPlan[Any],
+    defaults: Tuple[Any, ...],
+    factories: Tuple[Optional[Callable[[], Any]], ...],
+    fallback: ColumnsFunction,
+) -> ColumnsFunction:
+    """Compiles function appending mapped values of fields of mapping plan to columns"""
+    source = generate_columns_source(plan, factories)
+    namespace: Dict[str, Any] = {
+        "_defaults": defaults,
+        "_factories": factories,
+        "_fallback": fallback,
+    }
+    function: ColumnsFunction = _compile(
+        plan, _function_name(plan, "columns"), source, namespace
+    )
+    return function
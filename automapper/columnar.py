@@ -0,0 +1,314 @@
+from array import array
+from functools import partial
+from itertools import repeat
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    MutableSequence,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Type,
+)
+
+from .codegen import ColumnsFunction, compile_columns_plan
+from .exceptions import MappingError
+from .plan import IMMEDIATE_TYPES, MappingOptions, MappingPlan
+from .references import ReferenceMemo
+from .trusted import default_values
+from .utils import is_function
+
+if TYPE_CHECKING:
+    from .mapper import Mapper
+
+# Values of every target field in the order of source objects
+Columns = Dict[str, MutableSequence[Any]]
+
+
+def _create_columns(
+    fields: Tuple[str, ...], typecodes: Optional[Dict[str, str]]
+) -> Columns:
+    typecodes = typecodes or {}
+    unknown_fields = set(typecodes).difference(fields)
+    if unknown_fields:
+        raise ValueError(
+            f"Typecodes are set for unknown fields: {', '.join(sorted(unknown_fields))}"
+        )
+    columns: Columns = {}
+    for field_name in fields:
+        if field_name in typecodes:
+            columns[field_name] = array(typecodes[field_name])
+        else:
+            columns[field_name] = []
+    return columns
+
+
+def _to_numpy(columns: Columns, typecodes: Optional[Dict[str, str]]) -> Any:
+    """Creates NumPy structured array with a named field per column"""
+    import numpy
+
+    typecodes = typecodes or {}
+    arrays = []
+    for field_name, column in columns.items():
+        dtype = typecodes.get(field_name)
+        try:
+            values = numpy.asarray(column, dtype=dtype)
+        except ValueError:
+            # sequences of different lengths
+            if dtype is not None:
+                raise
+            values = None
+        if values is None or values.ndim != 1:
+            # nested sequences are kept as objects instead of extra dimensions
+            values = numpy.fromiter(column, dtype=object, count=len(column))
+        arrays.append(values)
+    size = len(arrays[0]) if arrays else 0
+    result = numpy.empty(
+        size,
+        dtype=[
+            (field_name, values.dtype) for field_name, values in zip(columns, arrays)
+        ],
+    )
+    for field_name, values in zip(columns, arrays):
+        result[field_name] = values
+    return result
+
+
+def _append_values(
+    plan: MappingPlan[Any],
+    defaults: Tuple[Any, ...],
+    factories: Tuple[Optional[Callable[[], Any]], ...],
+    mapper: "Mapper",
+    obj: Any,
+    _visited_stack: Set[int],
+    appends: Tuple[Callable[[Any], None], ...],
+    custom_mapping: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Appends mapped values of all fields to columns, skipped fields get default values"""
+    mapped_values = plan.map_values(mapper, obj, _visited_stack, custom_mapping)
+    if len(mapped_values) == len(appends):
+        # mapped values are in the order of fields
+        for append, value in zip(appends, mapped_values.values()):
+            append(value)
+        return
+    for index, (field_name, _) in enumerate(plan.fields):
+        if field_name in mapped_values:
+            value = mapped_values[field_name]
+        else:
+            factory = factories[index]
+            value = defaults[index] if factory is None else factory()
+        appends[index](value)
+
+
+def _get_columns_function(mapper: "Mapper", plan: MappingPlan[Any]) -> ColumnsFunction:
+    """Returns function appending mapped values to columns, it's created once per mapping plan"""
+    function: Optional[ColumnsFunction] = plan.columns_function
+    if function is None:
+        fields = tuple(field_name for field_name, _ in plan.fields)
+        field_defaults, field_factories = default_values(plan.target_cls, fields)
+        defaults = tuple(field_defaults.get(field_name) for field_name in fields)
+        factories = tuple(field_factories.get(field_name) for field_name in fields)
+        function = partial(_append_values, plan, defaults, factories)
+        if mapper._codegen:
+            function = compile_columns_plan(plan, defaults, factories, function)
+        plan.columns_function = function
+    return function
+
+
+def map_columns(
+    mapper: "Mapper",
+    objs: Iterable[Any],
+    target_cls: Optional[Type[Any]],
+    options: Dict[str, Any],
+    typecodes: Optional[Dict[str, str]] = None,
+    as_numpy: bool = False,
+) -> Any:
+    """Maps source objects into columns of `target class` fields instead of `target class` objects.
+    Fields are resolved with spec functions same as for objects, values are mapped by mapping plans
+    and appended to column of every field. Fields missing in source object get default values of `__init__`
+    arguments or None.
+    """
+    custom_mapping = options.pop("custom_mapping", None)
+    mapping_options = MappingOptions(**options)
+    functions: Dict[type, ColumnsFunction] = {}
+    columns_target_cls = target_cls
+    _visited_stack: Set[int] = set()
+    columns: Optional[Columns] = None
+    appends: Tuple[Callable[[Any], None], ...] = ()
+
+    for obj in objs:
+        obj_type = type(obj)
+        function = functions.get(obj_type)
+        if function is None:
+            obj_target_cls = target_cls
+            if obj_target_cls is None:
+                if obj_type not in mapper._mappings:
+                    raise MappingError(
+                        f"Missing mapping type for input type {obj_type}"
+                    )
+                obj_target_cls = mapper._mappings[obj_type][0]
+                if columns_target_cls is None:
+                    columns_target_cls = obj_target_cls
+                elif obj_target_cls is not columns_target_cls:
+                    raise MappingError(
+                        f"Objects of {obj_type} are mapped to {obj_target_cls}, "
+                        "columns can be created for one target class"
+                    )
+            plan = mapper._get_plan(obj_type, obj_target_cls, mapping_options)
+            function = _get_columns_function(mapper, plan)
+            functions[obj_type] = function
+            if columns is None:
+                columns = _create_columns(mapper._get_fields(obj_target_cls), typecodes)
+                appends = tuple(column.append for column in columns.values())
+
+        obj_id = id(obj)
+        _visited_stack.add(obj_id)
+        function(mapper, obj, _visited_stack, appends, custom_mapping)
+        _visited_stack.remove(obj_id)
+
+    if columns is None:
+        # fields of empty batch are known only for explicit target class
+        fields = mapper._get_fields(target_cls) if target_cls is not None else ()
+        columns = _create_columns(fields, typecodes)
+    if as_numpy:
+        return _to_numpy(columns, typecodes)
+    return columns
+
+
+class ColumnBatch(Iterable[Dict[str, Any]]):
+    """Batch of source objects stored by columns: dictionary of equally long sequences of field values
+    or NumPy structured (record) array. Pass it to `map_many` to map records without creating row objects.
+    """
+
+    __slots__ = ("columns", "size")
+
+    def __init__(self, columns: Any) -> None:
+        names = getattr(getattr(columns, "dtype", None), "names", None)
+        if names is not None:
+            # values of NumPy arrays are converted to Python objects once per column
+            self.columns: Dict[str, Sequence[Any]] = {
+                name: columns[name].tolist() for name in names
+            }
+        else:
+            self.columns = dict(columns)
+        sizes = {len(column) for column in self.columns.values()}
+        if len(sizes) > 1:
+            raise ValueError("Columns of batch should have the same length")
+        self.size: int = sizes.pop() if sizes else 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Yields records as dictionaries, e.g. when batch is mapped on a pool of workers"""
+        names = list(self.columns)
+        for row in _zip_columns(self, names):
+            yield dict(zip(names, row))
+
+
+def map_column_batch(
+    mapper: "Mapper",
+    batch: ColumnBatch,
+    target_cls: Optional[Type[Any]],
+    options: Dict[str, Any],
+) -> Iterator[Any]:
+    """Maps records of column batch into `target class` objects. Columns of `target class` fields are read
+    by name once and zipped into keyword arguments of `target class` constructor.
+    Functions in fields mapping are called with dictionary of record values.
+    Records have no source class, like dictionaries mapped with `Mapper.to`, so fields mapping, copy policies
+    and trusted mode registered with `Mapper.add` for pairs of classes are not applied to them.
+    """
+    if target_cls is None:
+        raise MappingError("Target class is required to map column batch")
+    custom_mapping = options.pop("custom_mapping", None) or {}
+    mapping_options = MappingOptions(**options)
+    construct: Callable[[Dict[str, Any]], Any]
+    constructor = mapper._get_constructor(target_cls)
+    if constructor is not None:
+        construct = constructor
+    else:
+        construct = partial(_call_with_keywords, target_cls)
+
+    names: List[str] = []
+    constants: Dict[str, Any] = {}
+    getters: Dict[str, Callable[[Any], Any]] = {}
+    for field_name in mapper._get_fields(target_cls):
+        if field_name in custom_mapping:
+            value = custom_mapping[field_name]
+            if is_function(value):
+                getters[field_name] = value
+            else:
+                constants[field_name] = value
+        elif field_name in batch.columns:
+            names.append(field_name)
+    preserve_references = mapping_options.preserve_references
+    copy_values = mapping_options.use_deepcopy
+    _visited_stack: Set[int] = set()
+
+    if not (constants or getters or mapping_options.skip_none_values):
+        rows = _zip_columns(batch, names)
+        # columns of primitive values are checked once instead of every value
+        if copy_values and all(
+            IMMEDIATE_TYPES.issuperset(map(type, batch.columns[name])) for name in names
+        ):
+            copy_values = False
+        if not copy_values:
+            for row in rows:
+                yield construct(dict(zip(names, row)))
+            return
+        # values of primitive types are used as is, other values are mapped as child objects
+        for row in rows:
+            if preserve_references:
+                _visited_stack = ReferenceMemo()
+            yield construct(
+                {
+                    name: (
+                        value
+                        if type(value) in IMMEDIATE_TYPES
+                        else mapper._map_subobject(
+                            value, _visited_stack, mapping_options
+                        )
+                    )
+                    for name, value in zip(names, row)
+                }
+            )
+        return
+
+    # functions of fields mapping receive values of all columns
+    record_names = list(batch.columns) if getters else names
+    for row in _zip_columns(batch, record_names):
+        record = dict(zip(record_names, row))
+        values = {name: record[name] for name in names} if getters else record
+        values.update(constants)
+        for field_name, getter in getters.items():
+            values[field_name] = getter(record)
+        if mapping_options.skip_none_values:
+            values = {
+                name: value for name, value in values.items() if value is not None
+            }
+        if copy_values:
+            if preserve_references:
+                _visited_stack = ReferenceMemo()
+            for name, value in values.items():
+                if type(value) not in IMMEDIATE_TYPES:
+                    values[name] = mapper._map_subobject(
+                        value, _visited_stack, mapping_options
+                    )
+        yield construct(values)
+
+
+def _zip_columns(batch: ColumnBatch, names: List[str]) -> Iterable[Tuple[Any, ...]]:
+    """Returns values of columns per record"""
+    if not names:
+        return repeat((), batch.size)
+    return zip(*(batch.columns[name] for name in names))
+
+
+def _call_with_keywords(target_cls: Type[Any], values: Dict[str, Any]) -> Any:
+    return target_cls(**values)
@@ -0,0 +1,325 @@
+import copyreg
+import dataclasses
+import datetime
+import re
+import types
+import uuid
+import weakref
+from copy import deepcopy
+from decimal import Decimal
+from enum import Enum
+from fractions import Fraction
+from typing import (
+    Any,
+    Callable,
+    Container,
+    Dict,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    cast,
+)
+
+T = TypeVar("T")
+Memo = Optional[Dict[int, Any]]
+CopyFunction = Callable[[T, Memo], T]
+
+# Objects of these types can't be changed, so copies share them
+_IMMUTABLE_TYPES = (
+    type(None),
+    type(Ellipsis),
+    type(NotImplemented),
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    bool,
+    range,
+    slice,
+    type,
+    types.BuiltinFunctionType,
+    types.FunctionType,
+    types.CodeType,
+    weakref.ref,
+    property,
+    re.Pattern,
+    datetime.date,
+    datetime.datetime,
+    datetime.time,
+    datetime.timedelta,
+    datetime.timezone,
+    Decimal,
+    Fraction,
+    uuid.UUID,
+)
+
+
+# Verdicts of immutability check per type
+_MUTABLE = 0
+_IMMUTABLE = 1
+_IMMUTABLE_ITEMS = 2  # immutable if all items are immutable
+_IMMUTABLE_FIELDS = 3  # immutable if all dataclass fields are immutable
+
+
+def _share(obj: T, memo: Memo) -> T:
+    return obj
+
+
+def _deepcopy(obj: T, memo: Memo) -> T:
+    return deepcopy(obj, memo)
+
+
+def _has_default_copy_protocol(cls: Type[Any]) -> bool:
+    """Checks that class does not customize the way `copy.deepcopy` copies it"""
+    return (
+        not hasattr(cls, "__deepcopy__")
+        and cls not in copyreg.dispatch_table
+        and getattr(cls, "__reduce_ex__") is getattr(object, "__reduce_ex__")
+        and getattr(cls, "__reduce__") is getattr(object, "__reduce__")
+        and getattr(cls, "__getstate__", None) is getattr(object, "__getstate__", None)
+        and not hasattr(cls, "__setstate__")
+    )
+
+
+def _extends_builtin_type(cls: Type[Any]) -> bool:
+    """Checks if class inherits builtin type other than `object`, e.g. `list`, which keeps data outside of fields"""
+    return any(
+        base is not object and base.__module__ == "builtins" for base in cls.__mro__
+    )
+
+
+def _has_instance_dict(cls: Type[Any]) -> bool:
+    """Checks if objects of the class can have arbitrary attributes"""
+    return any(
+        base.__module__ != "builtins" and "__slots__" not in base.__dict__
+        for base in cls.__mro__
+    )
+
+
+def _slot_names(cls: Type[Any]) -> Iterator[str]:
+    for base in cls.__mro__:
+        slots = base.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in ("__dict__", "__weakref__"):
+                yield name
+
+
+class Copier:
+    """Deep copy of objects with fast copy functions per type.
+    Immutable objects are shared, builtin collections and dataclasses are copied directly,
+    everything else is copied with `copy.deepcopy`. Results are same as of `copy.deepcopy`.
+    """
+
+    def __init__(self) -> None:
+        self._copy_functions: Dict[type, CopyFunction[Any]] = {
+            **{cls: _share for cls in _IMMUTABLE_TYPES},
+            list: self._copy_list,
+            dict: self._copy_dict,
+            set: self._copy_set,
+            tuple: self._copy_tuple,
+            frozenset: self._copy_frozenset,
+            bytearray: self._copy_bytearray,
+        }
+        # copy functions resolved for concrete classes
+        self._resolved: Dict[type, CopyFunction[Any]] = {}
+        # immutability verdicts and names of dataclass fields per class
+        self._immutability: Dict[type, Tuple[int, Tuple[str, ...]]] = {}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # some builtin immutable types can't be pickled by name, so only registered copy functions are pickled,
+        # builtin copy functions and caches are created again by unpickled copier
+        return {"copy_functions": self._registered_functions()}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__init__()  # type: ignore [misc]
+        self._copy_functions.update(state["copy_functions"])
+
+    def register(self, cls: Type[T], copy_func: CopyFunction[T]) -> None:
+        """Registers copy function for objects of exactly `cls` type.
+        Copy function receives object and memo dictionary (or None), same as `copy.deepcopy` function.
+        """
+        self._copy_functions[cls] = copy_func
+        self.clear_caches()
+
+    def clone(self) -> "Copier":
+        """Returns copier with the same copy functions"""
+        copier = Copier()
+        copier._copy_functions.update(self._registered_functions())
+        copier._immutability = self._immutability.copy()
+        return copier
+
+    def _registered_functions(self) -> Dict[type, CopyFunction[Any]]:
+        """Returns copy functions registered in addition to or instead of builtin ones"""
+        return {
+            cls: copy_func
+            for cls, copy_func in self._copy_functions.items()
+            # builtin copy functions are methods bound to this copier, every copier has its own
+            if getattr(copy_func, "__self__", None) is not self
+            and not (copy_func is _share and cls in _IMMUTABLE_TYPES)
+        }
+
+    def clear_caches(self) -> None:
+        """Clears copy functions and immutability verdicts resolved for classes"""
+        self._resolved.clear()
+        self._immutability.clear()
+
+    def copy(self, obj: T, memo: Memo = None) -> T:
+        """Returns deep copy of the object"""
+        cls = type(obj)
+        copy_func = self._resolved.get(cls)
+        if copy_func is None:
+            copy_func = self._resolve(cls)
+        return cast(T, copy_func(obj, memo))
+
+    def uses_deepcopy(self, cls: Type[Any]) -> bool:
+        """Checks if objects of the class are copied with `copy.deepcopy` for lack of faster copy function"""
+        copy_func = self._resolved.get(cls)
+        if copy_func is None:
+            copy_func = self._resolve(cls)
+        return copy_func is _deepcopy
+
+    def is_immutable(self, obj: Any, mutable_types: Container[type] = ()) -> bool:
+        """Checks if neither object nor objects it references can be changed, so the object can be shared.
+        Objects of `mutable_types` are considered mutable regardless of their type.
+        """
+        cls = type(obj)
+        if cls in mutable_types:
+            return False
+        verdict = self._immutability.get(cls)
+        if verdict is None:
+            verdict = self._resolve_immutability(cls)
+        kind, field_names = verdict
+        if kind == _IMMUTABLE_ITEMS:
+            return all(self.is_immutable(item, mutable_types) for item in obj)
+        if kind == _IMMUTABLE_FIELDS:
+            return all(
+                self.is_immutable(getattr(obj, name), mutable_types)
+                for name in field_names
+            )
+        return kind == _IMMUTABLE
+
+    def _resolve_immutability(self, cls: Type[Any]) -> Tuple[int, Tuple[str, ...]]:
+        field_names: Tuple[str, ...] = ()
+        if self._copy_functions.get(cls) is _share or issubclass(cls, Enum):
+            kind = _IMMUTABLE
+        elif issubclass(cls, (tuple, frozenset)) and not _has_instance_dict(cls):
+            kind = _IMMUTABLE_ITEMS
+        elif (
+            dataclasses.is_dataclass(cls)
+            and getattr(cls, "__dataclass_params__").frozen
+            and not _extends_builtin_type(cls)
+        ):
+            kind = _IMMUTABLE_FIELDS
+            field_names = tuple(field.name for field in dataclasses.fields(cls))
+        else:
+            kind = _MUTABLE
+        self._immutability[cls] = (kind, field_names)
+        return kind, field_names
+
+    def _resolve(self, cls: Type[Any]) -> CopyFunction[Any]:
+        copy_func = self._copy_functions.get(cls)
+        if copy_func is None:
+            if issubclass(cls, Enum):
+                copy_func = _share
+            elif (
+                dataclasses.is_dataclass(cls)
+                and _has_default_copy_protocol(cls)
+                and not _extends_builtin_type(cls)
+            ):
+                copy_func = self._copy_object
+            else:
+                copy_func = _deepcopy
+        self._resolved[cls] = copy_func
+        return copy_func
+
+    def _copy_list(self, obj: Any, memo: Memo) -> Any:
+        if memo is None:
+            memo = {}
+        elif id(obj) in memo:
+            return memo[id(obj)]
+        result: Any = []
+        memo[id(obj)] = result
+        copy = self.copy
+        result.extend([copy(item, memo) for item in obj])
+        return result
+
+    def _copy_dict(self, obj: Any, memo: Memo) -> Any:
+        if memo is None:
+            memo = {}
+        elif id(obj) in memo:
+            return memo[id(obj)]
+        result: Any = {}
+        memo[id(obj)] = result
+        copy = self.copy
+        for key, value in obj.items():
+            result[copy(key, memo)] = copy(value, memo)
+        return result
+
+    def _copy_set(self, obj: Any, memo: Memo) -> Any:
+        if memo is None:
+            memo = {}
+        elif id(obj) in memo:
+            return memo[id(obj)]
+        copy = self.copy
+        result = {copy(item, memo) for item in obj}
+        memo[id(obj)] = result
+        return result
+
+    def _copy_tuple(self, obj: Any, memo: Memo) -> Any:
+        if memo is None:
+            memo = {}
+        elif id(obj) in memo:
+            return memo[id(obj)]
+        copy = self.copy
+        items = [copy(item, memo) for item in obj]
+        # tuple can get into memo while its items were copied, if it's referenced from them
+        if id(obj) in memo:
+            return memo[id(obj)]
+        if all(item is original for item, original in zip(items, obj)):
+            return obj
+        result = tuple(items)
+        memo[id(obj)] = result
+        return result
+
+    def _copy_frozenset(self, obj: Any, memo: Memo) -> Any:
+        if memo is None:
+            memo = {}
+        elif id(obj) in memo:
+            return memo[id(obj)]
+        copy = self.copy
+        items = [copy(item, memo) for item in obj]
+        if all(item is original for item, original in zip(items, obj)):
+            return obj
+        result = frozenset(items)
+        memo[id(obj)] = result
+        return result
+
+    def _copy_bytearray(self, obj: Any, memo: Memo) -> Any:
+        if memo is None:
+            return bytearray(obj)
+        if id(obj) not in memo:
+            memo[id(obj)] = bytearray(obj)
+        return memo[id(obj)]
+
+    def _copy_object(self, obj: Any, memo: Memo) -> Any:
+        """Copies object field by field, the way `copy.deepcopy` does it for objects with default copy protocol"""
+        if memo is None:
+            memo = {}
+        elif id(obj) in memo:
+            return memo[id(obj)]
+        cls: Any = type(obj)
+        result = cls.__new__(cls)
+        memo[id(obj)] = result
+        copy = self.copy
+        state = getattr(obj, "__dict__", None)
+        if state is not None:
+            result.__dict__.update(
+                {name: copy(value, memo) for name, value in state.items()}
+            )
+        for name in _slot_names(cls):
+            if hasattr(obj, name):
+                object.__setattr__(result, name, copy(getattr(obj, name), memo))
+        return result
@@ -9,5 +9,6 @@ class MappingError(Exception):
 class CircularReferenceError(Exception):
     def __init__(self, *args: object) -> None:
         super().__init__(
-            "Mapper does not support objects with circular references yet", *args
+            "Mapper supports objects with circular references only with `preserve_references=True`",
+            *args,
         )
@@ -0,0 +1,61 @@
+from typing import Any, Callable, Dict, Iterable, Type
+
+import attr
+from automapper import Mapper
+
+
+def attrs_spec_decide(obj_type: Type[Any]) -> bool:
+    return isinstance(obj_type, type) and attr.has(obj_type)
+
+
+def _init_name(attribute: "attr.Attribute[Any]") -> str:
+    return getattr(attribute, "alias", None) or attribute.name.lstrip("_")
+
+
+def spec_function(target_cls: Type[Any]) -> Iterable[str]:
+    """Arguments of `__init__` of attrs class: private attributes like `_name` are initialized with `name` argument"""
+    return (
+        _init_name(attribute) for attribute in attr.fields(target_cls) if attribute.init
+    )
+
+
+def trusted_constructor_function(
+    target_cls: Type[Any],
+) -> Callable[[Dict[str, Any]], Any]:
+    """Trusted mappings set attributes with `object.__setattr__`, so validators, converters
+    and `__attrs_post_init__` are skipped. Skipped values get defaults like in `__init__`.
+    """
+    attributes = [
+        (
+            _init_name(attribute) if attribute.init else None,
+            attribute.name,
+            attribute.default,
+        )
+        for attribute in attr.fields(target_cls)
+    ]
+
+    def construct(mapped_values: Dict[str, Any]) -> Any:
+        result = object.__new__(target_cls)
+        for init_name, name, default in attributes:
+            if init_name in mapped_values:
+                value = mapped_values[init_name]
+            elif isinstance(default, attr.Factory):  # type: ignore [arg-type]
+                value = (
+                    default.factory(result) if default.takes_self else default.factory()
+                )
+            elif default is not attr.NOTHING:
+                value = default
+            else:
+                # `__init__` raises error about missing argument
+                return target_cls(**mapped_values)
+            object.__setattr__(result, name, value)
+        return result
+
+    return construct
+
+
+def extend(mapper: Mapper) -> None:
+    mapper.add_spec(attrs_spec_decide, spec_function)
+    mapper.add_constructor(
+        attrs_spec_decide, trusted_constructor_function, trusted=True
+    )
@@ -0,0 +1,34 @@
+import dataclasses
+from typing import Any, Iterable, Type
+
+from automapper import Mapper
+
+
+def dataclass_spec_decide(obj_type: Type[Any]) -> bool:
+    return isinstance(obj_type, type) and dataclasses.is_dataclass(obj_type)
+
+
+def _is_init_var(field: "dataclasses.Field[Any]") -> bool:
+    """Checks if dataclass pseudo-field is annotated with `InitVar`, as object or as string annotation"""
+    if isinstance(field.type, str):
+        return field.type.startswith(("InitVar", "dataclasses.InitVar"))
+    return (
+        isinstance(field.type, dataclasses.InitVar) or field.type is dataclasses.InitVar
+    )
+
+
+def spec_function(target_cls: Type[Any]) -> Iterable[str]:
+    """Fields accepted by `__init__` of dataclass, read from dataclass metadata.
+    Unlike `__init__` annotations, it works for classes with `__slots__` and skips fields with `init=False`.
+    `InitVar` pseudo-fields are arguments of `__init__` too, though `dataclasses.fields` skips them.
+    """
+    field_names = {field.name for field in dataclasses.fields(target_cls)}
+    return (
+        field.name
+        for field in getattr(target_cls, "__dataclass_fields__").values()
+        if field.init and (field.name in field_names or _is_init_var(field))
+    )
+
+
+def extend(mapper: Mapper) -> None:
+    mapper.add_spec(dataclass_spec_decide, spec_function)
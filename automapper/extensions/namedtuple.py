@@ -0,0 +1,52 @@
+from operator import itemgetter
+from typing import Any, Callable, Dict, Iterable, NamedTuple, Type
+
+from automapper import Mapper
+
+
+def namedtuple_spec_decide(obj_type: Type[Any]) -> bool:
+    return (
+        isinstance(obj_type, type)
+        and issubclass(obj_type, tuple)
+        and hasattr(obj_type, "_fields")
+    )
+
+
+def spec_function(target_cls: Type[NamedTuple]) -> Iterable[str]:
+    return target_cls._fields
+
+
+def _has_generated_new(target_cls: Type[NamedTuple]) -> bool:
+    """Checks that `__new__` of named tuple is not overridden by subclass"""
+    for cls in target_cls.__mro__:
+        if "__new__" in vars(cls):
+            return "_make" in vars(cls)
+    return False
+
+
+def constructor_function(target_cls: Type[Any]) -> Callable[[Dict[str, Any]], Any]:
+    """Creates named tuple from values of all its fields in positional order, without binding keyword arguments"""
+    fields = target_cls._fields
+    if not fields or not _has_generated_new(target_cls):
+        return lambda mapped_values: target_cls(**mapped_values)
+
+    get_values: Callable[[Dict[str, Any]], Any]
+    if len(fields) == 1:
+        field_name = fields[0]
+        get_values = lambda mapped_values: (mapped_values[field_name],)  # noqa: E731
+    else:
+        get_values = itemgetter(*fields)
+
+    def construct(mapped_values: Dict[str, Any]) -> Any:
+        try:
+            return tuple.__new__(target_cls, get_values(mapped_values))
+        except KeyError:
+            # skipped fields get default values
+            return target_cls(**mapped_values)
+
+    return construct
+
+
+def extend(mapper: Mapper) -> None:
+    mapper.add_spec(namedtuple_spec_decide, spec_function)
+    mapper.add_constructor(namedtuple_spec_decide, constructor_function)
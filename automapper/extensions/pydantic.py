@@ -1,4 +1,4 @@
-from typing import Iterable, Type
+from typing import Any, Callable, Dict, Iterable, Type
 
 from automapper import Mapper
 from pydantic import BaseModel
@@ -8,5 +8,37 @@ def spec_function(target_cls: Type[BaseModel]) -> Iterable[str]:
     return (field_name for field_name in target_cls.model_fields)
 
 
+def trusted_constructor_function(
+    target_cls: Type[BaseModel],
+) -> Callable[[Dict[str, Any]], BaseModel]:
+    """Trusted mappings create models the way `model_construct` does: defaults are set, validation is skipped.
+    When values of all fields are mapped, dictionary of mapped values becomes `__dict__` of the model directly.
+    """
+    construct = target_cls.model_construct
+    if (
+        target_cls.__pydantic_post_init__
+        or target_cls.__pydantic_root_model__
+        or target_cls.model_config.get("extra") == "allow"
+    ):
+        return lambda mapped_values: construct(**mapped_values)
+
+    fields_count = len(target_cls.model_fields)
+    set_attribute = object.__setattr__
+
+    def construct_model(mapped_values: Dict[str, Any]) -> BaseModel:
+        if len(mapped_values) != fields_count:
+            # skipped fields get default values
+            return construct(**mapped_values)
+        result = object.__new__(target_cls)
+        set_attribute(result, "__dict__", mapped_values)
+        set_attribute(result, "__pydantic_fields_set__", set(mapped_values))
+        set_attribute(result, "__pydantic_extra__", None)
+        set_attribute(result, "__pydantic_private__", None)
+        return result
+
+    return construct_model
+
+
 def extend(mapper: Mapper) -> None:
     mapper.add_spec(BaseModel, spec_function)
+    mapper.add_constructor(BaseModel, trusted_constructor_function, trusted=True)
@@ -1,4 +1,4 @@
-from typing import Iterable, Type
+from typing import Any, Callable, Dict, Iterable, Type
 
 from automapper import Mapper
 from sqlalchemy.inspection import inspect
@@ -15,5 +15,32 @@ def spec_function(target_cls: Type[DeclarativeBase]) -> Iterable[str]:
     return attrs
 
 
+def trusted_constructor_function(
+    target_cls: Type[DeclarativeBase],
+) -> Callable[[Dict[str, Any]], DeclarativeBase]:
+    """Trusted mappings create instances with instrumentation state but without calling `__init__`.
+    Column values are stored in instance dictionary the way ORM loads rows, relationships are set as attributes,
+    so backrefs and cascades still work.
+    """
+    inspector = inspect(target_cls)
+    new_instance = inspector.class_manager.new_instance
+    column_keys = frozenset(column.key for column in inspector.column_attrs)
+
+    def construct(mapped_values: Dict[str, Any]) -> DeclarativeBase:
+        result = new_instance()
+        instance_dict = result.__dict__
+        for key, value in mapped_values.items():
+            if key in column_keys:
+                instance_dict[key] = value
+            else:
+                setattr(result, key, value)
+        return result
+
+    return construct
+
+
 def extend(mapper: Mapper) -> None:
     mapper.add_spec(sqlalchemy_spec_decide, spec_function)
+    mapper.add_constructor(
+        sqlalchemy_spec_decide, trusted_constructor_function, trusted=True
+    )
@@ -0,0 +1,32 @@
+from typing import Any, Callable, Dict, Iterable, Type
+
+from automapper import Mapper
+
+
+def typeddict_spec_decide(obj_type: Type[Any]) -> bool:
+    return (
+        isinstance(obj_type, type)
+        and issubclass(obj_type, dict)
+        and hasattr(obj_type, "__total__")
+        and hasattr(obj_type, "__annotations__")
+    )
+
+
+def spec_function(target_cls: Type[Dict[str, Any]]) -> Iterable[str]:
+    return target_cls.__annotations__.keys()
+
+
+def _return_mapped_values(mapped_values: Dict[str, Any]) -> Dict[str, Any]:
+    return mapped_values
+
+
+def constructor_function(
+    target_cls: Type[Dict[str, Any]],
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """TypedDict objects are plain dictionaries, so dictionary of mapped values is returned as is"""
+    return _return_mapped_values
+
+
+def extend(mapper: Mapper) -> None:
+    mapper.add_spec(typeddict_spec_decide, spec_function)
+    mapper.add_constructor(typeddict_spec_decide, constructor_function)
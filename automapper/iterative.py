@@ -0,0 +1,399 @@
+import time
+from typing import TYPE_CHECKING, Any, Dict, Generator, List, Optional, Set, Tuple, cast
+
+from .exceptions import CircularReferenceError
+from .plan import (
+    COPIED,
+    DICTIONARY,
+    HANDLED,
+    IMMEDIATE,
+    IMMEDIATE_TYPES,
+    MAPPED,
+    MISSING,
+    SEQUENCE,
+    MappingOptions,
+    MappingPlan,
+)
+from .references import ReferenceMemo, can_create_before_init
+
+if TYPE_CHECKING:
+    from .mapper import Mapper
+
+# Mapping of an object or a collection suspended on the stack: it yields child objects with their mapping options
+# and receives their mapped values, returns mapped object
+Task = Generator[Tuple[Any, MappingOptions], Any, Any]
+
+# Returned instead of mapped child object when a task for it was pushed on the stack
+_PUSHED: Any = object()
+# Returned by `_map_inline` for child objects that are mapped on the stack
+_DEFERRED: Any = object()
+
+
+class _Child:
+    """Child object collected from `MappingPlan.map_values`, it's mapped on the stack later"""
+
+    __slots__ = ("obj", "options")
+
+    def __init__(self, obj: Any, options: MappingOptions) -> None:
+        self.obj = obj
+        self.options = options
+
+
+class _ChildCollector:
+    """Stands for mapper in `MappingPlan.map_values`, so values of fields are read and copied by the plan.
+    Child objects that don't need the stack are mapped right away, others are collected.
+    """
+
+    __slots__ = ("_mapper", "_copier", "collected")
+
+    def __init__(self, mapper: "Mapper") -> None:
+        self._mapper = mapper
+        self._copier = mapper._copier
+        self.collected = 0
+
+    def _map_subobject(
+        self, obj: Any, _visited_stack: Set[int], options: MappingOptions
+    ) -> Any:
+        if type(obj) in IMMEDIATE_TYPES:
+            return obj
+        result = _map_inline(self._mapper, obj, options)
+        if result is _DEFERRED:
+            self.collected += 1
+            return _Child(obj, options)
+        return result
+
+
+def _map_inline(mapper: "Mapper", obj: Any, options: MappingOptions) -> Any:
+    """Maps child object that has no child objects to map on the stack: copied objects and collections
+    of primitive values. Returns `_DEFERRED` for other objects and for options that need the stack
+    """
+    if options.lazy or options.preserve_references:
+        # proxies and target objects of the mapping call are handled on the stack
+        return _DEFERRED
+    obj_type = type(obj)
+    kind = mapper._subobject_kinds.get(obj_type)
+    if kind is None:
+        kind = mapper._subobject_kind(obj_type)
+    if kind == IMMEDIATE:
+        return obj
+    if kind == MAPPED or kind == HANDLED:
+        return _DEFERRED
+    if options.share_immutable and mapper._copier.is_immutable(obj, mapper._mappings):
+        return obj
+    if kind == COPIED:
+        if mapper._hooks:
+            mapper._notify_deepcopy(obj_type)
+        return mapper._copier.copy(obj)
+    if kind == DICTIONARY:
+        if IMMEDIATE_TYPES.issuperset(map(type, obj.values())):
+            return obj_type(dict(obj))
+    elif IMMEDIATE_TYPES.issuperset(map(type, obj)):
+        return obj_type(list(obj))
+    return _DEFERRED
+
+
+def map_with_plan(
+    mapper: "Mapper",
+    plan: MappingPlan[Any],
+    obj: Any,
+    _visited_stack: Set[int],
+    custom_mapping: Any = None,
+) -> Any:
+    """Maps source object using mapping plan, child objects are mapped on explicit stack instead of recursive calls"""
+    if plan.options.preserve_references:
+        _visited_stack = ReferenceMemo.of(_visited_stack)
+    stack: List[Task] = []
+    if mapper._hooks:
+        stack.append(_observed_task(mapper, plan, obj, _visited_stack, custom_mapping))
+        return _run(mapper, stack, _visited_stack)
+    result = _map_plan(mapper, plan, obj, _visited_stack, stack, custom_mapping)
+    if result is _PUSHED:
+        return _run(mapper, stack, _visited_stack)
+    return result
+
+
+def map_subobject(
+    mapper: "Mapper", obj: Any, _visited_stack: Set[int], options: MappingOptions
+) -> Any:
+    """Maps child object right away, see `Mapper._map_subobject_now`"""
+    stack: List[Task] = []
+    result = _map_child_now(mapper, obj, _visited_stack, options, stack)
+    if result is _PUSHED:
+        return _run(mapper, stack, _visited_stack)
+    return result
+
+
+def _run(mapper: "Mapper", stack: List[Task], _visited_stack: Set[int]) -> Any:
+    """Resumes tasks on top of the stack until the bottom one returns mapped object"""
+    value = None
+    try:
+        while True:
+            try:
+                obj, options = stack[-1].send(value)
+            except StopIteration as stop:
+                stack.pop()
+                if not stack:
+                    return stop.value
+                value = stop.value
+                continue
+            value = _map_child(mapper, obj, _visited_stack, options, stack)
+            if value is _PUSHED:
+                value = None
+    except BaseException:
+        # suspended tasks are closed from the top, so hooks see mappings end in order
+        for task in reversed(stack):
+            task.close()
+        raise
+
+
+def _map_child(
+    mapper: "Mapper",
+    obj: Any,
+    _visited_stack: Set[int],
+    options: MappingOptions,
+    stack: List[Task],
+) -> Any:
+    """Returns mapped child object, or `_PUSHED` when the task mapping it was pushed on the stack"""
+    obj_type = type(obj)
+    kind = mapper._subobject_kinds.get(obj_type)
+    if kind is None:
+        kind = mapper._subobject_kind(obj_type)
+    if kind == IMMEDIATE:
+        return obj
+    if kind == MAPPED and not options.lazy:
+        # the most common child objects skip checks of other kinds
+        if id(obj) in _visited_stack:
+            raise CircularReferenceError()
+        plan: MappingPlan[Any] = mapper._get_plan(
+            obj_type, mapper._mappings[obj_type][0], options
+        )
+        return _push_plan(mapper, plan, obj, _visited_stack, stack)
+
+    if options.share_immutable and mapper._copier.is_immutable(obj, mapper._mappings):
+        return obj
+
+    if options.lazy:
+        return mapper._lazy_subobject(obj, _visited_stack, options)
+
+    return _map_child_now(mapper, obj, _visited_stack, options, stack)
+
+
+def _map_child_now(
+    mapper: "Mapper",
+    obj: Any,
+    _visited_stack: Set[int],
+    options: MappingOptions,
+    stack: List[Task],
+) -> Any:
+    if id(obj) in _visited_stack:
+        raise CircularReferenceError()
+
+    obj_type = type(obj)
+    kind = mapper._subobject_kind(obj_type)
+    if kind == MAPPED:
+        target_cls, _ = mapper._mappings[obj_type]
+        plan: MappingPlan[Any] = mapper._get_plan(obj_type, target_cls, options)
+        return _push_plan(mapper, plan, obj, _visited_stack, stack)
+
+    memo = None
+    if options.preserve_references:
+        memo = cast(ReferenceMemo, _visited_stack)
+        result = memo.get_mapped(obj)
+        if result is not MISSING:
+            return result
+
+    if kind == DICTIONARY or kind == SEQUENCE:
+        stack.append(_map_collection_task(mapper, obj, _visited_stack, options, memo))
+        return _PUSHED
+
+    if kind == HANDLED:
+        _visited_stack.add(id(obj))
+        result = mapper._handle_subobject(obj, _visited_stack, options)
+        _visited_stack.remove(id(obj))
+    else:
+        if mapper._hooks:
+            mapper._notify_deepcopy(obj_type)
+        result = mapper._copier.copy(obj)
+    if memo is not None:
+        memo.remember(obj, result)
+    return result
+
+
+def _push_plan(
+    mapper: "Mapper",
+    plan: MappingPlan[Any],
+    obj: Any,
+    _visited_stack: Set[int],
+    stack: List[Task],
+    custom_mapping: Any = None,
+) -> Any:
+    """Returns object mapped with plan, or `_PUSHED` when the task mapping it was pushed on the stack"""
+    if mapper._hooks:
+        stack.append(_observed_task(mapper, plan, obj, _visited_stack, custom_mapping))
+        return _PUSHED
+    return _map_plan(mapper, plan, obj, _visited_stack, stack, custom_mapping)
+
+
+def _map_plan(
+    mapper: "Mapper",
+    plan: MappingPlan[Any],
+    obj: Any,
+    _visited_stack: Set[int],
+    stack: List[Task],
+    custom_mapping: Any = None,
+    counts: Optional[List[int]] = None,
+) -> Any:
+    """Maps object with plan right away when its fields have no child objects to map on the stack,
+    otherwise pushes the task mapping them and returns `_PUSHED`.
+    Number of mapped values is appended to `counts` if it's given.
+    """
+    target_cls = plan.target_cls
+    memo = None
+    result = MISSING
+    if plan.options.preserve_references:
+        memo = cast(ReferenceMemo, _visited_stack)
+        result = memo.get_mapped(obj, target_cls)
+        if result is not MISSING:
+            return result
+        if plan.constructor is None and (
+            plan.initializer is not None or can_create_before_init(target_cls)
+        ):
+            # target object is created before its fields are mapped, so they can refer back to it
+            result = object.__new__(target_cls)
+            memo.remember(obj, result, target_cls)
+
+    obj_id = id(obj)
+    if obj_id in _visited_stack:
+        raise CircularReferenceError()
+
+    collector = _ChildCollector(mapper)
+    mapped_values = plan.map_values(
+        cast("Mapper", collector), obj, _visited_stack, custom_mapping
+    )
+    if counts is not None:
+        # child objects collected for the stack hold places of their values
+        counts.append(len(mapped_values))
+    if collector.collected:
+        children = [
+            field_name
+            for field_name, value in mapped_values.items()
+            if type(value) is _Child
+        ]
+        if result is MISSING:
+            _visited_stack.add(obj_id)
+        stack.append(
+            _map_plan_task(
+                plan, obj, _visited_stack, mapped_values, children, result, memo
+            )
+        )
+        return _PUSHED
+
+    if result is not MISSING:
+        plan.initialize(result, mapped_values)
+        return result
+    result = plan.construct(mapped_values)
+    if memo is not None:
+        memo.remember(obj, result, target_cls)
+    return result
+
+
+def _map_plan_task(
+    plan: MappingPlan[Any],
+    obj: Any,
+    _visited_stack: Set[int],
+    mapped_values: Dict[str, Any],
+    children: List[str],
+    result: Any,
+    memo: Any,
+) -> Task:
+    """Maps child objects collected from fields on the stack, then creates or initializes target object"""
+    for field_name in children:
+        child = mapped_values[field_name]
+        mapped_values[field_name] = yield child.obj, child.options
+
+    if result is not MISSING:
+        plan.initialize(result, mapped_values)
+        return result
+
+    _visited_stack.remove(id(obj))
+    result = plan.construct(mapped_values)
+    if memo is not None:
+        memo.remember(obj, result, plan.target_cls)
+    return result
+
+
+def _observed_task(
+    mapper: "Mapper",
+    plan: MappingPlan[Any],
+    obj: Any,
+    _visited_stack: Set[int],
+    custom_mapping: Any = None,
+) -> Task:
+    """Maps object with plan between notifications of hooks, its time includes time of child tasks"""
+    hooks = mapper._hooks
+    source_cls, target_cls = plan.source_cls, plan.target_cls
+    for hook in hooks:
+        hook.on_map_start(source_cls, target_cls)
+    # numbers of mapped values, objects already mapped in this call have none
+    counts: List[int] = []
+    failed = True
+    start = time.perf_counter()
+    try:
+        stack: List[Task] = []
+        result = _map_plan(
+            mapper, plan, obj, _visited_stack, stack, custom_mapping, counts
+        )
+        if result is _PUSHED:
+            result = yield from stack[0]
+        failed = False
+        return result
+    finally:
+        elapsed = time.perf_counter() - start
+        fields_count = counts[0] if counts and not failed else 0
+        for hook in hooks:
+            hook.on_map_end(source_cls, target_cls, fields_count, elapsed, failed)
+
+
+def _map_collection_task(
+    mapper: "Mapper",
+    obj: Any,
+    _visited_stack: Set[int],
+    options: MappingOptions,
+    memo: Any = None,
+) -> Task:
+    obj_type = type(obj)
+    if memo is not None and (obj_type is list or obj_type is dict):
+        # builtin collections are created before their items are mapped, so they can contain themselves
+        result = obj_type()
+        memo.remember(obj, result)
+        if obj_type is dict:
+            for k, v in obj.items():
+                result[k] = v if type(v) in IMMEDIATE_TYPES else (yield v, options)
+        else:
+            for x in obj:
+                result.append(x if type(x) in IMMEDIATE_TYPES else (yield x, options))
+        return result
+
+    obj_id = id(obj)
+    _visited_stack.add(obj_id)
+    if issubclass(obj_type, dict):
+        items: Dict[Any, Any] = {}
+        for k, v in obj.items():
+            if type(v) not in IMMEDIATE_TYPES:
+                value = _map_inline(mapper, v, options)
+                v = (yield v, options) if value is _DEFERRED else value
+            items[k] = v
+        result = obj_type(items)
+    else:
+        values: List[Any] = []
+        for x in obj:
+            if type(x) not in IMMEDIATE_TYPES:
+                value = _map_inline(mapper, x, options)
+                x = (yield x, options) if value is _DEFERRED else value
+            values.append(x)
+        result = obj_type(values)
+    _visited_stack.remove(obj_id)
+
+    if memo is not None:
+        memo.remember(obj, result)
+    return result
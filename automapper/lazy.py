@@ -0,0 +1,195 @@
+import operator
+from typing import Any, Callable, Iterator
+
+_NOT_MAPPED: Any = object()
+
+
+def _forward(operation: Callable[..., Any]) -> Callable[..., Any]:
+    """Creates proxy method applying operation to mapped object"""
+
+    def method(self: Any, *args: Any) -> Any:
+        return operation(self.__wrapped__, *args)
+
+    return method
+
+
+def _reflect(operation: Callable[[Any, Any], Any]) -> Callable[[Any, Any], Any]:
+    """Creates reflected proxy method, e.g. `__radd__`, applying operation with mapped object on the right"""
+
+    def method(self: Any, other: Any) -> Any:
+        return operation(other, self.__wrapped__)
+
+    return method
+
+
+def _inplace(operation: Callable[[Any, Any], Any]) -> Callable[[Any, Any], Any]:
+    """Creates in-place proxy method, e.g. `__iadd__`. Proxy stays in place of mutable objects changed in place,
+    result of operation replaces it otherwise (e.g. for `+=` on tuples)
+    """
+
+    def method(self: Any, other: Any) -> Any:
+        target = self.__wrapped__
+        result = operation(target, other)
+        return self if result is target else result
+
+    return method
+
+
+class LazyProxy:
+    """Proxy of a child object that is mapped on first access.
+    Mapped object is memoized, all operations with proxy are forwarded to it.
+    `isinstance` checks and `type(proxy)` differ: `isinstance(proxy, TargetClass)` maps object and returns True,
+    while `type(proxy)` is always `LazyProxy`.
+    """
+
+    __slots__ = ("_LazyProxy__factory", "_LazyProxy__target")
+
+    def __init__(self, factory: Callable[[], Any]) -> None:
+        object.__setattr__(self, "_LazyProxy__factory", factory)
+        object.__setattr__(self, "_LazyProxy__target", _NOT_MAPPED)
+
+    @property
+    def __wrapped__(self) -> Any:
+        """Mapped object, it's mapped on first access"""
+        target = self.__target
+        if target is _NOT_MAPPED:
+            target = self.__factory()
+            object.__setattr__(self, "_LazyProxy__target", target)
+            # factory holds references to source object, it's not needed anymore
+            object.__setattr__(self, "_LazyProxy__factory", None)
+        return target
+
+    @property  # type: ignore [misc]
+    def __class__(self) -> Any:
+        return type(self.__wrapped__)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.__wrapped__, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self.__wrapped__, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        delattr(self.__wrapped__, name)
+
+    def __getitem__(self, key: Any) -> Any:
+        return self.__wrapped__[key]
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self.__wrapped__[key] = value
+
+    def __delitem__(self, key: Any) -> None:
+        del self.__wrapped__[key]
+
+    def __iter__(self) -> Iterator[Any]:
+        return iter(self.__wrapped__)
+
+    def __reversed__(self) -> Iterator[Any]:
+        return reversed(self.__wrapped__)
+
+    def __len__(self) -> int:
+        return len(self.__wrapped__)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self.__wrapped__
+
+    def __bool__(self) -> bool:
+        return bool(self.__wrapped__)
+
+    def __eq__(self, other: Any) -> bool:
+        return bool(self.__wrapped__ == other)
+
+    def __ne__(self, other: Any) -> bool:
+        return bool(self.__wrapped__ != other)
+
+    def __lt__(self, other: Any) -> bool:
+        return bool(self.__wrapped__ < other)
+
+    def __le__(self, other: Any) -> bool:
+        return bool(self.__wrapped__ <= other)
+
+    def __gt__(self, other: Any) -> bool:
+        return bool(self.__wrapped__ > other)
+
+    def __ge__(self, other: Any) -> bool:
+        return bool(self.__wrapped__ >= other)
+
+    def __hash__(self) -> int:
+        return hash(self.__wrapped__)
+
+    def __repr__(self) -> str:
+        return repr(self.__wrapped__)
+
+    def __str__(self) -> str:
+        return str(self.__wrapped__)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        return self.__wrapped__(*args, **kwargs)
+
+    def __format__(self, format_spec: str) -> str:
+        return format(self.__wrapped__, format_spec)
+
+    # numeric and sequence operations
+    __add__ = _forward(operator.add)
+    __sub__ = _forward(operator.sub)
+    __mul__ = _forward(operator.mul)
+    __matmul__ = _forward(operator.matmul)
+    __truediv__ = _forward(operator.truediv)
+    __floordiv__ = _forward(operator.floordiv)
+    __mod__ = _forward(operator.mod)
+    __divmod__ = _forward(divmod)
+    __pow__ = _forward(pow)
+    __lshift__ = _forward(operator.lshift)
+    __rshift__ = _forward(operator.rshift)
+    __and__ = _forward(operator.and_)
+    __or__ = _forward(operator.or_)
+    __xor__ = _forward(operator.xor)
+    __radd__ = _reflect(operator.add)
+    __rsub__ = _reflect(operator.sub)
+    __rmul__ = _reflect(operator.mul)
+    __rmatmul__ = _reflect(operator.matmul)
+    __rtruediv__ = _reflect(operator.truediv)
+    __rfloordiv__ = _reflect(operator.floordiv)
+    __rmod__ = _reflect(operator.mod)
+    __rdivmod__ = _reflect(divmod)
+    __rpow__ = _reflect(pow)
+    __rlshift__ = _reflect(operator.lshift)
+    __rrshift__ = _reflect(operator.rshift)
+    __rand__ = _reflect(operator.and_)
+    __ror__ = _reflect(operator.or_)
+    __rxor__ = _reflect(operator.xor)
+    __iadd__ = _inplace(operator.iadd)
+    __isub__ = _inplace(operator.isub)
+    __imul__ = _inplace(operator.imul)
+    __imatmul__ = _inplace(operator.imatmul)
+    __itruediv__ = _inplace(operator.itruediv)
+    __ifloordiv__ = _inplace(operator.ifloordiv)
+    __imod__ = _inplace(operator.imod)
+    __ipow__ = _inplace(operator.ipow)
+    __ilshift__ = _inplace(operator.ilshift)
+    __irshift__ = _inplace(operator.irshift)
+    __iand__ = _inplace(operator.iand)
+    __ior__ = _inplace(operator.ior)
+    __ixor__ = _inplace(operator.ixor)
+    __neg__ = _forward(operator.neg)
+    __pos__ = _forward(operator.pos)
+    __abs__ = _forward(abs)
+    __invert__ = _forward(operator.invert)
+    __int__ = _forward(int)
+    __float__ = _forward(float)
+    __complex__ = _forward(complex)
+    __index__ = _forward(operator.index)
+    __round__ = _forward(round)
+
+    def __reduce_ex__(self, protocol: Any) -> Any:
+        # mapped object is pickled and copied instead of proxy
+        return self.__wrapped__.__reduce_ex__(protocol)
+
+
+def unwrap(obj: Any) -> Any:
+    """Returns mapped object of lazy proxy, other objects are returned as is.
+    It can be used as `default` function of `json.dumps` to encode proxies of lists and dictionaries.
+    """
+    if type(obj) is LazyProxy:
+        return obj.__wrapped__
+    return obj
@@ -1,11 +1,25 @@
+import importlib
 import inspect
-from copy import deepcopy
+import logging
+import sys
+import time
+from abc import ABCMeta
+from collections.abc import Sequence
+from concurrent.futures import Executor
+from enum import Enum
+from functools import partial
 from typing import (
     Any,
+    AsyncIterable,
+    AsyncIterator,
     Callable,
     Dict,
+    FrozenSet,
     Generic,
     Iterable,
+    Iterator,
+    List,
+    Literal,
     Optional,
     Set,
     Tuple,
@@ -16,31 +30,51 @@ from typing import (
     overload,
 )
 
+from . import iterative
+from .codegen import compile_plan
+from .columnar import ColumnBatch, Columns, map_column_batch, map_columns
+from .copier import Copier, CopyFunction
 from .exceptions import (
     CircularReferenceError,
     DuplicatedRegistrationError,
     MappingError,
 )
-from .utils import is_dictionary, is_enum, is_primitive, is_sequence, object_contains
+from .lazy import LazyProxy
+from .metrics import MappingHook
+from .parallel import DEFAULT_CHUNK_SIZE, map_parallel
+from .plan import (
+    COPIED,
+    COPY_POLICIES,
+    DEFAULT_OPTIONS,
+    DICTIONARY,
+    HANDLED,
+    IMMEDIATE,
+    IMMEDIATE_TYPES,
+    MAPPED,
+    MISSING,
+    SEQUENCE,
+    CopyPolicy,
+    FieldSource,
+    MappingOptions,
+    MappingPlan,
+    compile_fields_mapping,
+)
+from .references import ReferenceMemo, can_create_before_init
+from .streaming import DEFAULT_ASYNC_CHUNK_SIZE, amap_many
+from .trusted import object_initializer
+
+log = logging.getLogger("automapper")
 
 # Custom Types
 S = TypeVar("S")
 T = TypeVar("T")
 ClassifierFunction = Callable[[Type[T]], bool]
 SpecFunction = Callable[[Type[T]], Iterable[str]]
+ConstructorFunction = Callable[[Type[T]], Callable[[Dict[str, Any]], T]]
 FieldsMap = Optional[Dict[str, Any]]
-
-
-def _try_get_field_value(
-    field_name: str, original_obj: Any, custom_mapping: FieldsMap
-) -> Tuple[bool, Any]:
-    if field_name in (custom_mapping or {}):
-        return True, custom_mapping[field_name]  # type: ignore [index]
-    if hasattr(original_obj, field_name):
-        return True, getattr(original_obj, field_name)
-    if object_contains(original_obj, field_name):
-        return True, original_obj[field_name]
-    return False, None
+# Maps child object: receives the object and a function that maps its own child objects with the same options
+SubobjectHandler = Callable[[Any, Callable[[Any], Any]], Any]
+PlanKey = Tuple[type, type, MappingOptions]
 
 
 class MappingWrapper(Generic[T]):
@@ -62,6 +96,9 @@ class MappingWrapper(Generic[T]):
         skip_none_values: bool = False,
         fields_mapping: FieldsMap = None,
         use_deepcopy: bool = True,
+        share_immutable: bool = False,
+        lazy: bool = False,
+        preserve_references: bool = False,
     ) -> T:
         """Produces output object mapped from source object and custom arguments.
 
@@ -69,12 +106,20 @@ class MappingWrapper(Generic[T]):
             obj (S): _description_
             skip_none_values (bool, optional): Skip None values when creating `target class` obj. Defaults to False.
             fields_mapping (FieldsMap, optional): Custom mapping.
-                Specify dictionary in format {"field_name": value_object}. Defaults to None.
+                Specify dictionary in format {"field_name": value_object}.
+                Functions (e.g. `lambda source: ...`) are called with source object. Defaults to None.
             use_deepcopy (bool, optional): Apply deepcopy to all child objects when copy from source to target object.
                 Defaults to True.
+            share_immutable (bool, optional): Share deeply immutable child objects (e.g. tuples, frozensets
+                and frozen dataclasses of immutable values) between source and target objects instead of copying them.
+                Defaults to False.
+            lazy (bool, optional): Map child objects on first access instead of mapping them right away.
+                Child objects are replaced with proxies that map and memoize them. Defaults to False.
+            preserve_references (bool, optional): Map every source object once per mapping call and reuse its
+                target object for next references to it, circular references are supported. Defaults to False.
 
         Raises:
-            CircularReferenceError: Circular references in `source class` object are not allowed yet.
+            CircularReferenceError: Circular references in `source class` object without `preserve_references`.
 
         Returns:
             T: instance of `target class` with mapped values from `source class` or custom `fields_mapping` dictionary.
@@ -86,17 +131,351 @@ class MappingWrapper(Generic[T]):
             skip_none_values=skip_none_values,
             custom_mapping=fields_mapping,
             use_deepcopy=use_deepcopy,
+            share_immutable=share_immutable,
+            lazy=lazy,
+            preserve_references=preserve_references,
+        )
+
+    @overload
+    def map_many(
+        self,
+        objs: Iterable[S],
+        *,
+        skip_none_values: bool = False,
+        fields_mapping: FieldsMap = None,
+        use_deepcopy: bool = True,
+        share_immutable: bool = False,
+        lazy: bool = False,
+        preserve_references: bool = False,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        ordered: bool = True,
+        as_list: Literal[False] = False,
+    ) -> Iterator[T]: ...
+
+    @overload
+    def map_many(
+        self,
+        objs: Iterable[S],
+        *,
+        skip_none_values: bool = False,
+        fields_mapping: FieldsMap = None,
+        use_deepcopy: bool = True,
+        share_immutable: bool = False,
+        lazy: bool = False,
+        preserve_references: bool = False,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        ordered: bool = True,
+        as_list: Literal[True],
+    ) -> List[T]: ...
+
+    def map_many(
+        self,
+        objs: Iterable[S],
+        *,
+        skip_none_values: bool = False,
+        fields_mapping: FieldsMap = None,
+        use_deepcopy: bool = True,
+        share_immutable: bool = False,
+        lazy: bool = False,
+        preserve_references: bool = False,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        ordered: bool = True,
+        as_list: bool = False,
+    ) -> Union[Iterator[T], List[T]]:
+        """Produces output objects mapped from batch of source objects.
+        Mapping plan is resolved once per distinct `source class` in the batch.
+
+        Args:
+            objs (Iterable[S]): Source objects to map. Consumed lazily unless `as_list` is True.
+                Records of `automapper.columnar.ColumnBatch` are mapped from columns without row objects.
+            skip_none_values (bool, optional): Skip None values when creating `target class` obj. Defaults to False.
+            fields_mapping (FieldsMap, optional): Custom mapping applied to every object.
+                Specify dictionary in format {"field_name": value_object}.
+                Functions (e.g. `lambda source: ...`) are called with source object. Defaults to None.
+            use_deepcopy (bool, optional): Apply deepcopy to all child objects when copy from source to target object.
+                Defaults to True.
+            share_immutable (bool, optional): Share deeply immutable child objects (e.g. tuples, frozensets
+                and frozen dataclasses of immutable values) between source and target objects instead of copying them.
+                Defaults to False.
+            lazy (bool, optional): Map child objects on first access instead of mapping them right away.
+                Child objects are replaced with proxies that map and memoize them. Defaults to False.
+            preserve_references (bool, optional): Map every source object once per mapping call and reuse its
+                target object for next references to it, circular references are supported. Defaults to False.
+            workers (int, optional): Map chunks of objects on a pool of this many processes.
+                Mapper and its mapping plans are sent to each process once. Defaults to None (map in current thread).
+            executor (Executor, optional): Map chunks of objects on provided `concurrent.futures` executor.
+                Mapper is sent with every chunk, so prefer `workers` over own process pool. Defaults to None.
+            chunk_size (int, optional): Number of objects in a chunk for `workers` and `executor`. Defaults to 1000.
+            ordered (bool, optional): Keep results of parallel mapping in the order of source objects.
+                Otherwise, chunks are returned as soon as they are mapped. Defaults to True.
+            as_list (bool, optional): Map all objects right away and return a list instead of generator.
+                Defaults to False.
+
+        Raises:
+            CircularReferenceError: Circular references in `source class` object without `preserve_references`.
+
+        Returns:
+            Iterator[T] | List[T]: instances of `target class` in the same order as source objects.
+        """
+        results = self.__mapper._map_batch(
+            objs,
+            self.__target_cls,
+            dict(
+                skip_none_values=skip_none_values,
+                custom_mapping=fields_mapping,
+                use_deepcopy=use_deepcopy,
+                share_immutable=share_immutable,
+                lazy=lazy,
+                preserve_references=preserve_references,
+            ),
+            workers=workers,
+            executor=executor,
+            chunk_size=chunk_size,
+            ordered=ordered,
+        )
+        return list(results) if as_list else results
+
+    @overload
+    def map_columns(
+        self,
+        objs: Iterable[S],
+        *,
+        skip_none_values: bool = False,
+        fields_mapping: FieldsMap = None,
+        use_deepcopy: bool = True,
+        share_immutable: bool = False,
+        typecodes: Optional[Dict[str, str]] = None,
+        as_numpy: Literal[False] = False,
+    ) -> Columns: ...
+
+    @overload
+    def map_columns(
+        self,
+        objs: Iterable[S],
+        *,
+        skip_none_values: bool = False,
+        fields_mapping: FieldsMap = None,
+        use_deepcopy: bool = True,
+        share_immutable: bool = False,
+        typecodes: Optional[Dict[str, str]] = None,
+        as_numpy: Literal[True],
+    ) -> Any: ...
+
+    def map_columns(
+        self,
+        objs: Iterable[S],
+        *,
+        skip_none_values: bool = False,
+        fields_mapping: FieldsMap = None,
+        use_deepcopy: bool = True,
+        share_immutable: bool = False,
+        typecodes: Optional[Dict[str, str]] = None,
+        as_numpy: bool = False,
+    ) -> Union[Columns, Any]:
+        """Maps batch of source objects into columns of `target class` fields without creating `target class`
+        objects. Fields are resolved by spec functions, same as for objects.
+        Every column is a list, `array.array` for fields with typecode, or a field of NumPy structured array.
+        Fields missing in source object get default values of `__init__` arguments or None.
+
+        Args:
+            objs (Iterable[S]): Source objects to map.
+            skip_none_values (bool, optional): Use default values of fields instead of None values. Defaults to False.
+            fields_mapping (FieldsMap, optional): Custom mapping applied to every object.
+                Specify dictionary in format {"field_name": value_object}.
+                Functions (e.g. `lambda source: ...`) are called with source object. Defaults to None.
+            use_deepcopy (bool, optional): Apply deepcopy to all child objects when copy from source to target object.
+                Defaults to True.
+            share_immutable (bool, optional): Share deeply immutable child objects (e.g. tuples, frozensets
+                and frozen dataclasses of immutable values) between source and target objects instead of copying them.
+                Defaults to False.
+            typecodes (Dict[str, str], optional): `array.array` typecode per field, e.g. {"age": "i"}.
+                In NumPy structured array it's the dtype of the field. Defaults to None (lists, inferred dtypes).
+            as_numpy (bool, optional): Return NumPy structured array with a named field per column.
+                Requires NumPy to be installed. Defaults to False.
+
+        Raises:
+            CircularReferenceError: Circular references in `source class` object.
+            ValueError: Typecode is set for unknown field.
+
+        Returns:
+            Dict[str, MutableSequence[Any]] | numpy.ndarray: values of every `target class` field
+                in the order of source objects.
+        """
+        return map_columns(
+            self.__mapper,
+            objs,
+            self.__target_cls,
+            dict(
+                skip_none_values=skip_none_values,
+                custom_mapping=fields_mapping,
+                use_deepcopy=use_deepcopy,
+                share_immutable=share_immutable,
+            ),
+            typecodes,
+            as_numpy,
+        )
+
+    def amap_many(
+        self,
+        objs: Union[AsyncIterable[S], Iterable[S]],
+        *,
+        skip_none_values: bool = False,
+        fields_mapping: FieldsMap = None,
+        use_deepcopy: bool = True,
+        share_immutable: bool = False,
+        lazy: bool = False,
+        preserve_references: bool = False,
+        chunk_size: int = DEFAULT_ASYNC_CHUNK_SIZE,
+    ) -> AsyncIterator[T]:
+        """Produces output objects mapped from async stream of source objects.
+        Objects are mapped in chunks, control is given back to event loop after each chunk.
+        Use it with `async for` statement.
+
+        Args:
+            objs (AsyncIterable[S] | Iterable[S]): Source objects to map.
+            skip_none_values (bool, optional): Skip None values when creating `target class` obj. Defaults to False.
+            fields_mapping (FieldsMap, optional): Custom mapping applied to every object.
+                Specify dictionary in format {"field_name": value_object}.
+                Functions (e.g. `lambda source: ...`) are called with source object. Defaults to None.
+            use_deepcopy (bool, optional): Apply deepcopy to all child objects when copy from source to target object.
+                Defaults to True.
+            share_immutable (bool, optional): Share deeply immutable child objects (e.g. tuples, frozensets
+                and frozen dataclasses of immutable values) between source and target objects instead of copying them.
+                Defaults to False.
+            lazy (bool, optional): Map child objects on first access instead of mapping them right away.
+                Child objects are replaced with proxies that map and memoize them. Defaults to False.
+            preserve_references (bool, optional): Map every source object once per mapping call and reuse its
+                target object for next references to it, circular references are supported. Defaults to False.
+            chunk_size (int, optional): Number of objects mapped before giving control to event loop. Defaults to 500.
+
+        Raises:
+            CircularReferenceError: Circular references in `source class` object without `preserve_references`.
+
+        Returns:
+            AsyncIterator[T]: instances of `target class` in the same order as source objects.
+        """
+        return amap_many(
+            self.__mapper,
+            objs,
+            self.__target_cls,
+            dict(
+                skip_none_values=skip_none_values,
+                custom_mapping=fields_mapping,
+                use_deepcopy=use_deepcopy,
+                share_immutable=share_immutable,
+                lazy=lazy,
+                preserve_references=preserve_references,
+            ),
+            chunk_size,
         )
 
 
 class Mapper:
-    def __init__(self) -> None:
-        """Initializes internal containers"""
+    def __init__(self, *, codegen: bool = False, iterative: bool = False) -> None:
+        """Initializes internal containers
+
+        Args:
+            codegen (bool, optional): Generate and compile specialized function for every mapping plan
+                instead of copying fields in a generic loop. Defaults to False.
+            iterative (bool, optional): Map child objects on explicit stack instead of recursive calls,
+                so object graphs of any depth can be mapped. Compiled functions are not used by this engine.
+                Defaults to False.
+        """
+        self._codegen = codegen
+        self._iterative = iterative
         self._mappings: Dict[Type[S], Tuple[T, FieldsMap]] = {}  # type: ignore [valid-type]
         self._class_specs: Dict[Type[T], SpecFunction[T]] = {}  # type: ignore [valid-type]
         self._classifier_specs: Dict[  # type: ignore [valid-type]
             ClassifierFunction[T], SpecFunction[T]
         ] = {}
+        self._class_constructors: Dict[Type[T], ConstructorFunction[T]] = {}  # type: ignore [valid-type]
+        self._classifier_constructors: Dict[  # type: ignore [valid-type]
+            ClassifierFunction[T], ConstructorFunction[T]
+        ] = {}
+        # constructor functions used by trusted mappings, they don't validate mapped values
+        self._class_trusted_constructors: Dict[Type[T], ConstructorFunction[T]] = {}  # type: ignore [valid-type]
+        self._classifier_trusted_constructors: Dict[  # type: ignore [valid-type]
+            ClassifierFunction[T], ConstructorFunction[T]
+        ] = {}
+        # extension modules that are loaded when required modules are imported
+        self._lazy_extensions: Dict[str, str] = {}
+        # fields returned by spec functions for target classes
+        self._fields: Dict[type, Tuple[str, ...]] = {}
+        self._copy_policies: Dict[type, Dict[str, CopyPolicy]] = {}
+        # source classes which mappings create target objects without calling `__init__`
+        self._trusted: Set[type] = set()
+        # fields mappings registered with `add`, parsed once
+        self._fields_mappings: Dict[type, Dict[str, FieldSource]] = {}
+        self._plans: Dict[PlanKey, MappingPlan[Any]] = {}
+        self._handlers: Dict[type, SubobjectHandler] = {}
+        # kinds of child objects per type: immediate, mapped, handled, dictionary, sequence or copied
+        self._subobject_kinds: Dict[type, int] = {}
+        self._copier = Copier()
+        # instrumentation hooks, mapping calls are not measured while there are none
+        self._hooks: Tuple[MappingHook, ...] = ()
+        # names of containers shared with derived or parent mappers, each is copied before it's changed
+        self._shared: FrozenSet[str] = frozenset()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # hooks collect metrics of this process, they are not sent to worker processes
+        state = self.__dict__.copy()
+        state["_hooks"] = ()
+        # kinds are cached for types of mapped values, some builtin types can't be pickled
+        state["_subobject_kinds"] = {}
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        for plan in self._plans.values():
+            plan.constructor, plan.initializer = self._get_construction(
+                plan.source_cls,
+                plan.target_cls,
+                tuple(field_name for field_name, _ in plan.fields),
+            )
+            if self._codegen:
+                plan.function, plan.source = compile_plan(plan)
+
+    def derive(self) -> "Mapper":
+        """Creates a mapper with the same registrations, extensions and warmed caches.
+        Derived mapper shares containers with this mapper until either of them adds a registration,
+        then that mapper copies only the containers the registration changes. So deriving is cheap
+        and registrations of derived mapper don't affect this mapper and vice versa.
+
+        Returns:
+            Mapper: new mapper to customize with `add(..., override=True)`, `add_spec`, etc.
+        """
+        derived = Mapper.__new__(type(self))
+        derived.__dict__.update(self.__dict__)
+        self._shared = derived._shared = frozenset(
+            name
+            for name, value in self.__dict__.items()
+            if isinstance(value, (dict, set, Copier))
+        )
+        return derived
+
+    def _own(self, *names: str) -> None:
+        """Copies containers shared with derived or parent mappers before they are changed"""
+        if not self._shared:
+            return
+        for name in self._shared.intersection(names):
+            value = getattr(self, name)
+            setattr(self, name, value.clone() if name == "_copier" else value.copy())
+        self._shared = self._shared.difference(names)
+
+    def _clear(self, *names: str) -> None:
+        """Clears cache containers, shared ones are replaced with empty containers instead of being copied"""
+        for name in names:
+            if name in self._shared:
+                setattr(self, name, {})
+            else:
+                getattr(self, name).clear()
+        self._shared = self._shared.difference(names)
 
     @overload
     def add_spec(self, classifier: Type[T], spec_func: SpecFunction[T]) -> None:
@@ -131,22 +510,153 @@ class Mapper:
                 raise DuplicatedRegistrationError(
                     f"Spec function for base class: {classifier} was already added"
                 )
+            self._own("_class_specs")
             self._class_specs[cast(Type[T], classifier)] = spec_func
+            self._clear("_fields")
+            self._drop_plans(lambda key: issubclass(key[1], cast(Type[T], classifier)))
         elif callable(classifier):
             if classifier in self._classifier_specs:
                 raise DuplicatedRegistrationError(
                     f"Spec function for classifier {classifier} was already added"
                 )
+            self._own("_classifier_specs")
             self._classifier_specs[cast(ClassifierFunction[T], classifier)] = spec_func
+            self._clear("_fields")
+            self._drop_plans(
+                lambda key: bool(cast(ClassifierFunction[T], classifier)(key[1]))
+            )
+        else:
+            raise ValueError("Incorrect type of the classifier argument")
+
+    def add_constructor(
+        self,
+        classifier: Union[Type[T], ClassifierFunction[T]],
+        constructor_func: ConstructorFunction[T],
+        trusted: bool = False,
+    ) -> None:
+        """Add a constructor function for all classes inherited from base class or identified by classifier function.
+        Use it when objects of `target class` can be created faster than by calling the class with keyword arguments.
+
+        Args:
+            classifier (Type[T] | ClassifierFunction[T]): base class or boolean predicate that identifies
+                a group of classes.
+            constructor_func (ConstructorFunction[T]): receives `target class` and returns function that creates
+                its object from dictionary of mapped values. It's called once per mapping plan.
+            trusted (bool, optional): Use constructor function only for mappings added with `trusted=True`,
+                it can skip validation of mapped values. Defaults to False.
+
+        Raises:
+            DuplicatedRegistrationError: Constructor function for the same classifier was already added.
+        """
+        # containers are selected after they are copied from mapper they are shared with
+        if trusted:
+            self._own("_class_trusted_constructors", "_classifier_trusted_constructors")
+            class_constructors = self._class_trusted_constructors
+            classifier_constructors = self._classifier_trusted_constructors
+        else:
+            self._own("_class_constructors", "_classifier_constructors")
+            class_constructors = self._class_constructors
+            classifier_constructors = self._classifier_constructors
+
+        if inspect.isclass(classifier):
+            if classifier in class_constructors:
+                raise DuplicatedRegistrationError(
+                    f"Constructor function for base class: {classifier} was already added"
+                )
+            class_constructors[cast(Type[T], classifier)] = constructor_func
+            self._drop_plans(lambda key: issubclass(key[1], cast(Type[T], classifier)))
+        elif callable(classifier):
+            if classifier in classifier_constructors:
+                raise DuplicatedRegistrationError(
+                    f"Constructor function for classifier {classifier} was already added"
+                )
+            classifier_constructors[cast(ClassifierFunction[T], classifier)] = (
+                constructor_func
+            )
+            self._drop_plans(
+                lambda key: bool(cast(ClassifierFunction[T], classifier)(key[1]))
+            )
         else:
             raise ValueError("Incorrect type of the classifier argument")
 
+    def add_lazy_extension(self, required_module: str, extension_module: str) -> None:
+        """Add an extension that is loaded only when `required_module` is imported by application.
+        Extension is checked next time spec of a new target class is resolved, so heavy libraries
+        are not imported by mapper itself.
+
+        Args:
+            required_module (str): name of the module that classes supported by extension come from, e.g. "pydantic".
+            extension_module (str): name of the module with `extend(mapper)` function that adds spec functions.
+        """
+        self._own("_lazy_extensions")
+        self._lazy_extensions[extension_module] = required_module
+
+    def add_copier(self, cls: Type[T], copy_func: CopyFunction[T]) -> None:
+        """Add a fast copy function for objects of `cls` type, that are not mapped to other classes.
+        By default, such objects are copied with `copy.deepcopy` unless they are immutable,
+        builtin collections or dataclasses.
+
+        Args:
+            cls (Type[T]): exact type of objects to copy with `copy_func`.
+            copy_func (CopyFunction[T]): receives object and memo dictionary (or None), same as `copy.deepcopy`,
+                and returns a copy of the object.
+        """
+        self._own("_copier")
+        self._copier.register(cls, copy_func)
+
+    def add_handler(self, cls: Type[T], handler: SubobjectHandler) -> None:
+        """Add a function that maps child objects of `cls` type and its subclasses, that are not mapped
+        to other classes. Use it for custom containers or objects that should be rebuilt instead of copied.
+
+        Args:
+            cls (Type[T]): base class of objects to map with `handler`.
+            handler (SubobjectHandler): receives object and function that maps its child objects
+                with options of mapping call, returns mapped object.
+        """
+        self._own("_handlers")
+        self._handlers[cls] = handler
+        self._clear("_subobject_kinds")
+
+    def add_hook(self, hook: MappingHook) -> None:
+        """Adds instrumentation hook, e.g. `MetricsCollector`, that is notified about mapping calls,
+        mapping plan cache lookups and child objects copied with `copy.deepcopy`.
+        Mappings are measured only while mapper has hooks.
+
+        Args:
+            hook (MappingHook): hook to notify, added once.
+        """
+        if hook not in self._hooks:
+            self._hooks = (*self._hooks, hook)
+
+    def remove_hook(self, hook: MappingHook) -> None:
+        """Removes instrumentation hook added with `add_hook`
+
+        Args:
+            hook (MappingHook): hook to remove.
+
+        Raises:
+            ValueError: Hook was not added.
+        """
+        if hook not in self._hooks:
+            raise ValueError(f"Hook {hook} was not added")
+        self._hooks = tuple(added for added in self._hooks if added is not hook)
+
+    def clear_caches(self) -> None:
+        """Clears cached fields of target classes, mapping plans and copy functions.
+        Call it when classes are changed or created dynamically after they were mapped.
+        """
+        self._clear("_fields", "_plans", "_subobject_kinds")
+        self._own("_copier")
+        self._copier.clear_caches()
+
     def add(
         self,
         source_cls: Type[S],
         target_cls: Type[T],
         override: bool = False,
         fields_mapping: FieldsMap = None,
+        copy_policies: Optional[Dict[str, CopyPolicy]] = None,
+        trusted: bool = False,
     ) -> None:
         """Adds mapping between object of `source class` to an object of `target class`.
 
@@ -156,19 +666,65 @@ class Mapper:
             override (bool, optional): Override existing `source class` mapping to use new `target class`.
                 Defaults to False.
             fields_mapping (FieldsMap, optional): Custom mapping.
-                Specify dictionary in format {"field_name": value_object}. Defaults to None.
+                Specify dictionary in format {"field_name": value_object}. Values like "SourceClass.field"
+                or "SourceClass.field.nested_field" are read from source object, functions (e.g. `lambda source: ...`)
+                are called with source object when target field is mapped. Defaults to None.
+            copy_policies (Dict[str, CopyPolicy], optional): The way values of `target class` fields are copied.
+                Specify dictionary in format {"field_name": "reference" | "shallow" | "deep" | "map"}.
+                Fields with a copy policy ignore `use_deepcopy` argument, other fields follow it. Defaults to None.
+            trusted (bool, optional): Create `target class` objects without calling `__init__`, for source objects
+                which data is already valid. Mapped values are stored in `__dict__` and slots of objects created
+                with `object.__new__`, or passed to trusted constructor functions like `model_construct`
+                of pydantic models. Validation and `__post_init__` are skipped. Defaults to False.
 
         Raises:
             DuplicatedRegistrationError: Same mapping for `source class` was added.
             Only one mapping per source class can exist at a time for now.
             You can specify target class manually using `mapper.to(target_cls)` method
             or use `override` argument to replace existing mapping.
+            ValueError: Unknown copy policy.
+            MappingError: Copy policy is set for a field that `target class` doesn't have.
         """
         if source_cls in self._mappings and not override:
             raise DuplicatedRegistrationError(
                 f"source_cls {source_cls} was already added for mapping"
             )
+        for field_name, copy_policy in (copy_policies or {}).items():
+            if copy_policy not in COPY_POLICIES:
+                raise ValueError(
+                    f"Unknown copy policy {copy_policy!r} of field {field_name!r}"
+                )
+        if copy_policies:
+            unknown_fields = set(copy_policies).difference(self._get_fields(target_cls))
+            if unknown_fields:
+                raise MappingError(
+                    f"Copy policies are set for unknown fields of {target_cls}: "
+                    f"{', '.join(sorted(unknown_fields))}"
+                )
+        self._own("_mappings", "_subobject_kinds")
         self._mappings[source_cls] = (target_cls, fields_mapping)
+        self._subobject_kinds.pop(source_cls, None)
+        if copy_policies:
+            self._own("_copy_policies")
+            self._copy_policies[source_cls] = dict(copy_policies)
+        elif source_cls in self._copy_policies:
+            self._own("_copy_policies")
+            del self._copy_policies[source_cls]
+        if fields_mapping:
+            self._own("_fields_mappings")
+            self._fields_mappings[source_cls] = compile_fields_mapping(
+                source_cls, fields_mapping
+            )
+        elif source_cls in self._fields_mappings:
+            self._own("_fields_mappings")
+            del self._fields_mappings[source_cls]
+        if trusted and source_cls not in self._trusted:
+            self._own("_trusted")
+            self._trusted.add(source_cls)
+        elif not trusted and source_cls in self._trusted:
+            self._own("_trusted")
+            self._trusted.discard(source_cls)
+        self._drop_plans(lambda key: key[0] is source_cls)
 
     def map(
         self,
@@ -177,6 +733,9 @@ class Mapper:
         skip_none_values: bool = False,
         fields_mapping: FieldsMap = None,
         use_deepcopy: bool = True,
+        share_immutable: bool = False,
+        lazy: bool = False,
+        preserve_references: bool = False,
     ) -> T:  # type: ignore [type-var]
         """Produces output object mapped from source object and custom arguments
 
@@ -184,14 +743,22 @@ class Mapper:
             obj (object): Source object to map to `target class`.
             skip_none_values (bool, optional): Skip None values when creating `target class` obj. Defaults to False.
             fields_mapping (FieldsMap, optional): Custom mapping.
-                Specify dictionary in format {"field_name": value_object}. Defaults to None.
+                Specify dictionary in format {"field_name": value_object}.
+                Functions (e.g. `lambda source: ...`) are called with source object. Defaults to None.
             use_deepcopy (bool, optional): Apply deepcopy to all child objects when copy from source to target object.
                 Defaults to True.
+            share_immutable (bool, optional): Share deeply immutable child objects (e.g. tuples, frozensets
+                and frozen dataclasses of immutable values) between source and target objects instead of copying them.
+                Defaults to False.
+            lazy (bool, optional): Map child objects on first access instead of mapping them right away.
+                Child objects are replaced with proxies that map and memoize them. Defaults to False.
+            preserve_references (bool, optional): Map every source object once per mapping call and reuse its
+                target object for next references to it, circular references are supported. Defaults to False.
 
         Raises:
             MappingError: No `target class` specified to be mapped into.
                 Register mappings using `mapped.add(...)` or specify `target class` using `mapper.to(target_cls).map()`.
-            CircularReferenceError: Circular references in `source class` object are not allowed yet.
+            CircularReferenceError: Circular references in `source class` object without `preserve_references`.
 
         Returns:
             T: instance of `target class` with mapped values from `source class` or custom `fields_mapping` dictionary.
@@ -199,96 +766,690 @@ class Mapper:
         obj_type = type(obj)
         if obj_type not in self._mappings:
             raise MappingError(f"Missing mapping type for input type {obj_type}")
-        obj_type_prefix = f"{obj_type.__name__}."
-
-        target_cls, target_cls_field_mappings = self._mappings[obj_type]
-
-        common_fields_mapping = fields_mapping
-        if target_cls_field_mappings:
-            # transform mapping if it's from source class field
-            common_fields_mapping = {
-                target_obj_field: (
-                    getattr(obj, source_field[len(obj_type_prefix) :])
-                    if isinstance(source_field, str)
-                    and source_field.startswith(obj_type_prefix)
-                    else source_field
-                )
-                for target_obj_field, source_field in target_cls_field_mappings.items()
-            }
-            if fields_mapping:
-                common_fields_mapping = {
-                    **common_fields_mapping,
-                    **fields_mapping,
-                }  # merge two dict into one, fields_mapping has priority
 
+        # fields mapping registered for `source class` is part of mapping plan
+        target_cls, _ = self._mappings[obj_type]
         return self._map_common(
             obj,
             target_cls,
             set(),
             skip_none_values=skip_none_values,
-            custom_mapping=common_fields_mapping,
+            custom_mapping=fields_mapping,
             use_deepcopy=use_deepcopy,
+            share_immutable=share_immutable,
+            lazy=lazy,
+            preserve_references=preserve_references,
         )
 
-    def _get_fields(self, target_cls: Type[T]) -> Iterable[str]:
-        """Retrieved list of fields for initializing target class object"""
-        for base_class in self._class_specs:
-            if issubclass(target_cls, base_class):
-                return self._class_specs[base_class](target_cls)
+    @overload
+    def map_many(
+        self,
+        objs: Iterable[object],
+        *,
+        skip_none_values: bool = False,
+        fields_mapping: FieldsMap = None,
+        use_deepcopy: bool = True,
+        share_immutable: bool = False,
+        lazy: bool = False,
+        preserve_references: bool = False,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        ordered: bool = True,
+        as_list: Literal[False] = False,
+    ) -> Iterator[Any]: ...
+
+    @overload
+    def map_many(
+        self,
+        objs: Iterable[object],
+        *,
+        skip_none_values: bool = False,
+        fields_mapping: FieldsMap = None,
+        use_deepcopy: bool = True,
+        share_immutable: bool = False,
+        lazy: bool = False,
+        preserve_references: bool = False,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        ordered: bool = True,
+        as_list: Literal[True],
+    ) -> List[Any]: ...
+
+    def map_many(
+        self,
+        objs: Iterable[object],
+        *,
+        skip_none_values: bool = False,
+        fields_mapping: FieldsMap = None,
+        use_deepcopy: bool = True,
+        share_immutable: bool = False,
+        lazy: bool = False,
+        preserve_references: bool = False,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        ordered: bool = True,
+        as_list: bool = False,
+    ) -> Union[Iterator[Any], List[Any]]:
+        """Maps batch of source objects using registered mappings.
+        Mapping plan is resolved once per distinct `source class` in the batch.
+
+        Args:
+            objs (Iterable[object]): Source objects to map. Consumed lazily unless `as_list` is True.
+            skip_none_values (bool, optional): Skip None values when creating `target class` obj. Defaults to False.
+            fields_mapping (FieldsMap, optional): Custom mapping applied to every object.
+                Specify dictionary in format {"field_name": value_object}.
+                Functions (e.g. `lambda source: ...`) are called with source object. Defaults to None.
+            use_deepcopy (bool, optional): Apply deepcopy to all child objects when copy from source to target object.
+                Defaults to True.
+            share_immutable (bool, optional): Share deeply immutable child objects (e.g. tuples, frozensets
+                and frozen dataclasses of immutable values) between source and target objects instead of copying them.
+                Defaults to False.
+            lazy (bool, optional): Map child objects on first access instead of mapping them right away.
+                Child objects are replaced with proxies that map and memoize them. Defaults to False.
+            preserve_references (bool, optional): Map every source object once per mapping call and reuse its
+                target object for next references to it, circular references are supported. Defaults to False.
+            workers (int, optional): Map chunks of objects on a pool of this many processes.
+                Mapper and its mapping plans are sent to each process once. Defaults to None (map in current thread).
+            executor (Executor, optional): Map chunks of objects on provided `concurrent.futures` executor.
+                Mapper is sent with every chunk, so prefer `workers` over own process pool. Defaults to None.
+            chunk_size (int, optional): Number of objects in a chunk for `workers` and `executor`. Defaults to 1000.
+            ordered (bool, optional): Keep results of parallel mapping in the order of source objects.
+                Otherwise, chunks are returned as soon as they are mapped. Defaults to True.
+            as_list (bool, optional): Map all objects right away and return a list instead of generator.
+                Defaults to False.
+
+        Raises:
+            MappingError: No `target class` registered for one of the objects.
+            CircularReferenceError: Circular references in `source class` object without `preserve_references`.
+
+        Returns:
+            Iterator[T] | List[T]: instances of `target class` in the same order as source objects.
+        """
+        results: Iterator[Any] = self._map_batch(
+            objs,
+            None,
+            dict(
+                skip_none_values=skip_none_values,
+                custom_mapping=fields_mapping,
+                use_deepcopy=use_deepcopy,
+                share_immutable=share_immutable,
+                lazy=lazy,
+                preserve_references=preserve_references,
+            ),
+            workers=workers,
+            executor=executor,
+            chunk_size=chunk_size,
+            ordered=ordered,
+        )
+        return list(results) if as_list else results
+
+    @overload
+    def map_columns(
+        self,
+        objs: Iterable[S],
+        *,
+        skip_none_values: bool = False,
+        fields_mapping: FieldsMap = None,
+        use_deepcopy: bool = True,
+        share_immutable: bool = False,
+        typecodes: Optional[Dict[str, str]] = None,
+        as_numpy: Literal[False] = False,
+    ) -> Columns: ...
+
+    @overload
+    def map_columns(
+        self,
+        objs: Iterable[S],
+        *,
+        skip_none_values: bool = False,
+        fields_mapping: FieldsMap = None,
+        use_deepcopy: bool = True,
+        share_immutable: bool = False,
+        typecodes: Optional[Dict[str, str]] = None,
+        as_numpy: Literal[True],
+    ) -> Any: ...
+
+    def map_columns(
+        self,
+        objs: Iterable[S],
+        *,
+        skip_none_values: bool = False,
+        fields_mapping: FieldsMap = None,
+        use_deepcopy: bool = True,
+        share_immutable: bool = False,
+        typecodes: Optional[Dict[str, str]] = None,
+        as_numpy: bool = False,
+    ) -> Union[Columns, Any]:
+        """Maps batch of source objects into columns of fields of registered `target class` without creating
+        its objects. All source objects should be mapped to the same `target class`.
+        Every column is a list, `array.array` for fields with typecode, or a field of NumPy structured array.
+        Fields missing in source object get default values of `__init__` arguments or None.
+
+        Args:
+            objs (Iterable[S]): Source objects to map.
+            skip_none_values (bool, optional): Use default values of fields instead of None values. Defaults to False.
+            fields_mapping (FieldsMap, optional): Custom mapping applied to every object.
+                Specify dictionary in format {"field_name": value_object}.
+                Functions (e.g. `lambda source: ...`) are called with source object. Defaults to None.
+            use_deepcopy (bool, optional): Apply deepcopy to all child objects when copy from source to target object.
+                Defaults to True.
+            share_immutable (bool, optional): Share deeply immutable child objects (e.g. tuples, frozensets
+                and frozen dataclasses of immutable values) between source and target objects instead of copying them.
+                Defaults to False.
+            typecodes (Dict[str, str], optional): `array.array` typecode per field, e.g. {"age": "i"}.
+                In NumPy structured array it's the dtype of the field. Defaults to None (lists, inferred dtypes).
+            as_numpy (bool, optional): Return NumPy structured array with a named field per column.
+                Requires NumPy to be installed. Defaults to False.
+
+        Raises:
+            MappingError: No `target class` registered for `source class` or objects are mapped to different classes.
+            CircularReferenceError: Circular references in `source class` object.
+            ValueError: Typecode is set for unknown field.
+
+        Returns:
+            Dict[str, MutableSequence[Any]] | numpy.ndarray: values of every field of registered `target class`
+                in the order of source objects.
+        """
+        return map_columns(
+            self,
+            objs,
+            None,
+            dict(
+                skip_none_values=skip_none_values,
+                custom_mapping=fields_mapping,
+                use_deepcopy=use_deepcopy,
+                share_immutable=share_immutable,
+            ),
+            typecodes,
+            as_numpy,
+        )
+
+    def amap_many(
+        self,
+        objs: Union[AsyncIterable[object], Iterable[object]],
+        *,
+        skip_none_values: bool = False,
+        fields_mapping: FieldsMap = None,
+        use_deepcopy: bool = True,
+        share_immutable: bool = False,
+        lazy: bool = False,
+        preserve_references: bool = False,
+        chunk_size: int = DEFAULT_ASYNC_CHUNK_SIZE,
+    ) -> AsyncIterator[Any]:
+        """Maps async stream of source objects using registered mappings.
+        Objects are mapped in chunks, control is given back to event loop after each chunk.
+        Use it with `async for` statement.
+
+        Args:
+            objs (AsyncIterable[object] | Iterable[object]): Source objects to map.
+            skip_none_values (bool, optional): Skip None values when creating `target class` obj. Defaults to False.
+            fields_mapping (FieldsMap, optional): Custom mapping applied to every object.
+                Specify dictionary in format {"field_name": value_object}.
+                Functions (e.g. `lambda source: ...`) are called with source object. Defaults to None.
+            use_deepcopy (bool, optional): Apply deepcopy to all child objects when copy from source to target object.
+                Defaults to True.
+            share_immutable (bool, optional): Share deeply immutable child objects (e.g. tuples, frozensets
+                and frozen dataclasses of immutable values) between source and target objects instead of copying them.
+                Defaults to False.
+            lazy (bool, optional): Map child objects on first access instead of mapping them right away.
+                Child objects are replaced with proxies that map and memoize them. Defaults to False.
+            preserve_references (bool, optional): Map every source object once per mapping call and reuse its
+                target object for next references to it, circular references are supported. Defaults to False.
+            chunk_size (int, optional): Number of objects mapped before giving control to event loop. Defaults to 500.
+
+        Raises:
+            MappingError: No `target class` registered for one of the objects.
+            CircularReferenceError: Circular references in `source class` object without `preserve_references`.
+
+        Returns:
+            AsyncIterator[T]: instances of `target class` in the same order as source objects.
+        """
+        return amap_many(
+            self,
+            objs,
+            None,
+            dict(
+                skip_none_values=skip_none_values,
+                custom_mapping=fields_mapping,
+                use_deepcopy=use_deepcopy,
+                share_immutable=share_immutable,
+                lazy=lazy,
+                preserve_references=preserve_references,
+            ),
+            chunk_size,
+        )
+
+    def _map_batch(
+        self,
+        objs: Iterable[Any],
+        target_cls: Optional[Type[T]],
+        options: Dict[str, Any],
+        *,
+        workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        ordered: bool = True,
+    ) -> Iterator[T]:
+        """Maps batch of source objects in current thread or on a pool of workers"""
+        if isinstance(objs, ColumnBatch) and workers is None and executor is None:
+            return cast(Iterator[T], map_column_batch(self, objs, target_cls, options))
+        if workers is None and executor is None:
+            return self._map_many(objs, target_cls, **options)
+        return map_parallel(
+            self,
+            objs,
+            target_cls,
+            options,
+            workers=workers,
+            executor=executor,
+            chunk_size=chunk_size,
+            ordered=ordered,
+        )
+
+    def _map_many(
+        self,
+        objs: Iterable[Any],
+        target_cls: Optional[Type[T]],
+        skip_none_values: bool = False,
+        custom_mapping: FieldsMap = None,
+        use_deepcopy: bool = True,
+        share_immutable: bool = False,
+        lazy: bool = False,
+        preserve_references: bool = False,
+    ) -> Iterator[T]:
+        """Maps batch of source objects into `target class` objects or, if it's None, into registered classes"""
+        options = MappingOptions(
+            skip_none_values, use_deepcopy, share_immutable, lazy, preserve_references
+        )
+        plans: Dict[type, MappingPlan[T]] = {}
+        _visited_stack: Set[int] = set()
+        for obj in objs:
+            obj_type = type(obj)
+            plan = plans.get(obj_type)
+            if plan is None:
+                obj_target_cls = target_cls
+                if obj_target_cls is None:
+                    if obj_type not in self._mappings:
+                        raise MappingError(
+                            f"Missing mapping type for input type {obj_type}"
+                        )
+                    obj_target_cls = self._mappings[obj_type][0]
+                plan = self._get_plan(obj_type, obj_target_cls, options)
+                plans[obj_type] = plan
+            yield self._map_with_plan(plan, obj, _visited_stack, custom_mapping)
+
+    def _get_fields(self, target_cls: Type[T]) -> Tuple[str, ...]:
+        """Retrieved list of fields for initializing target class object.
+        Spec function is called once per target class, its result is cached until `add_spec` or `clear_caches`.
+        """
+        fields = self._fields.get(target_cls)
+        if fields is None:
+            fields = tuple(self._resolve_spec(target_cls)(target_cls))
+            self._fields[target_cls] = fields
+        return fields
+
+    def _resolve_spec(self, target_cls: Type[T]) -> SpecFunction[T]:
+        """Finds spec function for target class: spec of the closest base class, then spec of the last added
+        classifier that accepts target class
+        """
+        if self._lazy_extensions:
+            self._load_lazy_extensions()
+
+        class_specs = cast(Dict[type, SpecFunction[T]], self._class_specs)
+        for base_class in getattr(target_cls, "__mro__", ()):
+            if base_class in class_specs:
+                return class_specs[base_class]
+        # abstract base classes can have virtual subclasses, that don't have them in `__mro__`
+        for base_class in class_specs:
+            if isinstance(base_class, ABCMeta) and issubclass(target_cls, base_class):
+                return class_specs[base_class]
 
         for classifier in reversed(self._classifier_specs):
             if classifier(target_cls):
-                return self._classifier_specs[classifier](target_cls)
+                return self._classifier_specs[classifier]
 
         target_cls_name = getattr(target_cls, "__name__", type(target_cls))
         raise MappingError(
             f"No spec function is added for base class of {target_cls_name!r}"
         )
 
+    def _get_constructor(
+        self, target_cls: Type[T], trusted: bool = False
+    ) -> Optional[Callable[[Dict[str, Any]], T]]:
+        """Returns constructor of `target class` objects from constructor function of the closest base class
+        or the last added classifier that accepts `target class`, None if there is no such function.
+        Trusted constructor functions are checked first for trusted mappings.
+        """
+        if trusted:
+            constructor = self._get_constructor_from(
+                target_cls,
+                self._class_trusted_constructors,
+                self._classifier_trusted_constructors,
+            )
+            if constructor is not None:
+                return constructor
+        return self._get_constructor_from(
+            target_cls, self._class_constructors, self._classifier_constructors
+        )
+
+    @staticmethod
+    def _get_constructor_from(
+        target_cls: Type[T],
+        class_constructors: Dict[Any, ConstructorFunction[Any]],
+        classifier_constructors: Dict[Any, ConstructorFunction[Any]],
+    ) -> Optional[Callable[[Dict[str, Any]], T]]:
+        for base_class in getattr(target_cls, "__mro__", ()):
+            if base_class in class_constructors:
+                return class_constructors[base_class](target_cls)
+        for classifier in reversed(classifier_constructors):
+            if classifier(target_cls):
+                return classifier_constructors[classifier](target_cls)
+        return None
+
+    def _get_construction(
+        self, source_cls: Type[S], target_cls: Type[T], fields: Tuple[str, ...]
+    ) -> Tuple[
+        Optional[Callable[[Dict[str, Any]], T]],
+        Optional[Callable[[T, Dict[str, Any]], None]],
+    ]:
+        """Returns constructor and initializer of mapping plan. Target objects of trusted mappings
+        without constructor functions are created with `object.__new__` and initialized by storing mapped values
+        """
+        registered = self._mappings.get(source_cls)
+        trusted = (
+            registered is not None
+            and registered[0] is target_cls
+            and source_cls in self._trusted
+        )
+        constructor = self._get_constructor(target_cls, trusted)
+        if not trusted or constructor is not None:
+            return constructor, None
+        new: Any = getattr(target_cls, "__new__", None)
+        if new is not object.__new__:
+            # objects of classes with custom `__new__` are created by calling the class
+            return None, None
+        return None, object_initializer(target_cls, fields)
+
+    def _load_lazy_extensions(self) -> None:
+        """Loads lazy extensions which required modules are already imported"""
+        for extension_module, required_module in list(self._lazy_extensions.items()):
+            if required_module not in sys.modules:
+                continue
+            self._own("_lazy_extensions")
+            del self._lazy_extensions[extension_module]
+            try:
+                importlib.import_module(extension_module).extend(self)
+            except DuplicatedRegistrationError:
+                # spec functions for the same classes were added explicitly
+                log.debug(
+                    f"Skipped extension {extension_module}, its specs were already added."
+                )
+            except Exception:
+                log.exception(
+                    f"Found module {required_module} but could not load extension for it."
+                )
+
+    def _get_plan(
+        self,
+        source_cls: Type[S],
+        target_cls: Type[T],
+        options: MappingOptions = DEFAULT_OPTIONS,
+    ) -> MappingPlan[T]:
+        """Returns cached mapping plan for pair of classes and mapping options. Builds it on first use"""
+        key = (source_cls, target_cls, options)
+        plan = self._plans.get(key)
+        if self._hooks:
+            for hook in self._hooks:
+                hook.on_plan(source_cls, target_cls, plan is not None)
+        if plan is None:
+            # copy policies and fields mapping are registered for pair of classes added with `Mapper.add`
+            copy_policies, fields_mapping = None, None
+            registered = self._mappings.get(source_cls)
+            if registered is not None and registered[0] is target_cls:
+                copy_policies = self._copy_policies.get(source_cls)
+                fields_mapping = self._fields_mappings.get(source_cls)
+            fields = self._get_fields(target_cls)
+            constructor, initializer = self._get_construction(
+                source_cls, target_cls, fields
+            )
+            plan = MappingPlan(
+                source_cls,
+                target_cls,
+                fields,
+                options,
+                copy_policies,
+                fields_mapping,
+                constructor,
+                initializer,
+            )
+            if self._codegen:
+                plan.function, plan.source = compile_plan(plan)
+            self._plans[key] = plan
+        return plan
+
+    def generated_source(
+        self,
+        source_cls: Type[S],
+        target_cls: Optional[Type[T]] = None,
+        *,
+        skip_none_values: bool = False,
+        use_deepcopy: bool = True,
+        share_immutable: bool = False,
+    ) -> str:
+        """Returns source code of specialized mapping function for debugging purposes.
+
+        Args:
+            source_cls (Type[S]): Source class to map from
+            target_cls (Type[T], optional): Target class to map to.
+                Defaults to `target class` registered for `source class`.
+            skip_none_values (bool, optional): Skip None values when creating `target class` obj. Defaults to False.
+            use_deepcopy (bool, optional): Apply deepcopy to all child objects when copy from source to target object.
+                Defaults to True.
+            share_immutable (bool, optional): Share deeply immutable child objects (e.g. tuples, frozensets
+                and frozen dataclasses of immutable values) between source and target objects instead of copying them.
+                Defaults to False.
+
+        Raises:
+            MappingError: No `target class` specified and no mapping registered for `source class`.
+
+        Returns:
+            str: Python source code of the mapping function.
+        """
+        if target_cls is None:
+            if source_cls not in self._mappings:
+                raise MappingError(f"Missing mapping type for input type {source_cls}")
+            target_cls = self._mappings[source_cls][0]
+
+        options = MappingOptions(skip_none_values, use_deepcopy, share_immutable)
+        plan = self._get_plan(source_cls, target_cls, options)
+        if plan.source is not None:
+            return plan.source
+        return compile_plan(plan)[1]
+
+    def _drop_plans(self, predicate: Callable[[PlanKey], bool]) -> None:
+        """Removes cached mapping plans affected by a new registration"""
+        if "_plans" in self._shared:
+            # plans of other registrations are kept, they are valid for mapper that owns the copy
+            self._plans = {
+                key: plan for key, plan in self._plans.items() if not predicate(key)
+            }
+            self._shared = self._shared.difference(("_plans",))
+            return
+        for key in [key for key in self._plans if predicate(key)]:
+            del self._plans[key]
+
+    def _subobject_kind(self, obj_type: type) -> int:
+        """Returns kind of child objects of the type, it's resolved once per type"""
+        kind = self._subobject_kinds.get(obj_type)
+        if kind is None:
+            if obj_type in IMMEDIATE_TYPES or issubclass(obj_type, Enum):
+                kind = IMMEDIATE
+            elif obj_type in self._mappings:
+                kind = MAPPED
+            elif self._resolve_handler(obj_type) is not None:
+                kind = HANDLED
+            elif issubclass(obj_type, dict):
+                kind = DICTIONARY
+            elif issubclass(obj_type, Sequence):
+                kind = SEQUENCE
+            else:
+                kind = COPIED
+            self._subobject_kinds[obj_type] = kind
+        return kind
+
+    def _resolve_handler(self, obj_type: type) -> Optional[SubobjectHandler]:
+        """Finds handler added for the closest base class of the type"""
+        if self._handlers:
+            for base_class in obj_type.__mro__:
+                if base_class in self._handlers:
+                    return self._handlers[base_class]
+        return None
+
     def _map_subobject(
-        self, obj: S, _visited_stack: Set[int], skip_none_values: bool = False
+        self,
+        obj: S,
+        _visited_stack: Set[int],
+        options: MappingOptions = DEFAULT_OPTIONS,
     ) -> Any:
         """Maps subobjects recursively"""
-        if is_primitive(obj) or is_enum(obj):
+        kind = self._subobject_kinds.get(type(obj))
+        if kind is None:
+            kind = self._subobject_kind(type(obj))
+        if kind == IMMEDIATE:
             return obj
 
-        obj_id = id(obj)
-        if obj_id in _visited_stack:
+        if options.share_immutable and self._copier.is_immutable(obj, self._mappings):
+            return obj
+
+        if options.lazy:
+            return self._lazy_subobject(obj, _visited_stack, options)
+
+        return self._map_subobject_now(obj, _visited_stack, options)
+
+    def _lazy_subobject(
+        self, obj: Any, _visited_stack: Set[int], options: MappingOptions
+    ) -> Any:
+        """Returns proxy that maps child object on first access. Immutable objects are mapped right away,
+        they are cheap to copy and proxies of them don't behave exactly like them.
+        With `preserve_references` option every source object gets one proxy per mapping call,
+        or its target object if it was mapped without proxy.
+        """
+        if self._copier.is_immutable(obj, self._mappings):
+            return self._map_subobject_now(obj, _visited_stack, options)
+        if not options.preserve_references:
+            # proxy maps object with its own visited stack, its child objects are lazy as well
+            return LazyProxy(partial(self._map_subobject_now, obj, set(), options))
+
+        # proxy uses memo of the mapping call
+        memo = cast(ReferenceMemo, _visited_stack)
+        result = memo.get_mapped(obj, LazyProxy)
+        if result is MISSING:
+            registered = self._mappings.get(type(obj))
+            result = memo.get_mapped(obj, registered[0] if registered else None)
+        if result is MISSING:
+            result = LazyProxy(partial(self._map_subobject_now, obj, memo, options))
+            memo.remember(obj, result, LazyProxy)
+        return result
+
+    def _map_subobject_now(
+        self,
+        obj: S,
+        _visited_stack: Set[int],
+        options: MappingOptions = DEFAULT_OPTIONS,
+    ) -> Any:
+        """Maps subobject right away: maps objects of registered classes, rebuilds collections, copies other objects"""
+        if self._iterative:
+            return iterative.map_subobject(self, obj, _visited_stack, options)
+
+        if id(obj) in _visited_stack:
             raise CircularReferenceError()
 
-        if type(obj) in self._mappings:
+        kind = self._subobject_kind(type(obj))
+        if kind == MAPPED:
             target_cls, _ = self._mappings[type(obj)]
-            result: Any = self._map_common(
-                obj, target_cls, _visited_stack, skip_none_values=skip_none_values
-            )
-        else:
-            _visited_stack.add(obj_id)
+            plan: MappingPlan[Any] = self._get_plan(type(obj), target_cls, options)
+            return self._map_with_plan(plan, obj, _visited_stack)
 
-            if is_dictionary(obj):
-                result = type(obj)(  # type: ignore [call-arg]
-                    {
-                        k: self._map_subobject(
-                            v, _visited_stack, skip_none_values=skip_none_values
-                        )
-                        for k, v in obj.items()  # type: ignore [attr-defined]
-                    }
-                )
-            elif is_sequence(obj):
-                result = type(obj)(  # type: ignore [call-arg]
-                    [
-                        self._map_subobject(
-                            x, _visited_stack, skip_none_values=skip_none_values
-                        )
-                        for x in cast(Iterable[Any], obj)
-                    ]
-                )
+        if not options.preserve_references:
+            return self._copy_subobject(obj, _visited_stack, options, kind)
+
+        memo = ReferenceMemo.of(_visited_stack)
+        result = memo.get_mapped(obj)
+        if result is not MISSING:
+            return result
+        if type(obj) is list or type(obj) is dict:
+            # builtin collections are created before their items are mapped, so they can contain themselves
+            result = type(obj)()
+            memo.remember(obj, result)
+            if type(obj) is dict:
+                for k, v in obj.items():
+                    result[k] = self._map_subobject(v, memo, options)
             else:
-                result = deepcopy(obj)
+                for x in cast(Iterable[Any], obj):
+                    result.append(self._map_subobject(x, memo, options))
+        else:
+            result = self._copy_subobject(obj, memo, options, kind)
+            memo.remember(obj, result)
+        return result
 
-            _visited_stack.remove(obj_id)
+    def _copy_subobject(
+        self,
+        obj: S,
+        _visited_stack: Set[int],
+        options: MappingOptions,
+        kind: int,
+    ) -> Any:
+        """Rebuilds dictionaries and sequences with mapped items, maps objects with handlers, copies other objects"""
+        if kind == COPIED or kind == IMMEDIATE:
+            if self._hooks and kind == COPIED:
+                self._notify_deepcopy(type(obj))
+            return self._copier.copy(obj)
 
+        obj_id = id(obj)
+        _visited_stack.add(obj_id)
+
+        result: Any
+        if kind == DICTIONARY:
+            result = type(obj)(  # type: ignore [call-arg]
+                {
+                    k: self._map_subobject(v, _visited_stack, options)
+                    for k, v in obj.items()  # type: ignore [attr-defined]
+                }
+            )
+        elif kind == SEQUENCE:
+            result = type(obj)(  # type: ignore [call-arg]
+                [
+                    self._map_subobject(x, _visited_stack, options)
+                    for x in cast(Iterable[Any], obj)
+                ]
+            )
+        else:
+            result = self._handle_subobject(obj, _visited_stack, options)
+
+        _visited_stack.remove(obj_id)
         return result
 
+    def _notify_deepcopy(self, obj_type: type) -> None:
+        """Notifies hooks when child objects of the type are copied with `copy.deepcopy`"""
+        if self._copier.uses_deepcopy(obj_type):
+            for hook in self._hooks:
+                hook.on_deepcopy(obj_type)
+
+    def _handle_subobject(
+        self, obj: Any, _visited_stack: Set[int], options: MappingOptions
+    ) -> Any:
+        """Maps child object with handler added for its class"""
+        handler = cast(SubobjectHandler, self._resolve_handler(type(obj)))
+        return handler(
+            obj,
+            partial(
+                self._map_subobject, _visited_stack=_visited_stack, options=options
+            ),
+        )
+
     def _map_common(
         self,
         obj: S,
@@ -297,6 +1458,9 @@ class Mapper:
         skip_none_values: bool = False,
         custom_mapping: FieldsMap = None,
         use_deepcopy: bool = True,
+        share_immutable: bool = False,
+        lazy: bool = False,
+        preserve_references: bool = False,
     ) -> T:
         """Produces output object mapped from source object and custom arguments.
 
@@ -306,43 +1470,148 @@ class Mapper:
             _visited_stack (Set[int]): Visited child objects. To avoid infinite recursive calls.
             skip_none_values (bool, optional): Skip None values when creating `target class` obj. Defaults to False.
             custom_mapping (FieldsMap, optional): Custom mapping.
-                Specify dictionary in format {"field_name": value_object}. Defaults to None.
+                Specify dictionary in format {"field_name": value_object}.
+                Functions (e.g. `lambda source: ...`) are called with source object. Defaults to None.
             use_deepcopy (bool, optional): Apply deepcopy to all child objects when copy from source to target object.
                 Defaults to True.
+            share_immutable (bool, optional): Share deeply immutable child objects (e.g. tuples, frozensets
+                and frozen dataclasses of immutable values) between source and target objects instead of copying them.
+                Defaults to False.
+            lazy (bool, optional): Map child objects on first access instead of mapping them right away.
+                Child objects are replaced with proxies that map and memoize them. Defaults to False.
+            preserve_references (bool, optional): Map every source object once per mapping call and reuse its
+                target object for next references to it, circular references are supported. Defaults to False.
 
         Raises:
-            CircularReferenceError: Circular references in `source class` object are not allowed yet.
+            CircularReferenceError: Circular references in `source class` object without `preserve_references`.
 
         Returns:
             T: Instance of `target class` with mapped fields.
         """
+        options = MappingOptions(
+            skip_none_values, use_deepcopy, share_immutable, lazy, preserve_references
+        )
+        plan = self._get_plan(type(obj), target_cls, options)
+        return self._map_with_plan(plan, obj, _visited_stack, custom_mapping)
+
+    def _map_with_plan(
+        self,
+        plan: MappingPlan[T],
+        obj: Any,
+        _visited_stack: Set[int],
+        custom_mapping: FieldsMap = None,
+    ) -> T:
+        """Maps source object using resolved mapping plan"""
+        if self._iterative:
+            return cast(
+                T,
+                iterative.map_with_plan(
+                    self, plan, obj, _visited_stack, custom_mapping
+                ),
+            )
+
+        if self._hooks:
+            return self._map_with_hooks(plan, obj, _visited_stack, custom_mapping)
+
+        if plan.options.preserve_references:
+            return self._map_with_plan_once(
+                plan, obj, ReferenceMemo.of(_visited_stack), custom_mapping
+            )
+
         obj_id = id(obj)
 
         if obj_id in _visited_stack:
             raise CircularReferenceError()
         _visited_stack.add(obj_id)
 
-        target_cls_fields = self._get_fields(target_cls)
+        result = plan.map(self, obj, _visited_stack, custom_mapping)
 
-        mapped_values: Dict[str, Any] = {}
-        for field_name in target_cls_fields:
-            value_found, value = _try_get_field_value(field_name, obj, custom_mapping)
-            if not value_found:
-                continue
+        _visited_stack.remove(obj_id)
 
-            if value is not None:
-                if use_deepcopy:
-                    mapped_values[field_name] = self._map_subobject(
-                        value, _visited_stack, skip_none_values
-                    )
-                else:  # if use_deepcopy is False, simply assign value to target obj.
-                    mapped_values[field_name] = value
-            elif not skip_none_values:
-                mapped_values[field_name] = None
+        return result
 
-        _visited_stack.remove(obj_id)
+    def _map_with_hooks(
+        self,
+        plan: MappingPlan[T],
+        obj: Any,
+        _visited_stack: Set[int],
+        custom_mapping: FieldsMap = None,
+    ) -> T:
+        """Maps source object using resolved mapping plan, notifies hooks about the mapping and its time"""
+        source_cls, target_cls = plan.source_cls, plan.target_cls
+        for hook in self._hooks:
+            hook.on_map_start(source_cls, target_cls)
+        # numbers of mapped values, objects already mapped in this call have none
+        counts: List[int] = []
+        failed = True
+        start = time.perf_counter()
+        try:
+            if plan.options.preserve_references:
+                result = self._map_with_plan_once(
+                    plan, obj, ReferenceMemo.of(_visited_stack), custom_mapping, counts
+                )
+            else:
+                obj_id = id(obj)
+                if obj_id in _visited_stack:
+                    raise CircularReferenceError()
+                _visited_stack.add(obj_id)
+                # mapped values are counted, so compiled function is not used
+                mapped_values = plan.map_values(
+                    self, obj, _visited_stack, custom_mapping
+                )
+                counts.append(len(mapped_values))
+                result = plan.construct(mapped_values)
+                _visited_stack.remove(obj_id)
+            failed = False
+            return result
+        finally:
+            elapsed = time.perf_counter() - start
+            fields_count = counts[0] if counts and not failed else 0
+            for hook in self._hooks:
+                hook.on_map_end(source_cls, target_cls, fields_count, elapsed, failed)
 
-        return cast(target_cls, target_cls(**mapped_values))  # type: ignore [valid-type]
+    def _map_with_plan_once(
+        self,
+        plan: MappingPlan[T],
+        obj: Any,
+        memo: ReferenceMemo,
+        custom_mapping: FieldsMap = None,
+        counts: Optional[List[int]] = None,
+    ) -> T:
+        """Maps source object once per mapping call, next references to it reuse the same target object.
+        If `target class` allows it, target object is created before its fields are mapped and initialized after,
+        so fields can refer back to it. Number of mapped values is appended to `counts` if it's given.
+        """
+        target_cls = plan.target_cls
+        result: T = memo.get_mapped(obj, target_cls)
+        if result is not MISSING:
+            return result
+
+        obj_id = id(obj)
+        if obj_id in memo:
+            raise CircularReferenceError()
+
+        if plan.constructor is None and (
+            plan.initializer is not None or can_create_before_init(target_cls)
+        ):
+            result = object.__new__(target_cls)
+            memo.remember(obj, result, target_cls)
+            mapped_values = plan.map_values(self, obj, memo, custom_mapping)
+            if counts is not None:
+                counts.append(len(mapped_values))
+            plan.initialize(result, mapped_values)
+            return result
+
+        memo.add(obj_id)
+        if counts is None:
+            result = plan.map(self, obj, memo, custom_mapping)
+        else:
+            mapped_values = plan.map_values(self, obj, memo, custom_mapping)
+            counts.append(len(mapped_values))
+            result = plan.construct(mapped_values)
+        memo.remove(obj_id)
+        memo.remember(obj, result, target_cls)
+        return result
 
     def to(self, target_cls: Type[T]) -> MappingWrapper[T]:
         """Specify `target class` to which map `source class` object.
@@ -1,36 +1,72 @@
-import glob
 import importlib
-import importlib.util
 import logging
-from os.path import basename, dirname, isfile, join
+from functools import lru_cache
+from importlib.metadata import entry_points
+from typing import Any, Tuple
 
 from . import Mapper
 
-__DEFAULT_EXTENSION__ = "default"
+# Extensions for builtin classes, loaded by every mapper
+__DEFAULT_EXTENSIONS__ = ("default", "dataclasses", "namedtuple", "typeddict")
 __EXTENSIONS_FOLDER__ = "extensions"
 __PACKAGE_PATH__ = __package__ + "." + __EXTENSIONS_FOLDER__
+# Extensions shipped with the package: required module -> extension module
+__EXTENSIONS__ = {
+    "attr": __PACKAGE_PATH__ + ".attrs",
+    "pydantic": __PACKAGE_PATH__ + ".pydantic",
+    "sqlalchemy": __PACKAGE_PATH__ + ".sqlalchemy",
+    "tortoise": __PACKAGE_PATH__ + ".tortoise",
+}
+# Entry points group of third-party extensions: entry point name is required module, value is extension module
+__ENTRY_POINTS_GROUP__ = "py_automapper.extensions"
 
 log = logging.getLogger("automapper")
 
 
-def create_mapper() -> Mapper:
-    """Returns a Mapper instance with preloaded extensions"""
-    mapper = Mapper()
-    extensions = glob.glob(join(dirname(__file__), __EXTENSIONS_FOLDER__, "*.py"))
-    for extension in extensions:
-        if isfile(extension) and not extension.endswith("__init__.py"):
-            module_name = basename(extension)[:-3]
-            if (
-                module_name == __DEFAULT_EXTENSION__
-                or importlib.util.find_spec(module_name) is not None
-            ):
-                try:
-                    extension_package = importlib.import_module(
-                        __PACKAGE_PATH__ + "." + module_name
-                    )
-                    extension_package.extend(mapper)
-                except Exception:
-                    log.exception(
-                        f"Found module {module_name} but could not load extension for it."
-                    )
+def _entry_points_extensions() -> Tuple[Tuple[str, str], ...]:
+    """Reads extensions registered by installed packages in entry points group"""
+    all_entry_points: Any = entry_points()
+    if hasattr(all_entry_points, "select"):
+        group = all_entry_points.select(group=__ENTRY_POINTS_GROUP__)
+    else:  # Python < 3.10 returns dictionary of groups
+        group = all_entry_points.get(__ENTRY_POINTS_GROUP__, ())
+    return tuple(
+        (entry_point.name, entry_point.value.split(":", 1)[0].strip())
+        for entry_point in group
+    )
+
+
+@lru_cache(maxsize=None)
+def _lazy_extensions() -> Tuple[Tuple[str, str], ...]:
+    """Returns pairs of required module and extension module, resolved once per process.
+    Several extensions can require the same module, so they are keyed by extension module.
+    """
+    extensions = {
+        extension_module: required_module
+        for required_module, extension_module in __EXTENSIONS__.items()
+    }
+    try:
+        for required_module, extension_module in _entry_points_extensions():
+            extensions[extension_module] = required_module
+    except Exception:
+        log.exception("Could not read extensions from entry points.")
+    return tuple(
+        (required_module, extension_module)
+        for extension_module, required_module in extensions.items()
+    )
+
+
+def create_mapper(*, codegen: bool = False, iterative: bool = False) -> Mapper:
+    """Returns a Mapper instance with preloaded extensions
+
+    Args:
+        codegen (bool, optional): Compile specialized mapping functions, see `Mapper`. Defaults to False.
+        iterative (bool, optional): Map child objects on explicit stack, see `Mapper`. Defaults to False.
+    """
+    mapper = Mapper(codegen=codegen, iterative=iterative)
+    for extension in __DEFAULT_EXTENSIONS__:
+        importlib.import_module(__PACKAGE_PATH__ + "." + extension).extend(mapper)
+    # extensions of other libraries are loaded only when these libraries are used
+    for required_module, extension_module in _lazy_extensions():
+        mapper.add_lazy_extension(required_module, extension_module)
     return mapper
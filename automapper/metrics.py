@@ -0,0 +1,231 @@
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+# Pair of source class and target class of a mapping
+MappingPair = Tuple[type, type]
+
+
+class MappingHook:
+    """Base class of instrumentation hooks added with `Mapper.add_hook`. Methods do nothing, subclasses override
+    the ones they need. Hooks are called in the thread that maps objects, so they should be fast and thread-safe.
+    Mapper doesn't call hooks and doesn't measure time until a hook is added.
+    """
+
+    def on_plan(self, source_cls: type, target_cls: type, cached: bool) -> None:
+        """Called when mapping plan is requested for pair of classes, `cached` is False when plan is built"""
+
+    def on_map_start(self, source_cls: type, target_cls: type) -> None:
+        """Called before source object is mapped, mappings of child objects start and end before the parent's end"""
+
+    def on_map_end(
+        self,
+        source_cls: type,
+        target_cls: type,
+        fields_count: int,
+        elapsed: float,
+        failed: bool,
+    ) -> None:
+        """Called after source object is mapped or mapping raised an error.
+
+        Args:
+            source_cls (type): Class of source object.
+            target_cls (type): Target class of the mapping.
+            fields_count (int): Number of values mapped for `target class` fields. Fields missing in source object
+                or skipped by `skip_none_values` are not counted. Failed mappings and objects already mapped
+                in the mapping call have none.
+            elapsed (float): Seconds spent in the mapping, including mappings of child objects.
+            failed (bool): Mapping raised an error.
+        """
+
+    def on_deepcopy(self, obj_type: type) -> None:
+        """Called when child object is copied with `copy.deepcopy`, because there is no faster copy function
+        for its type. It's called between `on_map_start` and `on_map_end` of the mapping that copies it,
+        except for child objects of lazy mappings.
+        """
+
+
+class PairMetrics(NamedTuple):
+    """Metrics of mappings from source class to target class. Times are in seconds,
+    percentiles are computed from the latest samples kept by collector.
+    """
+
+    calls: int
+    failures: int
+    total_time: float
+    p50: float
+    p90: float
+    p99: float
+    fields_copied: int
+    deepcopy_fallbacks: int
+    plan_cache_hits: int
+    plan_cache_misses: int
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.calls if self.calls else 0.0
+
+    @property
+    def plan_cache_hit_rate(self) -> float:
+        requests = self.plan_cache_hits + self.plan_cache_misses
+        return self.plan_cache_hits / requests if requests else 0.0
+
+
+class MetricsSnapshot(NamedTuple):
+    """Metrics collected since creation or the last reset of collector"""
+
+    # metrics per pair of source class and target class
+    pairs: Dict[MappingPair, PairMetrics]
+    # child objects copied with `copy.deepcopy` per type, including those outside of mappings
+    deepcopy_types: Dict[type, int]
+
+    def as_dicts(self) -> List[Dict[str, Any]]:
+        """Returns metrics as list of flat dictionaries with qualified class names, e.g. to export them"""
+        return [
+            {
+                "source": _qualified_name(source_cls),
+                "target": _qualified_name(target_cls),
+                **metrics._asdict(),
+                "mean_time": metrics.mean_time,
+                "plan_cache_hit_rate": metrics.plan_cache_hit_rate,
+            }
+            for (source_cls, target_cls), metrics in self.pairs.items()
+        ]
+
+
+class _PairStats:
+    """Mutable counters of a mapping pair, updated under collector lock"""
+
+    __slots__ = (
+        "calls",
+        "failures",
+        "total_time",
+        "samples",
+        "fields_copied",
+        "deepcopy_fallbacks",
+        "plan_cache_hits",
+        "plan_cache_misses",
+    )
+
+    def __init__(self, samples_count: int) -> None:
+        self.calls = 0
+        self.failures = 0
+        self.total_time = 0.0
+        self.samples: Deque[float] = deque(maxlen=samples_count)
+        self.fields_copied = 0
+        self.deepcopy_fallbacks = 0
+        self.plan_cache_hits = 0
+        self.plan_cache_misses = 0
+
+    def to_metrics(self) -> PairMetrics:
+        samples = sorted(self.samples)
+        return PairMetrics(
+            self.calls,
+            self.failures,
+            self.total_time,
+            _percentile(samples, 50),
+            _percentile(samples, 90),
+            _percentile(samples, 99),
+            self.fields_copied,
+            self.deepcopy_fallbacks,
+            self.plan_cache_hits,
+            self.plan_cache_misses,
+        )
+
+
+class MetricsCollector(MappingHook):
+    """Hook that keeps metrics of every mapping pair in memory: calls, errors, time, fields copied,
+    `copy.deepcopy` fallbacks of child objects and mapping plan cache hits. Use `snapshot` to read them.
+    """
+
+    def __init__(self, samples_count: int = 1024) -> None:
+        """
+        Args:
+            samples_count (int, optional): Number of the latest mapping times kept per pair
+                to compute percentiles. Defaults to 1024.
+        """
+        if samples_count < 1:
+            raise ValueError("samples_count should be positive")
+        self._samples_count = samples_count
+        self._lock = threading.Lock()
+        self._pairs: Dict[MappingPair, _PairStats] = {}
+        self._deepcopy_types: Dict[type, int] = {}
+        # pairs being mapped in current thread, the last one copies child objects
+        self._local = threading.local()
+
+    def on_plan(self, source_cls: type, target_cls: type, cached: bool) -> None:
+        with self._lock:
+            stats = self._stats((source_cls, target_cls))
+            if cached:
+                stats.plan_cache_hits += 1
+            else:
+                stats.plan_cache_misses += 1
+
+    def on_map_start(self, source_cls: type, target_cls: type) -> None:
+        self._active().append((source_cls, target_cls))
+
+    def on_map_end(
+        self,
+        source_cls: type,
+        target_cls: type,
+        fields_count: int,
+        elapsed: float,
+        failed: bool,
+    ) -> None:
+        active = self._active()
+        if active:
+            active.pop()
+        with self._lock:
+            stats = self._stats((source_cls, target_cls))
+            stats.calls += 1
+            stats.total_time += elapsed
+            stats.samples.append(elapsed)
+            if failed:
+                stats.failures += 1
+            else:
+                stats.fields_copied += fields_count
+
+    def on_deepcopy(self, obj_type: type) -> None:
+        active = self._active()
+        with self._lock:
+            self._deepcopy_types[obj_type] = self._deepcopy_types.get(obj_type, 0) + 1
+            if active:
+                self._stats(active[-1]).deepcopy_fallbacks += 1
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Returns copy of metrics collected so far, it's not changed by next mappings"""
+        with self._lock:
+            return MetricsSnapshot(
+                {pair: stats.to_metrics() for pair, stats in self._pairs.items()},
+                dict(self._deepcopy_types),
+            )
+
+    def reset(self) -> None:
+        """Clears collected metrics"""
+        with self._lock:
+            self._pairs.clear()
+            self._deepcopy_types.clear()
+
+    def _stats(self, pair: MappingPair) -> _PairStats:
+        stats = self._pairs.get(pair)
+        if stats is None:
+            stats = self._pairs[pair] = _PairStats(self._samples_count)
+        return stats
+
+    def _active(self) -> List[MappingPair]:
+        active: Optional[List[MappingPair]] = getattr(self._local, "pairs", None)
+        if active is None:
+            active = self._local.pairs = []
+        return active
+
+
+def _percentile(samples: Sequence[float], percent: int) -> float:
+    """Returns nearest-rank percentile of sorted samples"""
+    if not samples:
+        return 0.0
+    rank = -(-len(samples) * percent // 100)
+    return samples[max(rank, 1) - 1]
+
+
+def _qualified_name(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
@@ -0,0 +1,144 @@
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from functools import partial
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Type,
+)
+
+if TYPE_CHECKING:
+    from .mapper import Mapper
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# Mapper shipped to a worker process once, when the process starts
+_worker_mapper: Optional["Mapper"] = None
+
+
+def _init_worker(mapper: "Mapper") -> None:
+    global _worker_mapper
+    _worker_mapper = mapper
+
+
+def _map_chunk(
+    mapper: "Mapper",
+    target_cls: Optional[Type[Any]],
+    options: Dict[str, Any],
+    chunk: List[Any],
+) -> List[Any]:
+    return list(mapper._map_many(chunk, target_cls, **options))
+
+
+def _map_chunk_in_worker(
+    target_cls: Optional[Type[Any]], options: Dict[str, Any], chunk: List[Any]
+) -> List[Any]:
+    assert _worker_mapper is not None, "Worker process was not initialized"
+    return _map_chunk(_worker_mapper, target_cls, options, chunk)
+
+
+def _chunks(objs: Iterable[Any], chunk_size: int) -> Iterator[List[Any]]:
+    iterator = iter(objs)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _run_chunks(
+    executor: Executor,
+    map_chunk: Callable[[List[Any]], List[Any]],
+    chunks: Iterator[List[Any]],
+    max_pending: int,
+    ordered: bool,
+) -> Iterator[Any]:
+    """Submits chunks to executor keeping at most `max_pending` of them in flight and yields mapped objects"""
+    if ordered:
+        queue: Deque["Future[List[Any]]"] = deque()
+        for chunk in chunks:
+            queue.append(executor.submit(map_chunk, chunk))
+            if len(queue) >= max_pending:
+                yield from queue.popleft().result()
+        while queue:
+            yield from queue.popleft().result()
+        return
+
+    pending: Set["Future[List[Any]]"] = set()
+    for chunk in chunks:
+        pending.add(executor.submit(map_chunk, chunk))
+        if len(pending) >= max_pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+    for future in wait(pending).done:
+        yield from future.result()
+
+
+def map_parallel(
+    mapper: "Mapper",
+    objs: Iterable[Any],
+    target_cls: Optional[Type[Any]],
+    options: Dict[str, Any],
+    *,
+    workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ordered: bool = True,
+) -> Iterator[Any]:
+    """Splits source objects into chunks and maps them on a pool of workers.
+
+    If `executor` is not provided, a process pool with `workers` processes is created for the batch.
+    The first chunk is mapped in current process, which builds mapping plans, and then the mapper
+    with these plans is sent to every worker process once, at start.
+    Provided `executor` receives mapper with every chunk: cheap for thread pools, but process pools
+    have to pickle it per chunk.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size should be a positive number")
+    return _map_parallel(
+        mapper, objs, target_cls, options, workers, executor, chunk_size, ordered
+    )
+
+
+def _map_parallel(
+    mapper: "Mapper",
+    objs: Iterable[Any],
+    target_cls: Optional[Type[Any]],
+    options: Dict[str, Any],
+    workers: Optional[int],
+    executor: Optional[Executor],
+    chunk_size: int,
+    ordered: bool,
+) -> Iterator[Any]:
+    chunks = _chunks(objs, chunk_size)
+    max_pending = 2 * (workers or os.cpu_count() or 1)
+
+    if executor is not None:
+        map_chunk = partial(_map_chunk, mapper, target_cls, options)
+        yield from _run_chunks(executor, map_chunk, chunks, max_pending, ordered)
+        return
+
+    first_chunk = next(chunks, None)
+    if first_chunk is None:
+        return
+    yield from _map_chunk(mapper, target_cls, options, first_chunk)
+
+    # imported on first use, `multiprocessing` is slow to import for mappers that never map in parallel
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(mapper,)
+    ) as pool:
+        map_chunk = partial(_map_chunk_in_worker, target_cls, options)
+        yield from _run_chunks(pool, map_chunk, chunks, max_pending, ordered)
@@ -0,0 +1,300 @@
+from collections import OrderedDict, defaultdict
+from copy import copy
+from operator import attrgetter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Literal,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from .utils import is_function
+
+if TYPE_CHECKING:
+    from .mapper import Mapper
+
+T = TypeVar("T")
+
+# Field access kinds
+ATTRIBUTE = 0
+ITEM = 1
+CONSTANT = 2  # value registered in fields mapping
+GETTER = 3  # value returned by getter registered in fields mapping, called with source object
+
+# Kinds of child objects, resolved once per type by `Mapper`
+IMMEDIATE = 0  # primitive values and enums, assigned as is
+MAPPED = 1  # objects of classes registered with `Mapper.add`
+HANDLED = 2  # objects mapped by handlers added with `Mapper.add_handler`
+DICTIONARY = 3
+SEQUENCE = 4
+COPIED = 5  # other objects, copied by copier
+
+# Precompiled source of a field registered in fields mapping: access kind and constant value or getter
+FieldSource = Tuple[int, Any]
+
+# Builtin dictionaries can't have instance attributes, so fields missing on the class are read as items
+_ITEM_SOURCE_TYPES = (dict, OrderedDict, defaultdict)
+
+MISSING: Any = object()
+
+# Values of these types are assigned to target object as is, without calling `Mapper._map_subobject`
+IMMEDIATE_TYPES = frozenset(
+    {type(None), int, float, complex, str, bytes, bytearray, bool}
+)
+
+# Copy policies of a field: assign value as is, copy it with `copy.copy`,
+# copy it deeply without mapping, or map it recursively (default)
+CopyPolicy = Literal["reference", "shallow", "deep", "map"]
+COPY_POLICIES = ("reference", "shallow", "deep", "map")
+
+
+class MappingOptions(NamedTuple):
+    """Options of a mapping call that change the way fields are mapped"""
+
+    skip_none_values: bool = False
+    use_deepcopy: bool = True
+    share_immutable: bool = False
+    lazy: bool = False
+    preserve_references: bool = False
+
+
+DEFAULT_OPTIONS = MappingOptions()
+
+
+def _resolve_access(source_cls: Type[Any], field_name: str) -> int:
+    """Chooses how to read `field_name` from objects of `source class`"""
+    if source_cls in _ITEM_SOURCE_TYPES and not hasattr(source_cls, field_name):
+        return ITEM
+    return ATTRIBUTE
+
+
+def _copy_value(
+    mapper: "Mapper",
+    value: Any,
+    _visited_stack: Set[int],
+    options: MappingOptions,
+    copy_policy: CopyPolicy,
+) -> Any:
+    """Copies field value according to its copy policy"""
+    if copy_policy == "map":
+        return mapper._map_subobject(value, _visited_stack, options)
+    if copy_policy == "shallow":
+        return copy(value)
+    if copy_policy == "deep":
+        return mapper._copier.copy(value)
+    return value
+
+
+def compile_fields_mapping(
+    source_cls: Type[Any], fields_mapping: Dict[str, Any]
+) -> Dict[str, FieldSource]:
+    """Parses fields mapping registered for `source class` once, so mapping only calls getters.
+    Values like "SourceClass.field" or "SourceClass.field.nested_field" are read from source object,
+    functions are called with source object, other values are constants.
+    """
+    obj_type_prefix = f"{source_cls.__name__}."
+    compiled: Dict[str, FieldSource] = {}
+    for target_field, source_field in fields_mapping.items():
+        if isinstance(source_field, str) and source_field.startswith(obj_type_prefix):
+            compiled[target_field] = (
+                GETTER,
+                attrgetter(source_field[len(obj_type_prefix) :]),
+            )
+        elif is_function(source_field):
+            compiled[target_field] = (GETTER, source_field)
+        else:
+            compiled[target_field] = (CONSTANT, source_field)
+    return compiled
+
+
+# slots of mapping plan that are not pickled
+_FUNCTION_SLOTS = (
+    "constructor",
+    "initializer",
+    "function",
+    "source",
+    "columns_function",
+)
+
+
+class MappingPlan(Generic[T]):
+    """Mapping of `source class` objects into `target class` objects resolved once and reused on every call.
+    Holds list of `target class` fields, the way each field is read from source object and mapping options.
+    """
+
+    __slots__ = (
+        "source_cls",
+        "target_cls",
+        "fields",
+        "field_sources",
+        "subscriptable",
+        "options",
+        "copy_policies",
+        "constructor",
+        "initializer",
+        "function",
+        "source",
+        "columns_function",
+    )
+
+    def __init__(
+        self,
+        source_cls: Type[Any],
+        target_cls: Type[T],
+        field_names: Iterable[str],
+        options: MappingOptions = DEFAULT_OPTIONS,
+        copy_policies: Optional[Dict[str, CopyPolicy]] = None,
+        fields_mapping: Optional[Dict[str, FieldSource]] = None,
+        constructor: Optional[Callable[[Dict[str, Any]], T]] = None,
+        initializer: Optional[Callable[[T, Dict[str, Any]], None]] = None,
+    ) -> None:
+        self.source_cls = source_cls
+        self.target_cls = target_cls
+        fields_mapping = fields_mapping or {}
+        self.fields: Tuple[Tuple[str, int], ...] = tuple(
+            (
+                field_name,
+                (
+                    fields_mapping[field_name][0]
+                    if field_name in fields_mapping
+                    else _resolve_access(source_cls, field_name)
+                ),
+            )
+            for field_name in field_names
+        )
+        # constants and getters of fields registered in fields mapping, None for other fields
+        self.field_sources: Tuple[Any, ...] = tuple(
+            fields_mapping[field_name][1] if field_name in fields_mapping else None
+            for field_name, _ in self.fields
+        )
+        self.subscriptable = hasattr(source_cls, "__getitem__")
+        self.options = options
+        # copy policy of every field, None if all fields follow `use_deepcopy` option
+        self.copy_policies: Optional[Tuple[CopyPolicy, ...]] = None
+        if copy_policies:
+            default_policy: CopyPolicy = "map" if options.use_deepcopy else "reference"
+            self.copy_policies = tuple(
+                copy_policies.get(field_name, default_policy)
+                for field_name, _ in self.fields
+            )
+        # creates `target class` object from mapped values, None to call `target class` with keyword arguments
+        self.constructor = constructor
+        # sets fields of object created with `object.__new__` in trusted mode, None to call `__init__`
+        self.initializer = initializer
+        # specialized mapping function and its source code, set when plan is compiled
+        self.function: Optional[Callable[["Mapper", Any, Set[int]], T]] = None
+        self.source: Optional[str] = None
+        # appends mapped values to columns, set when plan is first used by `Mapper.map_columns`
+        self.columns_function: Optional[Callable[..., None]] = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # functions can't be pickled, mapper sets them again after unpickling
+        return {
+            name: getattr(self, name)
+            for name in self.__slots__
+            if name not in _FUNCTION_SLOTS
+        }
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        self.constructor = None
+        self.initializer = None
+        self.function = None
+        self.source = None
+        self.columns_function = None
+
+    def map(
+        self,
+        mapper: "Mapper",
+        obj: Any,
+        _visited_stack: Set[int],
+        custom_mapping: Optional[Dict[str, Any]] = None,
+    ) -> T:
+        """Maps source object into `target class` object. Uses compiled function when there is no custom mapping"""
+        if self.function is not None and not custom_mapping:
+            return self.function(mapper, obj, _visited_stack)
+        return self.map_generic(mapper, obj, _visited_stack, custom_mapping)
+
+    def map_generic(
+        self,
+        mapper: "Mapper",
+        obj: Any,
+        _visited_stack: Set[int],
+        custom_mapping: Optional[Dict[str, Any]] = None,
+    ) -> T:
+        """Maps source object into `target class` object field by field"""
+        mapped_values = self.map_values(mapper, obj, _visited_stack, custom_mapping)
+        return self.construct(mapped_values)
+
+    def construct(self, mapped_values: Dict[str, Any]) -> T:
+        """Creates `target class` object from mapped values"""
+        if self.constructor is not None:
+            return self.constructor(mapped_values)
+        if self.initializer is not None:
+            result: T = object.__new__(self.target_cls)
+            self.initializer(result, mapped_values)
+            return result
+        return self.target_cls(**mapped_values)
+
+    def initialize(self, result: T, mapped_values: Dict[str, Any]) -> None:
+        """Sets fields of `target class` object created with `object.__new__` before its fields were mapped"""
+        if self.initializer is not None:
+            self.initializer(result, mapped_values)
+        else:
+            self.target_cls.__init__(result, **mapped_values)
+
+    def map_values(
+        self,
+        mapper: "Mapper",
+        obj: Any,
+        _visited_stack: Set[int],
+        custom_mapping: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Collects values for `target class` constructor from source object and custom mapping"""
+        options = self.options
+        copy_policies = self.copy_policies
+        mapped_values: Dict[str, Any] = {}
+        for index, (field_name, access) in enumerate(self.fields):
+            if custom_mapping and field_name in custom_mapping:
+                value = custom_mapping[field_name]
+                if is_function(value):
+                    value = value(obj)
+            elif access == GETTER:
+                value = self.field_sources[index](obj)
+            elif access == CONSTANT:
+                value = self.field_sources[index]
+            else:
+                if access == ITEM:
+                    value = obj.get(field_name, MISSING)
+                else:
+                    value = getattr(obj, field_name, MISSING)
+                    if value is MISSING and self.subscriptable and field_name in obj:
+                        value = obj[field_name]
+                if value is MISSING:
+                    continue
+
+            if value is not None:
+                if copy_policies is not None:
+                    mapped_values[field_name] = _copy_value(
+                        mapper, value, _visited_stack, options, copy_policies[index]
+                    )
+                elif options.use_deepcopy:
+                    mapped_values[field_name] = mapper._map_subobject(
+                        value, _visited_stack, options
+                    )
+                else:  # if use_deepcopy is False, simply assign value to target obj.
+                    mapped_values[field_name] = value
+            elif not options.skip_none_values:
+                mapped_values[field_name] = None
+
+        return mapped_values
@@ -0,0 +1,43 @@
+from typing import Any, Dict, Optional, Set, Tuple
+
+from .plan import MISSING
+
+
+def can_create_before_init(target_cls: type) -> bool:
+    """Checks that objects of `target class` can be created with `object.__new__` and initialized later
+    the same way as calling the class
+    """
+    new: Any = target_cls.__new__
+    return type(target_cls).__call__ is type.__call__ and new is object.__new__
+
+
+class ReferenceMemo(Set[int]):
+    """Visited stack of a mapping call with `preserve_references` option.
+    Besides ids of source objects being mapped, it holds target objects mapped during the call,
+    so every source object is mapped once and next references to it reuse the same target object.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        # (id of source object, target class) -> (source object, target object)
+        # source object is kept so its id is not reused by another object during the call
+        self._mapped: Dict[Tuple[int, Optional[type]], Tuple[Any, Any]] = {}
+
+    @classmethod
+    def of(cls, visited_stack: Set[int]) -> "ReferenceMemo":
+        """Returns memo of a mapping call, or a new one when the call starts with plain visited stack"""
+        if isinstance(visited_stack, ReferenceMemo):
+            return visited_stack
+        return cls()
+
+    def get_mapped(self, obj: Any, target_cls: Optional[type] = None) -> Any:
+        """Returns target object mapped from source object earlier in the call or `MISSING`.
+        Target class is None for copied objects and collections.
+        """
+        return self._mapped.get((id(obj), target_cls), (None, MISSING))[1]
+
+    def remember(
+        self, obj: Any, target: Any, target_cls: Optional[type] = None
+    ) -> None:
+        """Stores target object mapped from source object"""
+        self._mapped[(id(obj), target_cls)] = (obj, target)
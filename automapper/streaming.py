@@ -0,0 +1,69 @@
+from collections.abc import AsyncIterable as AsyncIterableABC
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from .mapper import Mapper
+
+DEFAULT_ASYNC_CHUNK_SIZE = 500
+
+
+async def _iterate(
+    objs: Union[AsyncIterable[Any], Iterable[Any]]
+) -> AsyncIterator[Any]:
+    if isinstance(objs, AsyncIterableABC):
+        async for obj in objs:
+            yield obj
+    else:
+        for obj in objs:
+            yield obj
+
+
+async def _map_chunks(
+    mapper: "Mapper",
+    objs: Union[AsyncIterable[Any], Iterable[Any]],
+    target_cls: Optional[Type[Any]],
+    options: Dict[str, Any],
+    chunk_size: int,
+) -> AsyncIterator[Any]:
+    # imported on first use, `asyncio` is slow to import for mappers that never map streams
+    import asyncio
+
+    chunk: List[Any] = []
+    async for obj in _iterate(objs):
+        chunk.append(obj)
+        if len(chunk) < chunk_size:
+            continue
+        for result in mapper._map_many(chunk, target_cls, **options):
+            yield result
+        chunk = []
+        # let other tasks run between chunks
+        await asyncio.sleep(0)
+
+    for result in mapper._map_many(chunk, target_cls, **options):
+        yield result
+
+
+def amap_many(
+    mapper: "Mapper",
+    objs: Union[AsyncIterable[Any], Iterable[Any]],
+    target_cls: Optional[Type[Any]],
+    options: Dict[str, Any],
+    chunk_size: int = DEFAULT_ASYNC_CHUNK_SIZE,
+) -> AsyncIterator[Any]:
+    """Maps objects from async or regular iterable in chunks of `chunk_size`.
+    Gives control back to event loop after each chunk, so mapping of a long stream does not block other tasks.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size should be a positive number")
+    return _map_chunks(mapper, objs, target_cls, options, chunk_size)
@@ -0,0 +1,82 @@
+import dataclasses
+import inspect
+from types import MemberDescriptorType
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+# Sets fields of `target class` object created with `object.__new__` from dictionary of mapped values
+Initializer = Callable[[Any, Dict[str, Any]], None]
+
+
+def default_values(
+    target_cls: type, field_names: Tuple[str, ...]
+) -> Tuple[Dict[str, Any], Dict[str, Callable[[], Any]]]:
+    """Returns default values and default factories of fields that `__init__` sets when their values are skipped.
+    Dataclass fields with `init=False` are set by `__init__` too, so their defaults are included.
+    """
+    defaults: Dict[str, Any] = {}
+    factories: Dict[str, Callable[[], Any]] = {}
+    if dataclasses.is_dataclass(target_cls):
+        for field in dataclasses.fields(target_cls):
+            if field.default is not dataclasses.MISSING:
+                defaults[field.name] = field.default
+            elif field.default_factory is not dataclasses.MISSING:
+                factories[field.name] = field.default_factory
+        return defaults, factories
+
+    try:
+        init = target_cls.__init__  # type: ignore [misc]
+        parameters = inspect.signature(init).parameters.values()
+    except (TypeError, ValueError):
+        return defaults, factories
+    for parameter in parameters:
+        if parameter.name in field_names and parameter.default is not parameter.empty:
+            defaults[parameter.name] = parameter.default
+    return defaults, factories
+
+
+def object_initializer(
+    target_cls: type, field_names: Iterable[str]
+) -> Optional[Initializer]:
+    """Creates function that stores mapped values directly in `__dict__` and slots of `target class` object,
+    instead of passing them to `__init__`. Fields with skipped values get default values of `__init__`.
+    Returns None if any field is a data descriptor other than slot, e.g. `property`,
+    because `__init__` can store its value under another name.
+    """
+    field_names = tuple(field_names)
+    defaults, factories = default_values(target_cls, field_names)
+    # dataclass fields with `init=False` are never mapped, their defaults are set on every object
+    default_only = [name for name in (*defaults, *factories) if name not in field_names]
+    complete_count = -1 if default_only else len(field_names)
+    slots = {}
+    for name in (*field_names, *default_only):
+        descriptor = inspect.getattr_static(target_cls, name, None)
+        if isinstance(descriptor, MemberDescriptorType):
+            slots[name] = descriptor
+        elif hasattr(type(descriptor), "__set__"):
+            return None
+
+    def initialize(obj: Any, mapped_values: Dict[str, Any]) -> None:
+        if len(mapped_values) != complete_count:
+            values = {
+                field_name: factory()
+                for field_name, factory in factories.items()
+                if field_name not in mapped_values
+            }
+            values.update(
+                (field_name, default)
+                for field_name, default in defaults.items()
+                if field_name not in mapped_values
+            )
+            values.update(mapped_values)
+            mapped_values = values
+        if not slots:
+            obj.__dict__.update(mapped_values)
+            return
+        for field_name, value in mapped_values.items():
+            descriptor = slots.get(field_name)
+            if descriptor is not None:
+                descriptor.__set__(obj, value)
+            else:
+                obj.__dict__[field_name] = value
+
+    return initialize
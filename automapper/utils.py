@@ -1,7 +1,20 @@
+import operator
+import types
 from enum import Enum
+from functools import partial
 from typing import Any, Dict, Sequence
 
 __PRIMITIVE_TYPES = {int, float, complex, str, bytes, bytearray, bool}
+# Functions in fields mapping are called with source object, other callables (e.g. classes) are values
+__FUNCTION_TYPES = (
+    types.FunctionType,
+    types.BuiltinFunctionType,
+    types.MethodType,
+    partial,
+    operator.attrgetter,
+    operator.itemgetter,
+    operator.methodcaller,
+)
 
 
 def is_sequence(obj: Any) -> bool:
@@ -31,3 +44,8 @@ def is_primitive(obj: Any) -> bool:
 def is_enum(obj: Any) -> bool:
     """Check if object type is enum"""
     return issubclass(type(obj), Enum)
+
+
+def is_function(obj: Any) -> bool:
+    """Check if object is a function, method or getter that computes field value from source object"""
+    return isinstance(obj, __FUNCTION_TYPES)
@@ -0,0 +1,121 @@
+from functools import partial
+from typing import Any, Callable, Iterator, NamedTuple, Sequence
+
+from automapper import create_mapper
+
+from .models import (
+    Order,
+    OrderItem,
+    PublicOrder,
+    PublicOrderItem,
+    PublicUserInfo,
+    UserInfo,
+    create_order,
+    create_user,
+)
+
+
+class Case(NamedTuple):
+    group: str
+    name: str
+    size: int
+    func: Callable[[], Any]
+
+
+def default_cases(sizes: Sequence[int]) -> Iterator[Case]:
+    """Classes with annotated `__init__` method, mapped with default extension"""
+    mapper = create_mapper()
+    mapper.add(UserInfo, PublicUserInfo)
+    mapper.add(OrderItem, PublicOrderItem)
+    mapper.add(Order, PublicOrder)
+    compiled_mapper = create_mapper(codegen=True)
+    compiled_mapper.add(UserInfo, PublicUserInfo)
+
+    user = create_user()
+    yield Case("default", "map", 1, partial(mapper.map, user))
+    yield Case("default", "to.map", 1, partial(mapper.to(PublicUserInfo).map, user))
+    yield Case("default", "map codegen", 1, partial(compiled_mapper.map, user))
+
+    for size in sizes:
+        order = create_order(size)
+        yield Case("default", "map nested", size, partial(mapper.map, order))
+        yield Case(
+            "default",
+            "map nested use_deepcopy=False",
+            size,
+            partial(mapper.map, order, use_deepcopy=False),
+        )
+        yield Case(
+            "default",
+            "to.map nested",
+            size,
+            partial(mapper.to(PublicOrder).map, order),
+        )
+
+        users = [create_user(index) for index in range(size)]
+        yield Case(
+            "default", "map_many", size, partial(mapper.map_many, users, as_list=True)
+        )
+
+
+def pydantic_cases(sizes: Sequence[int]) -> Iterator[Case]:
+    from .pydantic_models import (
+        ItemModel,
+        OrderModel,
+        PublicItemModel,
+        PublicOrderModel,
+        create_order_model,
+    )
+
+    mapper = create_mapper()
+    mapper.add(ItemModel, PublicItemModel)
+    mapper.add(OrderModel, PublicOrderModel)
+
+    item = ItemModel(sku="sku-1", quantity=1, price=1.5)
+    yield Case("pydantic", "map", 1, partial(mapper.map, item))
+    for size in sizes:
+        order = create_order_model(size)
+        yield Case("pydantic", "map nested", size, partial(mapper.map, order))
+
+
+def sqlalchemy_cases(sizes: Sequence[int]) -> Iterator[Case]:
+    from .sqlalchemy_models import PublicUserRow, UserRow, load_user_rows
+
+    mapper = create_mapper()
+    mapper.add(UserRow, PublicUserRow)
+    rows = load_user_rows(max(sizes))
+
+    yield Case("sqlalchemy", "map", 1, partial(mapper.map, rows[0]))
+    for size in sizes:
+        yield Case(
+            "sqlalchemy",
+            "map_many",
+            size,
+            partial(mapper.map_many, rows[:size], as_list=True),
+        )
+
+
+def tortoise_cases(sizes: Sequence[int]) -> Iterator[Case]:
+    from .tortoise_models import PublicUserRecord, UserRecord, load_user_records
+
+    mapper = create_mapper()
+    mapper.add(UserRecord, PublicUserRecord)
+    records = load_user_records(max(sizes))
+
+    yield Case("tortoise", "map", 1, partial(mapper.map, records[0]))
+    for size in sizes:
+        yield Case(
+            "tortoise",
+            "map_many",
+            size,
+            partial(mapper.map_many, records[:size], as_list=True),
+        )
+
+
+# Cases of extensions are skipped when library of the extension is not installed
+CASE_GROUPS = {
+    "default": default_cases,
+    "pydantic": pydantic_cases,
+    "sqlalchemy": sqlalchemy_cases,
+    "tortoise": tortoise_cases,
+}
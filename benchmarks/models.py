@@ -0,0 +1,77 @@
+from typing import Any, Dict, List
+
+
+class UserInfo:
+    def __init__(self, name: str, profession: str, age: int, email: str) -> None:
+        self.name = name
+        self.profession = profession
+        self.age = age
+        self.email = email
+
+
+class PublicUserInfo:
+    def __init__(self, name: str, profession: str, email: str) -> None:
+        self.name = name
+        self.profession = profession
+        self.email = email
+
+
+class OrderItem:
+    def __init__(self, sku: str, quantity: int, price: float) -> None:
+        self.sku = sku
+        self.quantity = quantity
+        self.price = price
+
+
+class PublicOrderItem:
+    def __init__(self, sku: str, quantity: int, price: float) -> None:
+        self.sku = sku
+        self.quantity = quantity
+        self.price = price
+
+
+class Order:
+    def __init__(
+        self,
+        number: str,
+        customer: UserInfo,
+        items: List[OrderItem],
+        attributes: List[Dict[str, Any]],
+    ) -> None:
+        self.number = number
+        self.customer = customer
+        self.items = items
+        self.attributes = attributes
+
+
+class PublicOrder:
+    def __init__(
+        self,
+        number: str,
+        customer: PublicUserInfo,
+        items: List[PublicOrderItem],
+        attributes: List[Dict[str, Any]],
+    ) -> None:
+        self.number = number
+        self.customer = customer
+        self.items = items
+        self.attributes = attributes
+
+
+def create_user(index: int = 0) -> UserInfo:
+    return UserInfo(
+        f"user {index}", "engineer", 30 + index % 40, f"user{index}@example.com"
+    )
+
+
+def create_order(size: int) -> Order:
+    """Creates order with `size` items and `size` attribute dictionaries"""
+    return Order(
+        "order-1",
+        create_user(),
+        [OrderItem(f"sku-{index}", index, index * 1.5) for index in range(size)],
+        [
+            {"key": f"attribute {index}", "values": [index, str(index)]}
+            for index in range(size)
+        ],
+    )
@@ -0,0 +1,38 @@
+from typing import List
+
+from pydantic import BaseModel
+
+
+class ItemModel(BaseModel):
+    sku: str
+    quantity: int
+    price: float
+
+
+class PublicItemModel(BaseModel):
+    sku: str
+    quantity: int
+    price: float
+
+
+class OrderModel(BaseModel):
+    number: str
+    tags: List[str]
+    items: List[ItemModel]
+
+
+class PublicOrderModel(BaseModel):
+    number: str
+    tags: List[str]
+    items: List[PublicItemModel]
+
+
+def create_order_model(size: int) -> OrderModel:
+    return OrderModel(
+        number="order-1",
+        tags=[f"tag {index}" for index in range(size)],
+        items=[
+            ItemModel(sku=f"sku-{index}", quantity=index, price=index * 1.5)
+            for index in range(size)
+        ],
+    )
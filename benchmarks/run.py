@@ -0,0 +1,132 @@
+"""Runs benchmarks of mapping hot paths and stores results in JSON file.
+
+Usage:
+    python -m benchmarks.run --output results.json
+    python -m benchmarks.run --group default --sizes 10,100 --compare results.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import timeit
+from datetime import datetime, timezone
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .cases import CASE_GROUPS, Case
+
+ResultKey = Tuple[str, str, int]
+
+
+def measure(case: Case, repeat: int) -> Dict[str, Any]:
+    """Measures time of a single call of the case function"""
+    timer = timeit.Timer(case.func)
+    number, _ = timer.autorange()
+    timings = [total / number for total in timer.repeat(repeat=repeat, number=number)]
+    return {
+        "group": case.group,
+        "name": case.name,
+        "size": case.size,
+        "number": number,
+        "best": min(timings),
+        "median": statistics.median(timings),
+    }
+
+
+def _package_version() -> str:
+    try:
+        return version("py-automapper")
+    except PackageNotFoundError:
+        return "unknown"
+
+
+def _result_key(result: Dict[str, Any]) -> ResultKey:
+    return result["group"], result["name"], result["size"]
+
+
+def _load_baseline(path: Optional[str]) -> Dict[ResultKey, Dict[str, Any]]:
+    if not path:
+        return {}
+    with open(path) as baseline_file:
+        return {
+            _result_key(result): result
+            for result in json.load(baseline_file)["results"]
+        }
+
+
+def _format_result(result: Dict[str, Any], baseline: Optional[Dict[str, Any]]) -> str:
+    line = f"{result['group']:<11} {result['name']:<32} {result['size']:>6} {result['best'] * 1e6:>14.2f} us"
+    if baseline:
+        line += f" {result['best'] / baseline['best']:>8.2f}x"
+    return line
+
+
+def run(
+    groups: Sequence[str], sizes: Sequence[int], repeat: int
+) -> List[Dict[str, Any]]:
+    results: List[Dict[str, Any]] = []
+    for group in groups:
+        try:
+            cases = list(CASE_GROUPS[group](sizes))
+        except ImportError as error:
+            print(f"Skipped {group} benchmarks: {error}", file=sys.stderr)
+            continue
+        results.extend(measure(case, repeat) for case in cases)
+    return results
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Benchmarks of py-automapper mapping hot paths"
+    )
+    parser.add_argument(
+        "--group",
+        action="append",
+        choices=sorted(CASE_GROUPS),
+        help="benchmark group to run, can be repeated. Defaults to all groups",
+    )
+    parser.add_argument(
+        "--sizes",
+        default="10,100,1000",
+        help="comma separated sizes of mapped collections",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="number of measurements per benchmark"
+    )
+    parser.add_argument("--output", help="path of JSON file to store results in")
+    parser.add_argument(
+        "--compare",
+        help="path of JSON file with results of previous run to compare with",
+    )
+    args = parser.parse_args(argv)
+
+    sizes = [int(size) for size in args.sizes.split(",")]
+    baseline = _load_baseline(args.compare)
+    results = run(args.group or list(CASE_GROUPS), sizes, args.repeat)
+
+    print(
+        f"{'group':<11} {'benchmark':<32} {'size':>6} {'best per call':>17}"
+        + (" vs base" if baseline else "")
+    )
+    for result in results:
+        print(_format_result(result, baseline.get(_result_key(result))))
+
+    if args.output:
+        report = {
+            "version": _package_version(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "created": datetime.now(timezone.utc).isoformat(),
+            "results": results,
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+from typing import List
+
+from sqlalchemy import Column, Integer, String, create_engine, select
+from sqlalchemy.orm import DeclarativeBase, Session
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class UserRow(Base):
+    __tablename__ = "users"
+    id = Column(Integer, primary_key=True)
+    full_name = Column(String)
+    public_name = Column(String)
+    email = Column(String)
+
+
+class PublicUserRow(Base):
+    __tablename__ = "public_users"
+    id = Column(Integer, primary_key=True)
+    public_name = Column(String)
+    email = Column(String)
+
+
+def load_user_rows(count: int) -> List[UserRow]:
+    """Stores `count` users in in-memory SQLite database and loads them back"""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine, expire_on_commit=False) as session:
+        session.add_all(
+            [
+                UserRow(
+                    id=index,
+                    full_name=f"User {index}",
+                    public_name=f"user{index}",
+                    email=f"user{index}@example.com",
+                )
+                for index in range(count)
+            ]
+        )
+        session.commit()
+        return list(session.scalars(select(UserRow).order_by(UserRow.id)))
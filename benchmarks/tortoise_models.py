@@ -0,0 +1,42 @@
+import asyncio
+from typing import List
+
+from tortoise import Model, Tortoise, fields
+
+
+class UserRecord(Model):
+    id = fields.IntField(primary_key=True)
+    full_name = fields.TextField()
+    public_name = fields.TextField()
+    email = fields.TextField()
+
+
+class PublicUserRecord(Model):
+    id = fields.IntField(primary_key=True)
+    public_name = fields.TextField()
+    email = fields.TextField()
+
+
+async def _load_user_records(count: int) -> List[UserRecord]:
+    await Tortoise.init(db_url="sqlite://:memory:", modules={"models": [__name__]})
+    try:
+        await Tortoise.generate_schemas()
+        await UserRecord.bulk_create(
+            [
+                UserRecord(
+                    id=index,
+                    full_name=f"User {index}",
+                    public_name=f"user{index}",
+                    email=f"user{index}@example.com",
+                )
+                for index in range(count)
+            ]
+        )
+        return await UserRecord.all().order_by("id")
+    finally:
+        await Tortoise.close_connections()
+
+
+def load_user_records(count: int) -> List[UserRecord]:
+    """Stores `count` users in in-memory SQLite database and loads them back"""
+    return asyncio.run(_load_user_records(count))
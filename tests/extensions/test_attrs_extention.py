@@ -0,0 +1,50 @@
+from typing import Any, List
+
+import attr
+from automapper import create_mapper
+
+
+class UserInfo:
+    def __init__(self, name: str, age: str, tags: List[str], secret: str):
+        self.name = name
+        self.age = age
+        self.tags = tags
+        self.secret = secret
+
+
+@attr.s(auto_attribs=True, slots=True)
+class PublicUserInfo:
+    name: str
+    age: int = attr.ib(converter=int)
+    tags: List[str] = attr.Factory(list)
+    _secret: str = "hidden"
+    created: bool = attr.ib(init=False, default=True)
+
+
+def test_map__attrs_class_is_mapped_with_converters():
+    mapper = create_mapper()
+    source = UserInfo("John", "30", ["a"], "key")
+
+    result = mapper.to(PublicUserInfo).map(source)
+
+    assert result == PublicUserInfo("John", 30, ["a"], "key")
+    assert result.tags is not source.tags
+    assert result.created
+
+
+def test_get_fields__attrs_fields_are_init_arguments():
+    mapper = create_mapper()
+
+    assert mapper._get_fields(PublicUserInfo) == ("name", "age", "tags", "secret")
+
+
+def test_map__trusted_mapping_skips_converters_and_sets_defaults():
+    mapper = create_mapper()
+    mapper.add(UserInfo, PublicUserInfo, trusted=True)
+    source = UserInfo("John", "30", None, "key")  # type: ignore [arg-type]
+
+    result: Any = mapper.map(source, skip_none_values=True)
+
+    assert (result.name, result.age, result.tags) == ("John", "30", [])
+    assert result._secret == "key"
+    assert result.created
@@ -0,0 +1,81 @@
+from dataclasses import InitVar, dataclass, field
+from hashlib import sha256
+from typing import ClassVar, List
+
+from automapper import Mapper, create_mapper
+from automapper.extensions.dataclasses import extend
+
+
+class UserInfo:
+    def __init__(self, name: str, age: int, tags: List[str]):
+        self.name = name
+        self.age = age
+        self.tags = tags
+
+
+@dataclass
+class PublicUserInfo:
+    name: str
+    tags: List[str]
+    age_group: str = field(init=False, default="unknown")
+
+
+@dataclass(frozen=True)
+class FrozenUserInfo:
+    __slots__ = ("name", "age")
+    name: str
+    age: int
+
+
+def test_spec_function__fields_with_init_are_returned():
+    mapper = Mapper()
+    extend(mapper)
+
+    assert mapper._get_fields(PublicUserInfo) == ("name", "tags")
+
+
+def test_map__dataclass_with_slots_is_mapped():
+    mapper = Mapper()
+    extend(mapper)
+
+    result = mapper.to(FrozenUserInfo).map(UserInfo("John", 30, []))
+
+    assert result == FrozenUserInfo("John", 30)
+
+
+def test_map__dataclass_fields_without_init_are_skipped():
+    mapper = create_mapper()
+    source = UserInfo("John", 30, ["a"])
+
+    result = mapper.to(PublicUserInfo).map(source)
+
+    assert result == PublicUserInfo("John", ["a"])
+    assert result.tags is not source.tags
+    assert result.age_group == "unknown"
+
+
+@dataclass
+class Credentials:
+    algorithm: ClassVar[str] = "sha256"
+    name: str
+    secret: InitVar[str]
+    digest: str = field(init=False)
+
+    def __post_init__(self, secret: str) -> None:
+        self.digest = sha256(secret.encode()).hexdigest()
+
+
+class Login:
+    def __init__(self, name: str, secret: str):
+        self.name = name
+        self.secret = secret
+
+
+def test_map__dataclass_init_vars_are_mapped():
+    mapper = create_mapper()
+
+    result = mapper.to(Credentials).map(Login("John", "xyz"))
+
+    assert mapper._get_fields(Credentials) == ("name", "secret")
+    assert result.digest == sha256(b"xyz").hexdigest()
+    assert not hasattr(result, "secret")
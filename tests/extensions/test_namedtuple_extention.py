@@ -0,0 +1,69 @@
+from collections import namedtuple
+from typing import Any, List, NamedTuple
+
+from automapper import Mapper, create_mapper
+from automapper.extensions.namedtuple import constructor_function, extend
+
+
+class UserInfo:
+    def __init__(self, name: str, age: int, tags: List[str]):
+        self.name = name
+        self.age = age
+        self.tags = tags
+
+
+class PublicUserInfo(NamedTuple):
+    name: str
+    tags: List[str]
+    age: int = 0
+
+
+class Name(NamedTuple):
+    name: str
+
+
+class Empty(NamedTuple):
+    pass
+
+
+LegacyUserInfo = namedtuple("LegacyUserInfo", ["name", "age"])
+
+
+class ValidatedUserInfo(LegacyUserInfo):
+    def __new__(cls, name: str, age: int) -> Any:
+        return super().__new__(cls, name.upper(), age)
+
+
+def test_map__named_tuple_is_mapped():
+    mapper = Mapper()
+    extend(mapper)
+    source = UserInfo("John", 30, ["a"])
+
+    result = mapper.to(PublicUserInfo).map(source)
+
+    assert result == PublicUserInfo("John", ["a"], 30)
+    assert type(result) is PublicUserInfo
+    assert result.tags is not source.tags
+
+
+def test_map__skipped_fields_of_named_tuple_get_default_values():
+    mapper = create_mapper(codegen=True)
+
+    result = mapper.to(PublicUserInfo).map(
+        UserInfo("John", None, []), skip_none_values=True  # type: ignore [arg-type]
+    )
+
+    assert result == PublicUserInfo("John", [], 0)
+
+
+def test_map__named_tuple_with_custom_new_is_created_with_it():
+    mapper = create_mapper()
+
+    result = mapper.to(ValidatedUserInfo).map(UserInfo("John", 30, []))
+
+    assert result == ("JOHN", 30)
+
+
+def test_constructor_function__single_and_empty_named_tuples():
+    assert constructor_function(Name)({"name": "John"}) == Name("John")
+    assert constructor_function(Empty)({}) == Empty()
@@ -1,8 +1,8 @@
-from typing import List
+from typing import Any, List
 from unittest import TestCase
 
 import pytest
-from automapper import Mapper, MappingError
+from automapper import Mapper, MappingError, create_mapper
 from automapper import mapper as default_mapper
 from pydantic import BaseModel
 
@@ -20,6 +20,19 @@ class PublicUserInfo(BaseModel):
     hobbies: List[str]
 
 
+class RawUserInfo:
+    def __init__(self, id: str, public_name: str, hobbies: List[str]):
+        self.id = id
+        self.public_name = public_name
+        self.hobbies = hobbies
+
+
+class PublicUserInfoWithDefaults(BaseModel):
+    id: int
+    public_name: str
+    hobbies: List[str] = []
+
+
 class PydanticExtensionTest(TestCase):
     """These scenario are known for FastAPI Framework models and Pydantic models in general."""
 
@@ -51,3 +64,22 @@ class PydanticExtensionTest(TestCase):
         assert set(result.hobbies) == set(["acting", "comedy", "swimming"])
         with pytest.raises(AttributeError):
             getattr(result, "full_name")
+
+    def test_map__trusted_mapping_creates_models_without_validation(self):
+        mapper = create_mapper()
+        mapper.add(RawUserInfo, PublicUserInfoWithDefaults, trusted=True)
+        obj = RawUserInfo("2", "dannyd", None)  # type: ignore [arg-type]
+
+        result: Any = mapper.map(obj, skip_none_values=True)
+        complete_result: Any = mapper.map(RawUserInfo("2", "dannyd", ["acting"]))
+
+        assert result.id == "2"
+        assert result.hobbies == []
+        assert result.model_fields_set == {"id", "public_name"}
+        assert dict(complete_result) == {
+            "id": "2",
+            "public_name": "dannyd",
+            "hobbies": ["acting"],
+        }
+        assert complete_result.model_fields_set == {"id", "public_name", "hobbies"}
+        assert mapper.to(PublicUserInfo).map(RawUserInfo("2", "dannyd", [])).id == 2
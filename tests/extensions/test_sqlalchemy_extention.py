@@ -1,10 +1,11 @@
+from typing import Any
 from unittest import TestCase
 
 import pytest
-from automapper import Mapper, MappingError
+from automapper import Mapper, MappingError, create_mapper
 from automapper import mapper as default_mapper
-from sqlalchemy import Column, Integer, String
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy import Column, Integer, String, create_engine
+from sqlalchemy.orm import DeclarativeBase, Session
 
 
 class Base(DeclarativeBase):
@@ -66,3 +67,19 @@ class SQLalchemyORMExtensionTest(TestCase):
         assert result.hobbies == "acting, comedy, swimming"
         with pytest.raises(AttributeError):
             getattr(result, "full_name")
+
+    def test_map__trusted_mapping_creates_models_without_init(self):
+        mapper = create_mapper()
+        mapper.add(UserInfo, PublicUserInfo, trusted=True)
+        obj = UserInfo(id=2, public_name="dannyd", hobbies="acting")
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+
+        result: Any = mapper.map(obj)
+        with Session(engine) as session:
+            session.add(result)
+            session.commit()
+            stored: Any = session.get(PublicUserInfo, 2)
+
+            assert stored is result
+            assert (stored.public_name, stored.hobbies) == ("dannyd", "acting")
@@ -0,0 +1,42 @@
+from typing import List, TypedDict
+
+from automapper import create_mapper
+
+
+class UserInfo:
+    def __init__(self, name: str, age: int, tags: List[str]):
+        self.name = name
+        self.age = age
+        self.tags = tags
+
+
+class PublicUserInfo(TypedDict):
+    name: str
+    tags: List[str]
+
+
+class ExtendedUserInfo(PublicUserInfo, total=False):
+    age: int
+
+
+def test_map__typed_dict_is_mapped_to_dictionary():
+    mapper = create_mapper()
+    source = UserInfo("John", 30, ["a"])
+
+    result = mapper.to(PublicUserInfo).map(source)
+
+    assert result == {"name": "John", "tags": ["a"]}
+    assert type(result) is dict
+    assert result["tags"] is not source.tags
+
+
+def test_map__inherited_and_optional_keys_of_typed_dict_are_mapped():
+    mapper = create_mapper(codegen=True)
+
+    result = mapper.to(ExtendedUserInfo).map(UserInfo("John", 30, []))
+    skipped = mapper.to(ExtendedUserInfo).map(
+        UserInfo("John", None, []), skip_none_values=True  # type: ignore [arg-type]
+    )
+
+    assert result == {"name": "John", "tags": [], "age": 30}
+    assert skipped == {"name": "John", "tags": []}
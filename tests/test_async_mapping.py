@@ -0,0 +1,94 @@
+import asyncio
+import subprocess
+import sys
+from typing import Any, AsyncIterator, List
+from unittest import TestCase
+
+import pytest
+from automapper import MappingError, create_mapper
+
+
+class UserInfo:
+    def __init__(self, name: str, age: int):
+        self.name = name
+        self.age = age
+
+
+class PublicUserInfo:
+    def __init__(self, name: str):
+        self.name = name
+
+
+async def fetch_users(count: int) -> AsyncIterator[UserInfo]:
+    for i in range(count):
+        await asyncio.sleep(0)
+        yield UserInfo(f"user_{i}", i)
+
+
+async def collect(results: AsyncIterator[Any]) -> List[Any]:
+    return [result async for result in results]
+
+
+class AsyncMappingTest(TestCase):
+    def setUp(self):
+        self.mapper = create_mapper()
+
+    def test_amap_many__maps_async_stream_with_registered_mapping(self):
+        self.mapper.add(UserInfo, PublicUserInfo)
+
+        results = asyncio.run(
+            collect(self.mapper.amap_many(fetch_users(7), chunk_size=3))
+        )
+
+        assert [r.name for r in results] == [f"user_{i}" for i in range(7)]
+        assert all(isinstance(r, PublicUserInfo) for r in results)
+
+    def test_amap_many__maps_regular_iterable(self):
+        users = [UserInfo("John", 35), {"name": "Jane"}]
+
+        results = asyncio.run(
+            collect(
+                self.mapper.to(PublicUserInfo).amap_many(
+                    users, fields_mapping={"name": "Anonymous"}
+                )
+            )
+        )
+
+        assert [r.name for r in results] == ["Anonymous", "Anonymous"]
+
+    def test_amap_many__other_tasks_run_between_chunks(self):
+        events: List[str] = []
+
+        async def mapping_task() -> None:
+            async for result in self.mapper.to(PublicUserInfo).amap_many(
+                [UserInfo(str(i), i) for i in range(4)], chunk_size=2
+            ):
+                events.append(result.name)
+
+        async def other_task() -> None:
+            events.append("other")
+
+        async def main() -> None:
+            await asyncio.gather(mapping_task(), other_task())
+
+        asyncio.run(main())
+
+        assert events == ["0", "1", "other", "2", "3"]
+
+    def test_amap_many__fails_for_not_registered_source_class(self):
+        with pytest.raises(MappingError):
+            asyncio.run(collect(self.mapper.amap_many(fetch_users(1))))
+
+    def test_amap_many__fails_on_wrong_chunk_size(self):
+        with pytest.raises(ValueError):
+            self.mapper.amap_many([], chunk_size=0)
+
+
+def test_import__asyncio_is_not_imported_with_package():
+    code = "import sys, automapper; print('asyncio' in sys.modules)"
+
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    ).stdout
+
+    assert output.strip() == "False"
@@ -0,0 +1,140 @@
+from typing import Any, Iterable, List, Optional, Type, TypeVar
+from unittest import TestCase
+
+import pytest
+from automapper import MappingError, create_mapper
+from automapper.codegen import generate_source
+from automapper.plan import MappingOptions, MappingPlan
+
+T = TypeVar("T")
+
+
+class Address:
+    def __init__(self, city: str, tags: List[str]) -> None:
+        self.city = city
+        self.tags = tags
+
+
+class PublicAddress:
+    def __init__(self, city: str, tags: List[str]) -> None:
+        self.city = city
+        self.tags = tags
+
+
+class UserInfo:
+    def __init__(self, name: str, age: Optional[int], address: Address) -> None:
+        self.name = name
+        self.age = age
+        self.address = address
+
+
+class PublicUserInfo:
+    def __init__(
+        self, name: str, age: Optional[int] = None, address: Any = None
+    ) -> None:
+        self.name = name
+        self.age = age
+        self.address = address
+
+
+class KwargsTarget:
+    def __init__(self, **kwargs: Any) -> None:
+        self.data = kwargs
+
+
+def kwargs_target_spec(target_cls: Type[T]) -> Iterable[str]:
+    return ["class", "first-name"]
+
+
+class CodegenTest(TestCase):
+    def setUp(self):
+        self.mapper = create_mapper(codegen=True)
+        self.mapper.add(UserInfo, PublicUserInfo)
+        self.mapper.add(Address, PublicAddress)
+        self.user = UserInfo("John", 35, Address("Kyiv", ["home"]))
+
+    def test_map__compiled_function_maps_nested_objects(self):
+        result: PublicUserInfo = self.mapper.map(self.user)
+
+        assert result.name == "John"
+        assert result.age == 35
+        assert isinstance(result.address, PublicAddress)
+        assert result.address.city == "Kyiv"
+        assert result.address.tags == ["home"]
+        assert result.address.tags is not self.user.address.tags
+        assert self.mapper._get_plan(UserInfo, PublicUserInfo).function is not None
+
+    def test_map__compiled_function_without_deepcopy(self):
+        result: PublicUserInfo = self.mapper.map(self.user, use_deepcopy=False)
+
+        assert result.address is self.user.address
+
+    def test_map__compiled_function_skips_none_values(self):
+        self.user.age = None
+
+        result: PublicUserInfo = self.mapper.map(self.user, skip_none_values=True)
+
+        assert result.age is None
+        assert "_kwargs" in self.mapper.generated_source(
+            UserInfo, skip_none_values=True
+        )
+
+    def test_map__custom_mapping_uses_generic_mapping(self):
+        result: PublicUserInfo = self.mapper.map(
+            self.user, fields_mapping={"name": "Jane"}
+        )
+
+        assert result.name == "Jane"
+
+    def test_map__dict_source_with_missing_key_falls_back_to_generic_mapping(self):
+        result = self.mapper.to(PublicUserInfo).map({"name": "John"})
+
+        assert result.name == "John"
+        assert result.age is None
+
+        result = self.mapper.to(PublicUserInfo).map({"name": "John", "age": 5})
+        assert result.age == 5
+
+    def test_map__field_names_that_are_not_keyword_arguments(self):
+        self.mapper.add_spec(KwargsTarget, kwargs_target_spec)
+
+        result = self.mapper.to(KwargsTarget).map({"class": 1, "first-name": "John"})
+
+        assert result.data == {"class": 1, "first-name": "John"}
+
+    def test_generated_source__straight_line_constructor_call(self):
+        source = self.mapper.generated_source(UserInfo)
+
+        assert "for " not in source
+        assert "_v0 = _obj.name" in source
+        assert "name=_v0 if type(_v0) in _immediate_types" in source
+        assert "age=" in source
+        assert "address=" in source
+
+    def test_generated_source__for_not_compiled_mapper(self):
+        mapper = create_mapper()
+
+        source = mapper.generated_source(UserInfo, PublicUserInfo, use_deepcopy=False)
+
+        assert "address=_v2" in source
+        assert (
+            mapper._get_plan(
+                UserInfo, PublicUserInfo, MappingOptions(use_deepcopy=False)
+            ).function
+            is None
+        )
+
+    def test_generated_source__fails_for_not_registered_source_class(self):
+        with pytest.raises(MappingError):
+            self.mapper.generated_source(KwargsTarget)
+
+
+def test_generate_source__reads_dict_items():
+    plan = MappingPlan(
+        dict, PublicAddress, ["city", "tags"], MappingOptions(use_deepcopy=False)
+    )
+
+    source = generate_source(plan)
+
+    assert "_v0 = _obj['city']" in source
+    assert "city=_v0," in source
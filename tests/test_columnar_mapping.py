@@ -0,0 +1,243 @@
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+import pytest
+from automapper import CircularReferenceError, MappingError, create_mapper
+from automapper.columnar import ColumnBatch
+
+
+class UserInfo:
+    def __init__(self, name: str, age: Optional[int], tags: List[str]):
+        self.name = name
+        self.age = age
+        self.tags = tags
+
+
+class AdminInfo(UserInfo):
+    pass
+
+
+class PublicUserInfo:
+    created = 0
+
+    def __init__(self, name: str, age: int = 18, tags: Optional[List[str]] = None):
+        PublicUserInfo.created += 1
+        self.name = name
+        self.age = age
+        self.tags = tags
+
+
+@dataclass
+class UserData:
+    name: str
+    age: int
+    tags: List[str] = field(default_factory=list)
+
+
+def create_users() -> List[UserInfo]:
+    return [UserInfo("John", 30, ["a"]), UserInfo("Mary", None, [])]
+
+
+@pytest.fixture(params=[False, True], ids=["generic", "codegen"])
+def mapper(request):
+    mapper = create_mapper(codegen=request.param)
+    mapper.add(UserInfo, PublicUserInfo)
+    PublicUserInfo.created = 0
+    return mapper
+
+
+def test_map_columns__fields_are_mapped_into_lists(mapper):
+    users = create_users()
+
+    columns = mapper.map_columns(users)
+
+    assert columns == {
+        "name": ["John", "Mary"],
+        "age": [30, None],
+        "tags": [["a"], []],
+    }
+    assert columns["tags"][0] is not users[0].tags
+    assert PublicUserInfo.created == 0
+
+
+def test_map_columns__skipped_values_get_default_values(mapper):
+    columns = mapper.map_columns(create_users(), skip_none_values=True)
+    data_columns = mapper.to(UserData).map_columns(
+        [{"name": "John", "age": 30, "tags": None}, {"name": "Mary", "age": 25}],
+        skip_none_values=True,
+    )
+    custom_columns = mapper.to(UserData).map_columns(
+        [{"name": "John", "age": 30}], fields_mapping={"age": lambda obj: None}
+    )
+
+    assert columns["age"] == [30, 18]
+    assert data_columns == {"name": ["John", "Mary"], "age": [30, 25], "tags": [[], []]}
+    assert data_columns["tags"][0] is not data_columns["tags"][1]
+    assert custom_columns == {"name": ["John"], "age": [None], "tags": [[]]}
+
+
+def test_map_columns__typecodes_create_arrays(mapper):
+    users = [UserInfo(f"user{index}", index, []) for index in range(3)]
+
+    columns = mapper.to(UserData).map_columns(users, typecodes={"age": "i"})
+
+    assert columns["age"] == array("i", [0, 1, 2])
+    assert isinstance(columns["name"], list)
+
+
+def test_map_columns__typecodes_of_unknown_fields_raise_error(mapper):
+    with pytest.raises(ValueError):
+        mapper.map_columns(create_users(), typecodes={"email": "u"})
+
+
+def test_map_columns__empty_batch(mapper):
+    assert mapper.map_columns([]) == {}
+    assert mapper.to(UserData).map_columns([]) == {"name": [], "age": [], "tags": []}
+
+
+def test_map_columns__objects_mapped_to_different_classes_raise_error(mapper):
+    mapper.add(AdminInfo, UserData)
+
+    with pytest.raises(MappingError):
+        mapper.map_columns([UserInfo("John", 30, []), AdminInfo("Mary", 25, [])])
+    with pytest.raises(MappingError):
+        mapper.map_columns([object()])
+
+
+def test_map_columns__circular_references_raise_error(mapper):
+    tags: List[Any] = []
+    tags.append(tags)
+
+    with pytest.raises(CircularReferenceError):
+        mapper.map_columns([UserInfo("John", 30, tags)])
+
+
+def test_map_columns__numpy_structured_array_is_created(mapper):
+    numpy = pytest.importorskip("numpy")
+    values: List[Dict[str, Any]] = [
+        {"name": "John", "age": 30, "tags": []},
+        {"name": "Mary", "age": 25, "tags": ["a", "b"]},
+    ]
+
+    result = mapper.to(UserData).map_columns(
+        values, typecodes={"age": "i"}, as_numpy=True
+    )
+
+    assert result.dtype.names == ("name", "age", "tags")
+    assert result["age"].dtype == numpy.dtype("i")
+    assert list(result["name"]) == ["John", "Mary"]
+    assert result["tags"][1] == ["a", "b"]
+
+
+def test_map_many__column_batch_is_mapped_without_row_objects(mapper):
+    tags = [["a"], []]
+    batch = ColumnBatch({"name": ["John", "Mary"], "age": [30, 25], "tags": tags})
+
+    results = mapper.to(PublicUserInfo).map_many(batch, as_list=True)
+
+    assert len(batch) == 2
+    assert [vars(result) for result in results] == [
+        {"name": "John", "age": 30, "tags": ["a"]},
+        {"name": "Mary", "age": 25, "tags": []},
+    ]
+    assert results[0].tags is not tags[0]
+
+
+def test_map_many__missing_and_skipped_column_values_get_default_values(mapper):
+    batch = ColumnBatch({"name": ["John", "Mary"], "tags": [None, ["a"]]})
+
+    results = mapper.to(PublicUserInfo).map_many(
+        batch, skip_none_values=True, use_deepcopy=False, as_list=True
+    )
+    data: List[UserData] = mapper.to(UserData).map_many(
+        ColumnBatch({"name": ["John"], "age": [30]}), use_deepcopy=False, as_list=True
+    )
+
+    assert [(result.age, result.tags) for result in results] == [
+        (18, None),
+        (18, ["a"]),
+    ]
+    assert data == [UserData("John", 30)]
+
+
+def test_map_many__fields_mapping_of_column_batch_receives_records(mapper):
+    batch = ColumnBatch({"first_name": ["John"], "last_name": ["Cusack"]})
+
+    results = mapper.to(PublicUserInfo).map_many(
+        batch,
+        fields_mapping={
+            "name": lambda record: f"{record['first_name']} {record['last_name']}",
+            "age": 50,
+        },
+        as_list=True,
+    )
+
+    assert (results[0].name, results[0].age) == ("John Cusack", 50)
+
+
+def test_map_many__references_are_preserved_per_record(mapper):
+    tags = ["a"]
+    batch = ColumnBatch(
+        {"name": ["John", "Mary"], "age": [tags, tags], "tags": [tags, tags]}
+    )
+
+    results = mapper.to(PublicUserInfo).map_many(
+        batch, preserve_references=True, as_list=True
+    )
+
+    assert results[0].age is results[0].tags
+    assert results[0].tags is not results[1].tags
+
+
+def test_map_many__column_batch_is_mapped_on_executor_as_records(mapper):
+    batch = ColumnBatch({"name": ["John", "Mary"], "age": [30, 25], "tags": [[], []]})
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = mapper.to(UserData).map_many(
+            batch, executor=executor, chunk_size=1, as_list=True
+        )
+
+    assert list(batch)[0] == {"name": "John", "age": 30, "tags": []}
+    assert results == [UserData("John", 30), UserData("Mary", 25)]
+
+
+def test_map_many__column_batch_errors(mapper):
+    with pytest.raises(ValueError):
+        ColumnBatch({"name": ["John"], "age": []})
+    with pytest.raises(MappingError):
+        mapper.map_many(ColumnBatch({"name": ["John"]}), as_list=True)
+
+
+@pytest.mark.parametrize(
+    "registration",
+    [
+        {"fields_mapping": {"age": lambda user: 0}},
+        {"copy_policies": {"tags": "reference"}},
+        {"trusted": True},
+    ],
+    ids=["fields_mapping", "copy_policies", "trusted"],
+)
+def test_map_many__column_batch_ignores_registered_configuration(mapper, registration):
+    tags = ["a"]
+    batch = ColumnBatch({"name": ["John"], "age": [30], "tags": [tags]})
+    mapper.add(AdminInfo, UserData, **registration)
+
+    result = mapper.to(UserData).map_many(batch, as_list=True)[0]
+    record_result = mapper.to(UserData).map({"name": "John", "age": 30, "tags": tags})
+
+    assert result == record_result == UserData("John", 30, ["a"])
+    assert result.tags is not tags
+
+
+def test_map_many__numpy_record_array_is_mapped(mapper):
+    numpy = pytest.importorskip("numpy")
+    records = numpy.array(
+        [("John", 30), ("Mary", 25)], dtype=[("name", "U10"), ("age", "i4")]
+    )
+
+    results = mapper.to(UserData).map_many(ColumnBatch(records), as_list=True)
+
+    assert results == [UserData("John", 30), UserData("Mary", 25)]
+    assert type(results[0].age) is int
@@ -0,0 +1,247 @@
+import pickle
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Dict, List, Optional
+from uuid import uuid4
+
+from automapper import create_mapper
+from automapper.copier import Copier
+
+
+class Color(Enum):
+    RED = "red"
+
+
+@dataclass
+class Item:
+    name: str
+    tags: List[str]
+    created: datetime = field(default_factory=datetime.now)
+    parent: Optional["Item"] = None
+
+
+@dataclass(frozen=True)
+class FrozenItem:
+    name: str
+    tags: List[str]
+
+
+@dataclass
+class SlottedItem:
+    __slots__ = ("name", "tags")
+    name: str
+    tags: List[str]
+
+
+@dataclass
+class ItemWithDeepcopy:
+    name: str
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "ItemWithDeepcopy":
+        return ItemWithDeepcopy("deepcopied")
+
+
+@dataclass
+class TagList(List[str]):
+    name: str = ""
+
+
+@dataclass(frozen=True)
+class Counts(Dict[str, List[int]]):
+    name: str = ""
+
+
+class Box:
+    def __init__(self, items: List[Any]):
+        self.items = items
+
+
+class Order:
+    def __init__(self, item: Item, box: Box):
+        self.item = item
+        self.box = box
+
+
+def test_copy__immutable_objects_are_shared():
+    copier = Copier()
+
+    for obj in [datetime.now(), Decimal("1.5"), uuid4(), Color.RED, "text", None]:
+        assert copier.copy(obj) is obj
+
+
+def test_copy__tuple_and_frozenset_of_immutables_are_shared():
+    copier = Copier()
+    values = (1, "a", (2, 3))
+    frozen = frozenset({"a", "b"})
+
+    assert copier.copy(values) is values
+    assert copier.copy(frozen) is frozen
+
+
+def test_copy__tuple_with_mutable_items_is_copied():
+    copier = Copier()
+    values = (1, [2, 3])
+
+    result = copier.copy(values)
+
+    assert result == values
+    assert result is not values
+    assert result[1] is not values[1]
+
+
+def test_copy__collections_are_copied_deeply():
+    copier = Copier()
+    shared: List[Any] = [bytearray(b"ab")]
+    source: Dict[str, Any] = {
+        "a": shared,
+        "b": shared,
+        "c": {1, 2},
+        "d": frozenset({(1, 2)}),
+    }
+
+    result = copier.copy(source)
+
+    assert result == source
+    assert result["a"] is not shared
+    assert result["a"] is result["b"]
+    assert result["a"][0] is not shared[0]
+    assert result["c"] is not source["c"]
+
+
+def test_copy__circular_references_are_preserved():
+    copier = Copier()
+    source: List[Any] = [1]
+    source.append(source)
+
+    result = copier.copy(source)
+
+    assert result is not source
+    assert result[1] is result
+
+
+def test_copy__dataclass_is_copied_field_by_field():
+    copier = Copier()
+    parent = Item("parent", ["p"])
+    item = Item("child", ["a", "b"], parent=parent)
+
+    result = copier.copy(item)
+
+    assert result == item
+    assert result is not item
+    assert result.tags is not item.tags
+    assert result.created is item.created
+    assert result.parent is not parent
+    assert copier._resolved[Item] == copier._copy_object
+
+
+def test_copy__frozen_and_slotted_dataclasses():
+    copier = Copier()
+    frozen = FrozenItem("frozen", ["a"])
+    slotted = SlottedItem("slotted", ["b"])
+
+    frozen_copy = copier.copy(frozen)
+    slotted_copy = copier.copy(slotted)
+
+    assert frozen_copy == frozen
+    assert frozen_copy.tags is not frozen.tags
+    assert slotted_copy.name == "slotted"
+    assert slotted_copy.tags == ["b"]
+    assert slotted_copy.tags is not slotted.tags
+
+
+def test_copy__dataclass_with_custom_deepcopy_uses_deepcopy():
+    assert Copier().copy(ItemWithDeepcopy("original")).name == "deepcopied"
+
+
+def test_copy__dataclasses_of_builtin_types_keep_items():
+    copier = Copier()
+    tags = TagList("tags")
+    tags.extend(["a", "b"])
+    counts = Counts("counts")
+    counts["a"] = [1]
+
+    tags_copy = copier.copy(tags)
+    counts_copy = copier.copy(counts)
+    result = create_mapper().to(Order).map(Order(Item("a", tags), Box([])))
+
+    assert (tags_copy.name, tags_copy) == ("tags", ["a", "b"])
+    assert tags_copy is not tags
+    assert (counts_copy.name, counts_copy) == ("counts", {"a": [1]})
+    assert counts_copy["a"] is not counts["a"]
+    assert not copier.is_immutable(counts)
+    result_tags: Any = result.item.tags
+    assert (result_tags.name, result_tags) == ("tags", ["a", "b"])
+
+
+def test_copy__other_objects_are_deepcopied():
+    box = Box([Item("a", [])])
+
+    result = Copier().copy(box)
+
+    assert result is not box
+    assert result.items[0] == box.items[0]
+    assert result.items[0] is not box.items[0]
+
+
+def test_register__copy_function_is_used_for_exact_type():
+    copier = Copier()
+    copier.register(Box, lambda obj, memo: Box(list(obj.items)))
+    box = Box([Item("a", [])])
+
+    result = copier.copy(box)
+
+    assert result.items is not box.items
+    assert result.items[0] is box.items[0]
+
+
+def share_box(obj: Box, memo: Any) -> Box:
+    return obj
+
+
+def test_pickle__registered_copy_functions_are_kept():
+    copier = Copier()
+    copier.register(Box, share_box)
+    box = Box([len, ...])
+    copier.copy(box.items)
+
+    restored: Copier = pickle.loads(pickle.dumps(copier))
+
+    assert restored.copy(box) is box
+    assert restored.copy(box.items) == box.items
+    assert restored.copy(box.items) is not box.items
+
+
+def test_add_copier__used_by_mapper_for_not_mapped_objects():
+    mapper = create_mapper()
+    mapper.add_copier(Box, lambda obj, memo: obj)
+    order = Order(Item("a", ["tag"]), Box([]))
+
+    result = mapper.to(Order).map(order)
+
+    assert result.box is order.box
+    assert result.item == order.item
+    assert result.item is not order.item
+
+
+@dataclass(frozen=True)
+class Tag:
+    name: str
+
+
+def test_copy__repeated_references_are_copied_once():
+    copier = Copier()
+    tags = {"a"}
+    pair = (1, ["b"])
+    frozen_tags = frozenset({Tag("c")})
+    data = bytearray(b"d")
+    item = Item("e", [])
+    source = [tags, tags, pair, pair, frozen_tags, frozen_tags, data, data, item, item]
+
+    result = copier.copy(source)
+
+    assert result == source
+    for index in range(0, len(source), 2):
+        assert result[index] is not source[index]
+        assert result[index] is result[index + 1]
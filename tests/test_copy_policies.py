@@ -0,0 +1,139 @@
+from typing import Any, Dict, List
+
+import pytest
+from automapper import MappingError, create_mapper
+
+
+class Attachment:
+    def __init__(self, name: str):
+        self.name = name
+
+
+class PublicAttachment:
+    def __init__(self, name: str):
+        self.name = name
+
+
+class Message:
+    def __init__(
+        self,
+        title: str,
+        payload: Dict[str, Any],
+        tags: List[List[str]],
+        attachment: Any,
+    ):
+        self.title = title
+        self.payload = payload
+        self.tags = tags
+        self.attachment = attachment
+
+
+class PublicMessage:
+    def __init__(
+        self,
+        title: str,
+        payload: Dict[str, Any],
+        tags: List[List[str]],
+        attachment: Any,
+    ):
+        self.title = title
+        self.payload = payload
+        self.tags = tags
+        self.attachment = attachment
+
+
+def create_message() -> Message:
+    return Message("hello", {"blob": [1, 2, 3]}, [["a"], ["b"]], Attachment("file"))
+
+
+@pytest.mark.parametrize("codegen", [False, True])
+def test_map__copy_policies_of_registered_fields(codegen):
+    mapper = create_mapper(codegen=codegen)
+    mapper.add(Attachment, PublicAttachment)
+    mapper.add(
+        Message,
+        PublicMessage,
+        copy_policies={"payload": "reference", "tags": "shallow", "attachment": "deep"},
+    )
+    message = create_message()
+
+    result: PublicMessage = mapper.map(message)
+
+    assert result.title == "hello"
+    assert result.payload is message.payload
+    assert result.tags == message.tags
+    assert result.tags is not message.tags
+    assert result.tags[0] is message.tags[0]
+    assert isinstance(result.attachment, Attachment)
+    assert result.attachment is not message.attachment
+
+
+@pytest.mark.parametrize("codegen", [False, True])
+def test_map__fields_without_copy_policy_follow_use_deepcopy(codegen):
+    mapper = create_mapper(codegen=codegen)
+    mapper.add(Attachment, PublicAttachment)
+    mapper.add(
+        Message,
+        PublicMessage,
+        copy_policies={"payload": "reference", "attachment": "map"},
+    )
+    message = create_message()
+
+    result: PublicMessage = mapper.map(message, use_deepcopy=False)
+
+    assert result.payload is message.payload
+    assert result.tags is message.tags
+    assert isinstance(result.attachment, PublicAttachment)
+
+
+def test_map__copy_policies_are_used_for_registered_target_class_only():
+    mapper = create_mapper()
+    mapper.add(Message, PublicMessage, copy_policies={"payload": "reference"})
+    message = create_message()
+
+    result: Message = mapper.to(Message).map(message)
+
+    assert result.payload == message.payload
+    assert result.payload is not message.payload
+
+
+def test_map_many__copy_policies_of_registered_fields():
+    mapper = create_mapper()
+    mapper.add(Message, PublicMessage, copy_policies={"payload": "reference"})
+    messages = [create_message(), create_message()]
+
+    results: List[PublicMessage] = mapper.map_many(messages, as_list=True)
+
+    for result, message in zip(results, messages):
+        assert result.payload is message.payload
+        assert result.tags is not message.tags
+
+
+def test_add__override_drops_copy_policies():
+    mapper = create_mapper()
+    mapper.add(Message, PublicMessage, copy_policies={"payload": "reference"})
+    message = create_message()
+    mapper.map(message)
+
+    mapper.add(Message, PublicMessage, override=True)
+    result: PublicMessage = mapper.map(message)
+
+    assert result.payload is not message.payload
+
+
+def test_add__unknown_copy_policy():
+    mapper = create_mapper()
+
+    with pytest.raises(ValueError):
+        mapper.add(Message, PublicMessage, copy_policies={"payload": "lazy"})  # type: ignore [dict-item]
+
+    assert Message not in mapper._mappings
+
+
+def test_add__copy_policy_of_unknown_field():
+    mapper = create_mapper()
+
+    with pytest.raises(MappingError, match="paylod"):
+        mapper.add(Message, PublicMessage, copy_policies={"paylod": "reference"})
+
+    assert Message not in mapper._mappings
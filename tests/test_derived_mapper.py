@@ -0,0 +1,141 @@
+from typing import Any, Dict, List
+
+from automapper import create_mapper
+
+
+class UserInfo:
+    def __init__(self, name: str, profession: str, tags: List[str]):
+        self.name = name
+        self.profession = profession
+        self.tags = tags
+
+
+class PublicUserInfo:
+    def __init__(self, name: str, tags: List[str]):
+        self.name = name
+        self.tags = tags
+
+
+class TenantUserInfo:
+    def __init__(self, name: str, profession: str):
+        self.name = name
+        self.profession = profession
+
+
+class Payload:
+    def __init__(self, data: Dict[str, Any]):
+        self.data = data
+
+
+class Document:
+    def __init__(self, payload: Payload):
+        self.payload = payload
+
+
+def create_user() -> UserInfo:
+    return UserInfo("John", "engineer", ["a"])
+
+
+def test_derive__shares_registrations_and_caches():
+    mapper = create_mapper()
+    mapper.add(UserInfo, PublicUserInfo)
+    mapper.map(create_user())
+
+    derived = mapper.derive()
+
+    assert derived._mappings is mapper._mappings
+    assert derived._plans is mapper._plans
+    assert isinstance(derived.map(create_user()), PublicUserInfo)
+
+
+def test_derive__registrations_of_derived_mapper_are_not_visible_in_parent():
+    mapper = create_mapper()
+    mapper.add(UserInfo, PublicUserInfo)
+    mapper.map(create_user())
+    derived = mapper.derive()
+
+    derived.add(UserInfo, TenantUserInfo, override=True)
+
+    assert isinstance(derived.map(create_user()), TenantUserInfo)
+    assert isinstance(mapper.map(create_user()), PublicUserInfo)
+    assert derived._mappings is not mapper._mappings
+    assert derived._plans is not mapper._plans
+    assert derived._fields is mapper._fields
+    assert derived._class_specs is mapper._class_specs
+
+
+def test_derive__registrations_of_parent_are_not_visible_in_derived_mapper():
+    mapper = create_mapper()
+    mapper.add(UserInfo, PublicUserInfo)
+    derived = mapper.derive()
+
+    mapper.add(UserInfo, TenantUserInfo, override=True)
+
+    assert isinstance(mapper.map(create_user()), TenantUserInfo)
+    assert isinstance(derived.map(create_user()), PublicUserInfo)
+
+
+def test_derive__registration_copies_only_changed_containers():
+    mapper = create_mapper()
+    mapper.add(UserInfo, PublicUserInfo)
+    mapper.map(create_user())
+    derived = mapper.derive()
+
+    derived.add_handler(Payload, lambda payload, map_child: payload)
+
+    assert derived._handlers is not mapper._handlers
+    assert derived._subobject_kinds is not mapper._subobject_kinds
+    for name in ("_mappings", "_plans", "_fields", "_class_specs", "_copier"):
+        assert getattr(derived, name) is getattr(mapper, name)
+
+
+def test_derive__plans_are_not_shared_after_registration_of_their_classes():
+    mapper = create_mapper()
+    mapper.add(UserInfo, PublicUserInfo, fields_mapping={"name": "UserInfo.profession"})
+    derived = mapper.derive()
+
+    derived.add(UserInfo, TenantUserInfo, override=True)
+    result: Any = mapper.map(create_user())
+
+    assert derived.to(PublicUserInfo).map(create_user()).name == "John"
+    assert result.name == "engineer"
+
+
+def test_derive__mappers_derived_from_derived_mapper():
+    mapper = create_mapper()
+    mapper.add(UserInfo, PublicUserInfo)
+    tenants = [mapper.derive() for _ in range(3)]
+    tenants[0].add(UserInfo, TenantUserInfo, override=True)
+    nested = tenants[0].derive()
+
+    nested.add_spec(Payload, lambda target_cls: ["data"])
+
+    assert isinstance(nested.map(create_user()), TenantUserInfo)
+    assert isinstance(tenants[1].map(create_user()), PublicUserInfo)
+    assert Payload not in tenants[0]._class_specs
+
+
+def test_derive__copiers_are_not_shared_after_registration():
+    mapper = create_mapper()
+    document = Document(Payload({"key": [1]}))
+    derived = mapper.derive()
+
+    derived.add_copier(Payload, lambda payload, memo: payload)
+
+    assert derived.to(Document).map(document).payload is document.payload
+    result = mapper.to(Document).map(document)
+    assert result.payload is not document.payload
+    assert result.payload.data == document.payload.data
+    assert result.payload.data["key"] is not document.payload.data["key"]
+
+
+def test_clear_caches__does_not_clear_caches_of_derived_mapper():
+    mapper = create_mapper()
+    mapper.add(UserInfo, PublicUserInfo)
+    mapper.map(create_user())
+    derived = mapper.derive()
+
+    derived.clear_caches()
+
+    assert not derived._plans
+    assert mapper._plans
@@ -0,0 +1,191 @@
+import sys
+from typing import Any, Dict, List, Optional
+
+import pytest
+from automapper import CircularReferenceError, create_mapper
+from automapper.lazy import LazyProxy
+
+DEPTH = sys.getrecursionlimit() * 2
+
+
+class Link:
+    def __init__(self, value: int, next: Optional["Link"], meta: Dict[str, Any]):
+        self.value = value
+        self.next = next
+        self.meta = meta
+
+
+class PublicLink:
+    def __init__(self, value: int, next: Optional["PublicLink"], meta: Dict[str, Any]):
+        self.value = value
+        self.next = next
+        self.meta = meta
+
+
+class Holder:
+    def __init__(self, items: Any):
+        self.items = items
+
+
+def create_chain(depth: int) -> Link:
+    head = None
+    for value in range(depth):
+        head = Link(value, head, {"tags": [value]})
+    assert head is not None
+    return head
+
+
+def chain_values(link: Any) -> List[int]:
+    values = []
+    while link is not None:
+        values.append(link.value)
+        link = link.next
+    return values
+
+
+@pytest.fixture
+def mapper():
+    mapper = create_mapper(iterative=True)
+    mapper.add(Link, PublicLink)
+    return mapper
+
+
+def test_map__deep_object_graph_is_mapped(mapper):
+    source = create_chain(DEPTH)
+
+    result: PublicLink = mapper.map(source)
+
+    assert isinstance(result, PublicLink)
+    assert isinstance(result.next, PublicLink)
+    assert chain_values(result) == list(reversed(range(DEPTH)))
+    assert result.meta == {"tags": [DEPTH - 1]}
+    assert result.meta["tags"] is not source.meta["tags"]
+
+
+def test_map__deep_object_graph_exceeds_recursion_limit_of_recursive_engine():
+    mapper = create_mapper()
+    mapper.add(Link, PublicLink)
+
+    with pytest.raises(RecursionError):
+        mapper.map(create_chain(DEPTH))
+
+
+def test_map__deeply_nested_collections_are_mapped(mapper):
+    items: List[Any] = [1, (2.0, "text", None), "end"]
+    for index in range(DEPTH):
+        items = [index, {"key": items}]
+
+    result = mapper.to(Holder).map(Holder(items))
+
+    mapped, source = result.items, items
+    while len(source) == 2:
+        assert mapped is not source
+        assert mapped[0] == source[0]
+        mapped, source = mapped[1]["key"], source[1]["key"]
+    assert mapped == [1, (2.0, "text", None), "end"]
+
+
+def test_map__results_are_same_as_recursive_engine(mapper):
+    recursive = create_mapper()
+    recursive.add(Link, PublicLink)
+    source = create_chain(10)
+
+    expected: PublicLink = recursive.map(source, share_immutable=True)
+    result = mapper.map(source, share_immutable=True)
+
+    assert chain_values(result) == chain_values(expected)
+    assert vars(result).keys() == vars(expected).keys()
+    assert result.meta == expected.meta
+
+
+class Settings:
+    def __init__(self, level: int):
+        self.level = level
+
+
+@pytest.mark.parametrize("share_immutable", [False, True])
+def test_map__child_objects_without_children_are_mapped_inline(mapper, share_immutable):
+    settings = Settings(1)
+    frozen = (1, "a")
+    values = {"flags": {"a": 1}, "codes": [1, 2], "frozen": frozen}
+    source = Holder([values, settings, Link(1, None, {"settings": settings})])
+
+    result = mapper.to(Holder).map(source, share_immutable=share_immutable)
+
+    items = result.items
+    assert items[0] == values
+    assert items[0]["flags"] is not values["flags"]
+    assert items[0]["codes"] is not values["codes"]
+    assert items[0]["frozen"] == frozen
+    assert (items[0]["frozen"] is frozen) == share_immutable
+    assert type(items[1]) is Settings
+    assert items[1] is not settings
+    assert items[2].meta["settings"].level == 1
+    assert mapper.map(Link(1, None, {})).meta == {}
+
+
+def test_map__circular_references_raise_error(mapper):
+    source = Link(1, None, {})
+    source.next = source
+    items: List[Any] = []
+    items.append(items)
+
+    with pytest.raises(CircularReferenceError):
+        mapper.map(source)
+    with pytest.raises(CircularReferenceError):
+        mapper.to(Holder).map(Holder(items))
+
+
+def test_map__circular_references_are_preserved(mapper):
+    source = Link(1, None, {})
+    source.next = Link(2, source, {})
+    source.meta["self"] = source.meta
+    items: List[Any] = [source.next]
+    items.append(items)
+
+    result: PublicLink = mapper.map(source, preserve_references=True)
+    holder = mapper.to(Holder).map(Holder(items), preserve_references=True)
+
+    assert result.next is not None
+    assert result.next.next is result
+    assert result.meta["self"] is result.meta
+    assert holder.items[1] is holder.items
+    assert holder.items[0].next.next is holder.items[0]
+
+
+def test_map__shared_child_objects_are_mapped_once(mapper):
+    tags = ("a", ["b"])
+    shared = Link(1, None, {"tags": tags})
+
+    result = mapper.to(Holder).map(
+        Holder([shared, shared, tags, tags]), preserve_references=True
+    )
+
+    assert result.items[0] is result.items[1]
+    assert result.items[2] is result.items[3] is result.items[0].meta["tags"]
+
+
+def test_map__lazy_child_objects_are_mapped_iteratively(mapper):
+    result: Any = mapper.map(create_chain(DEPTH), lazy=True)
+
+    assert type(result.next) is LazyProxy
+    assert result.next.value == DEPTH - 2
+    assert type(result.next.next) is LazyProxy
+
+
+def test_map_many__objects_are_mapped_iteratively(mapper):
+    results: List[PublicLink] = mapper.map_many(
+        [create_chain(3), create_chain(DEPTH)], as_list=True
+    )
+
+    assert chain_values(results[0]) == [2, 1, 0]
+    assert len(chain_values(results[1])) == DEPTH
+
+
+def test_map__iterative_engine_with_codegen_maps_deep_object_graph():
+    mapper = create_mapper(codegen=True, iterative=True)
+    mapper.add(Link, PublicLink)
+
+    result: PublicLink = mapper.map(create_chain(DEPTH))
+
+    assert len(chain_values(result)) == DEPTH
@@ -0,0 +1,202 @@
+import logging
+import sys
+from types import ModuleType
+from typing import Iterable, List, Type
+
+import pytest
+from automapper import Mapper, MappingError, create_mapper, mapper_initializer
+
+
+class LibraryModel:
+    def __init__(self, **kwargs: str) -> None:
+        self.data = kwargs
+
+
+class PlainClass:
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+
+def library_spec(target_cls: Type[LibraryModel]) -> Iterable[str]:
+    return ["text"]
+
+
+def create_extension(calls: List[Mapper]) -> ModuleType:
+    extension = ModuleType("fake_extension")
+
+    def extend(mapper: Mapper) -> None:
+        calls.append(mapper)
+        mapper.add_spec(LibraryModel, library_spec)
+
+    setattr(extension, "extend", extend)
+    return extension
+
+
+@pytest.fixture
+def calls(monkeypatch: pytest.MonkeyPatch) -> List[Mapper]:
+    calls: List[Mapper] = []
+    monkeypatch.setitem(sys.modules, "fake_extension", create_extension(calls))
+    return calls
+
+
+def test_create_mapper__library_extensions_are_lazy():
+    mapper = create_mapper()
+
+    assert set(mapper._lazy_extensions.values()) == {
+        "attr",
+        "pydantic",
+        "sqlalchemy",
+        "tortoise",
+    }
+    assert not mapper._class_specs
+
+
+def test_get_fields__extension_is_not_loaded_until_library_is_imported(
+    calls, monkeypatch
+):
+    mapper = Mapper()
+    mapper.add_lazy_extension("fake_library", "fake_extension")
+
+    with pytest.raises(MappingError):
+        mapper._get_fields(LibraryModel)
+    assert not calls
+
+    monkeypatch.setitem(sys.modules, "fake_library", ModuleType("fake_library"))
+
+    assert mapper._get_fields(LibraryModel) == ("text",)
+    assert calls == [mapper]
+    assert not mapper._lazy_extensions
+
+
+def test_get_fields__extension_is_loaded_once(calls, monkeypatch):
+    monkeypatch.setitem(sys.modules, "fake_library", ModuleType("fake_library"))
+    mapper = create_mapper()
+    mapper.add_lazy_extension("fake_library", "fake_extension")
+
+    assert mapper._get_fields(PlainClass) == ("text",)
+    result = mapper.to(LibraryModel).map(PlainClass("text"))
+
+    assert result.data == {"text": "text"}
+    assert calls == [mapper]
+
+
+def test_get_fields__extension_is_skipped_if_specs_were_added(calls, monkeypatch):
+    monkeypatch.setitem(sys.modules, "fake_library", ModuleType("fake_library"))
+    mapper = Mapper()
+    mapper.add_lazy_extension("fake_library", "fake_extension")
+    mapper.add_spec(LibraryModel, lambda target_cls: ["data"])
+
+    assert mapper._get_fields(LibraryModel) == ("data",)
+    assert calls == [mapper]
+
+
+def test_get_fields__failed_extension_is_logged(monkeypatch, caplog):
+    monkeypatch.setitem(sys.modules, "fake_library", ModuleType("fake_library"))
+    mapper = Mapper()
+    mapper.add_lazy_extension("fake_library", "missing_fake_extension")
+
+    with caplog.at_level(logging.ERROR, logger="automapper"):
+        with pytest.raises(MappingError):
+            mapper._get_fields(LibraryModel)
+
+    assert "could not load extension" in caplog.text
+    assert not mapper._lazy_extensions
+
+
+class FakeEntryPoint:
+    def __init__(self, name: str, value: str) -> None:
+        self.name = name
+        self.value = value
+
+
+class FakeEntryPoints:
+    def select(self, group: str) -> List[FakeEntryPoint]:
+        assert group == "py_automapper.extensions"
+        return [FakeEntryPoint("fake_library", "fake_extension:extend")]
+
+
+@pytest.fixture
+def fake_entry_points(monkeypatch):
+    monkeypatch.setattr(mapper_initializer, "entry_points", FakeEntryPoints)
+    mapper_initializer._lazy_extensions.cache_clear()
+    yield
+    mapper_initializer._lazy_extensions.cache_clear()
+
+
+def test_create_mapper__extensions_from_entry_points_are_lazy(
+    fake_entry_points, calls, monkeypatch
+):
+    mapper = create_mapper()
+
+    assert mapper._lazy_extensions["fake_extension"] == "fake_library"
+
+    monkeypatch.setitem(sys.modules, "fake_library", ModuleType("fake_library"))
+    assert mapper._get_fields(LibraryModel) == ("text",)
+    assert calls == [mapper]
+
+
+def test_create_mapper__extensions_of_one_library_are_all_registered(monkeypatch):
+    monkeypatch.setattr(
+        mapper_initializer,
+        "_entry_points_extensions",
+        lambda: (
+            ("fake_library", "fake_extension"),
+            ("fake_library", "other_fake_extension"),
+            ("pydantic", "fake_pydantic_extension"),
+        ),
+    )
+    mapper_initializer._lazy_extensions.cache_clear()
+    try:
+        mapper = create_mapper()
+    finally:
+        mapper_initializer._lazy_extensions.cache_clear()
+
+    assert mapper._lazy_extensions == {
+        "automapper.extensions.attrs": "attr",
+        "automapper.extensions.pydantic": "pydantic",
+        "automapper.extensions.sqlalchemy": "sqlalchemy",
+        "automapper.extensions.tortoise": "tortoise",
+        "fake_extension": "fake_library",
+        "other_fake_extension": "fake_library",
+        "fake_pydantic_extension": "pydantic",
+    }
+
+
+def test_create_mapper__entry_points_are_read_once(fake_entry_points, monkeypatch):
+    create_mapper()
+    monkeypatch.setattr(mapper_initializer, "entry_points", dict)
+
+    mapper = create_mapper()
+
+    assert "fake_extension" in mapper._lazy_extensions
+
+
+def test_create_mapper__entry_points_of_old_python_versions(monkeypatch):
+    monkeypatch.setattr(
+        mapper_initializer,
+        "entry_points",
+        lambda: {"py_automapper.extensions": [FakeEntryPoint("lib", "lib_ext")]},
+    )
+
+    assert mapper_initializer._entry_points_extensions() == (("lib", "lib_ext"),)
+
+
+def test_create_mapper__failed_entry_points_are_logged(monkeypatch, caplog):
+    def failing_entry_points() -> None:
+        raise RuntimeError("broken metadata")
+
+    monkeypatch.setattr(mapper_initializer, "entry_points", failing_entry_points)
+    mapper_initializer._lazy_extensions.cache_clear()
+    try:
+        with caplog.at_level(logging.ERROR, logger="automapper"):
+            mapper = create_mapper()
+    finally:
+        mapper_initializer._lazy_extensions.cache_clear()
+
+    assert "Could not read extensions from entry points" in caplog.text
+    assert set(mapper._lazy_extensions.values()) == {
+        "attr",
+        "pydantic",
+        "sqlalchemy",
+        "tortoise",
+    }
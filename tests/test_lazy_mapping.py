@@ -0,0 +1,302 @@
+import copy
+import json
+import operator
+import pickle
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Any, Dict, List, Tuple
+from uuid import UUID, uuid4
+
+import pytest
+from automapper import create_mapper
+from automapper.lazy import LazyProxy, unwrap
+
+
+class Line:
+    def __init__(self, sku: str, quantity: int):
+        self.sku = sku
+        self.quantity = quantity
+
+
+class PublicLine:
+    created = 0
+
+    def __init__(self, sku: str, quantity: int):
+        PublicLine.created += 1
+        self.sku = sku
+        self.quantity = quantity
+
+    def __eq__(self, other: Any) -> bool:
+        return bool(vars(self) == vars(other))
+
+    def __hash__(self) -> int:
+        return hash(self.sku)
+
+
+class Order:
+    def __init__(
+        self, number: str, lines: List[Line], meta: Dict[str, Any], main_line: Line
+    ):
+        self.number = number
+        self.lines = lines
+        self.meta = meta
+        self.main_line = main_line
+
+
+class PublicOrder:
+    def __init__(self, number: str, lines: Any, meta: Dict[str, Any], main_line: Any):
+        self.number = number
+        self.lines = lines
+        self.meta = meta
+        self.main_line = main_line
+
+
+def create_order() -> Order:
+    return Order(
+        "order-1",
+        [Line("a", 1), Line("b", 2)],
+        {"tags": ["x", "y"]},
+        Line("main", 3),
+    )
+
+
+@pytest.fixture
+def mapper():
+    mapper = create_mapper()
+    mapper.add(Line, PublicLine)
+    mapper.add(Order, PublicOrder)
+    PublicLine.created = 0
+    return mapper
+
+
+@pytest.mark.parametrize("codegen", [False, True])
+def test_map__lazy_child_objects_are_mapped_on_first_access(codegen):
+    mapper = create_mapper(codegen=codegen)
+    mapper.add(Line, PublicLine)
+    mapper.add(Order, PublicOrder)
+    PublicLine.created = 0
+
+    result: PublicOrder = mapper.map(create_order(), lazy=True)
+
+    assert result.number == "order-1"
+    assert type(result.lines) is LazyProxy
+    assert type(result.main_line) is LazyProxy
+    assert PublicLine.created == 0
+
+    assert result.main_line.sku == "main"
+    assert PublicLine.created == 1
+    assert len(result.lines) == 2
+    assert PublicLine.created == 1
+    assert [line.sku for line in result.lines] == ["a", "b"]
+    assert PublicLine.created == 3
+
+
+def test_map__lazy_proxy_memoizes_mapped_object(mapper):
+    result: PublicOrder = mapper.map(create_order(), lazy=True)
+
+    first = unwrap(result.main_line)
+
+    assert unwrap(result.main_line) is first
+    assert isinstance(result.main_line, PublicLine)
+    assert isinstance(first, PublicLine)
+    assert PublicLine.created == 1
+
+
+def test_map__lazy_proxy_forwards_operations(mapper):
+    order = create_order()
+    result: PublicOrder = mapper.map(order, lazy=True)
+
+    assert result.meta["tags"] == ["x", "y"]
+    assert "tags" in result.meta
+    assert list(reversed(result.meta["tags"])) == ["y", "x"]
+    assert result.meta["tags"] is not order.meta["tags"]
+    assert bool(result.lines)
+    assert str(result.meta) == repr(result.meta) == "{'tags': ['x', 'y']}"
+    assert result.main_line == PublicLine("main", 3)
+    assert result.main_line != PublicLine("other", 3)
+    assert hash(result.main_line) == hash("main")
+
+    result.meta["count"] = 1
+    del result.meta["tags"]
+    result.main_line.quantity = 10
+    del result.main_line.quantity
+    assert unwrap(result.meta) == {"count": 1}
+    assert not hasattr(unwrap(result.main_line), "quantity")
+
+
+def test_map__lazy_proxy_comparison_and_call():
+    proxy = LazyProxy(lambda: 5)
+
+    assert proxy < 6 and proxy <= 5 and proxy > 4 and proxy >= 5
+    assert LazyProxy(lambda: len)([1, 2]) == 2
+
+
+def test_map__lazy_proxy_is_copied_and_pickled_as_mapped_object(mapper):
+    result: PublicOrder = mapper.map(create_order(), lazy=True)
+
+    copied = copy.deepcopy(result.meta)
+    unpickled = pickle.loads(pickle.dumps(result.lines))
+
+    assert type(copied) is dict
+    assert copied == {"tags": ["x", "y"]}
+    assert type(unpickled) is list
+    assert [line.sku for line in unpickled] == ["a", "b"]
+
+
+def test_map__primitive_values_are_not_lazy(mapper):
+    result: PublicOrder = mapper.map(create_order(), lazy=True)
+
+    assert type(result.number) is str
+    assert unwrap(result.number) == "order-1"
+
+
+class Payment:
+    def __init__(
+        self, amount: Decimal, when: datetime, key: UUID, codes: Tuple[int, ...]
+    ):
+        self.amount = amount
+        self.when = when
+        self.key = key
+        self.codes = codes
+
+
+def test_map__immutable_values_are_not_lazy(mapper):
+    payment = Payment(Decimal("1.5"), datetime(2024, 1, 2), uuid4(), (1, 2))
+
+    result: Payment = mapper.to(Payment).map(payment, lazy=True)
+
+    assert type(result.amount) is Decimal
+    assert type(result.when) is datetime
+    assert type(result.key) is UUID
+    assert type(result.codes) is tuple
+    assert result.amount + 1 == Decimal("2.5")
+    assert result.when - datetime(2024, 1, 1) == timedelta(days=1)
+
+
+def test_map__lazy_proxy_numeric_operations():
+    proxy = LazyProxy(lambda: 6)
+
+    assert (proxy + 2, proxy - 2, proxy * 2, proxy / 4, proxy // 4) == (
+        8,
+        4,
+        12,
+        1.5,
+        1,
+    )
+    assert (proxy % 4, divmod(proxy, 4), proxy**2, pow(proxy, 2, 5)) == (
+        2,
+        (1, 2),
+        36,
+        1,
+    )
+    assert (proxy << 1, proxy >> 1, proxy & 3, proxy | 1, proxy ^ 3) == (12, 3, 2, 7, 5)
+    assert (2 + proxy, 2 - proxy, 2 * proxy, 3 / proxy, 13 // proxy) == (
+        8,
+        -4,
+        12,
+        0.5,
+        2,
+    )
+    assert (13 % proxy, divmod(13, proxy), 2**proxy) == (1, (2, 1), 64)
+    assert (1 << proxy, 128 >> proxy, 3 & proxy, 1 | proxy, 3 ^ proxy) == (
+        64,
+        2,
+        2,
+        7,
+        5,
+    )
+    assert (-proxy, +proxy, abs(LazyProxy(lambda: -6)), ~proxy) == (-6, 6, 6, -7)
+    assert (int(proxy), float(proxy), complex(proxy)) == (6, 6.0, 6 + 0j)
+    assert [0, 1, 2, 3, 4, 5, 6][proxy] == 6
+    assert round(LazyProxy(lambda: 1.26), 1) == 1.3
+    assert f"{proxy:03d}" == "006"
+
+
+def test_map__lazy_proxy_matrix_multiplication():
+    class Matrix:
+        def __init__(self, value: int):
+            self.value = value
+
+        def __matmul__(self, other: int) -> int:
+            return self.value * 10 + other
+
+        def __rmatmul__(self, other: int) -> int:
+            return other * 10 + self.value
+
+        def __imatmul__(self, other: int) -> "Matrix":
+            self.value = self @ other
+            return self
+
+    proxy: Any = LazyProxy(lambda: Matrix(1))
+
+    assert (proxy @ 2, 2 @ proxy) == (12, 21)
+    proxy @= 3
+    assert type(proxy) is LazyProxy
+    assert proxy.value == 13
+
+
+def test_map__lazy_proxy_sequence_operations(mapper):
+    order = create_order()
+    result: PublicOrder = mapper.map(order, lazy=True)
+    tags: Any = result.meta["tags"]
+
+    assert type(tags) is LazyProxy
+    assert tags + ["z"] == ["x", "y", "z"]
+    assert ["w"] + tags == ["w", "x", "y"]
+    assert tags * 2 == ["x", "y", "x", "y"]
+    assert 2 * tags == ["x", "y", "x", "y"]
+    assert json.dumps(result.meta, default=unwrap) == '{"tags": ["x", "y"]}'
+
+    tags += ["z"]
+    tags *= 1
+    assert type(tags) is LazyProxy
+    assert result.meta["tags"] == ["x", "y", "z"]
+    assert order.meta["tags"] == ["x", "y"]
+
+
+@pytest.mark.parametrize(
+    "operation, value, expected",
+    [
+        (operator.iadd, 1, 7),
+        (operator.isub, 2, 4),
+        (operator.imul, 4, 24),
+        (operator.itruediv, 4, 1.5),
+        (operator.ifloordiv, 4, 1),
+        (operator.imod, 4, 2),
+        (operator.ipow, 2, 36),
+        (operator.ilshift, 1, 12),
+        (operator.irshift, 1, 3),
+        (operator.iand, 3, 2),
+        (operator.ior, 1, 7),
+        (operator.ixor, 3, 5),
+    ],
+)
+def test_map__lazy_proxy_inplace_operations_of_immutable_objects(
+    operation, value, expected
+):
+    result = operation(LazyProxy(lambda: 6), value)
+
+    assert (type(result), result) == (type(expected), expected)
+
+
+def test_map__lazy_proxy_inplace_operations_of_mutable_objects():
+    codes: Any = LazyProxy(lambda: (1,))
+    codes += (2,)
+    flags: Any = LazyProxy(lambda: {1})
+    flags |= {2}
+    flags &= {2, 3}
+    flags ^= {4}
+    flags -= {4}
+
+    assert (type(codes), codes) == (tuple, (1, 2))
+    assert (type(flags), unwrap(flags)) == (LazyProxy, {2})
+
+
+def test_map_many__lazy_child_objects(mapper):
+    results: List[PublicOrder] = mapper.map_many(
+        [create_order(), create_order()], lazy=True, as_list=True
+    )
+
+    assert all(type(result.main_line) is LazyProxy for result in results)
+    assert PublicLine.created == 0
+    assert results[1].main_line.sku == "main"
@@ -0,0 +1,88 @@
+from types import GeneratorType
+from unittest import TestCase
+
+import pytest
+from automapper import MappingError, create_mapper
+
+
+class UserInfo:
+    def __init__(self, name: str, age: int, profession: str):
+        self.name = name
+        self.age = age
+        self.profession = profession
+
+
+class AdminInfo:
+    def __init__(self, name: str, level: int):
+        self.name = name
+        self.level = level
+
+
+class PublicUserInfo:
+    def __init__(self, full_name: str, profession: str):
+        self.full_name = full_name
+        self.profession = profession
+
+
+class PublicName:
+    def __init__(self, name: str):
+        self.name = name
+
+
+class MapManyTest(TestCase):
+    def setUp(self):
+        self.mapper = create_mapper()
+        self.users = [
+            UserInfo("John", 35, "engineer"),
+            UserInfo("Jane", 30, "doctor"),
+        ]
+
+    def test_map_many__returns_generator_of_registered_target_objects(self):
+        self.mapper.add(
+            UserInfo, PublicUserInfo, fields_mapping={"full_name": "UserInfo.name"}
+        )
+
+        results = self.mapper.map_many(self.users)
+
+        assert isinstance(results, GeneratorType)
+        results_list = list(results)
+        assert [r.full_name for r in results_list] == ["John", "Jane"]
+        assert [r.profession for r in results_list] == ["engineer", "doctor"]
+
+    def test_map_many__as_list_with_mixed_source_classes(self):
+        self.mapper.add(UserInfo, PublicName)
+        self.mapper.add(AdminInfo, PublicName)
+
+        results = self.mapper.map_many(
+            [self.users[0], AdminInfo("Root", 10), self.users[1]], as_list=True
+        )
+
+        assert isinstance(results, list)
+        assert [r.name for r in results] == ["John", "Root", "Jane"]
+        assert len(self.mapper._plans) == 2
+
+    def test_map_many__custom_mapping_has_priority(self):
+        self.mapper.add(
+            UserInfo, PublicUserInfo, fields_mapping={"full_name": "UserInfo.name"}
+        )
+
+        results = self.mapper.map_many(
+            self.users, fields_mapping={"full_name": "Anonymous"}, as_list=True
+        )
+
+        assert [r.full_name for r in results] == ["Anonymous", "Anonymous"]
+
+    def test_map_many__fails_for_not_registered_source_class(self):
+        with pytest.raises(MappingError):
+            self.mapper.map_many(self.users, as_list=True)
+
+    def test_to_map_many__maps_into_target_class(self):
+        results = self.mapper.to(PublicName).map_many(
+            iter(self.users + [{"name": "Bob"}]), as_list=True
+        )
+
+        assert [r.name for r in results] == ["John", "Jane", "Bob"]
+        assert all(isinstance(r, PublicName) for r in results)
+
+    def test_to_map_many__empty_input(self):
+        assert list(self.mapper.to(PublicName).map_many([])) == []
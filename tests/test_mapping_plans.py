@@ -0,0 +1,78 @@
+from typing import Iterable, Type, TypeVar
+from unittest import TestCase
+
+from automapper import create_mapper
+from automapper.plan import ATTRIBUTE, ITEM, MappingOptions, MappingPlan
+
+T = TypeVar("T")
+
+
+class UserInfo:
+    def __init__(self, name: str, age: int, profession: str):
+        self.name = name
+        self.age = age
+        self.profession = profession
+
+
+class PublicUserInfo:
+    def __init__(self, name: str, profession: str):
+        self.name = name
+        self.profession = profession
+
+
+def name_only_spec_func(target_cls: Type[T]) -> Iterable[str]:
+    return ["name"]
+
+
+def test_mapping_plan__dict_source_reads_items():
+    plan = MappingPlan(dict, PublicUserInfo, ["name", "items"])
+
+    assert plan.fields == (("name", ITEM), ("items", ATTRIBUTE))
+
+
+def test_mapping_plan__object_source_reads_attributes():
+    plan = MappingPlan(UserInfo, PublicUserInfo, ["name", "profession"])
+
+    assert plan.fields == (("name", ATTRIBUTE), ("profession", ATTRIBUTE))
+    assert not plan.subscriptable
+
+
+class MappingPlanCacheTest(TestCase):
+    def setUp(self):
+        self.mapper = create_mapper()
+
+    def test_map__plan_is_built_once_per_classes_and_options(self):
+        self.mapper.to(PublicUserInfo).map(UserInfo("John", 35, "engineer"))
+        plan = self.mapper._get_plan(UserInfo, PublicUserInfo)
+
+        result = self.mapper.to(PublicUserInfo).map(UserInfo("Jane", 30, "doctor"))
+
+        assert self.mapper._get_plan(UserInfo, PublicUserInfo) is plan
+        assert len(self.mapper._plans) == 1
+        assert result.name == "Jane"
+        assert result.profession == "doctor"
+
+        self.mapper.to(PublicUserInfo).map(
+            UserInfo("Jane", 30, "doctor"), use_deepcopy=False
+        )
+        assert len(self.mapper._plans) == 2
+
+    def test_add_spec__drops_plans_of_affected_target_classes(self):
+        self.mapper.to(PublicUserInfo).map(UserInfo("John", 35, "engineer"))
+        self.mapper.to(UserInfo).map(UserInfo("John", 35, "engineer"))
+
+        self.mapper.add_spec(PublicUserInfo, name_only_spec_func)
+
+        assert len(self.mapper._plans) == 1
+        assert (UserInfo, UserInfo, MappingOptions()) in self.mapper._plans
+        with self.assertRaises(TypeError):
+            # `profession` is not mapped anymore
+            self.mapper.to(PublicUserInfo).map(UserInfo("John", 35, "engineer"))
+
+    def test_add__drops_plans_of_source_class(self):
+        self.mapper.to(PublicUserInfo).map(UserInfo("John", 35, "engineer"))
+        self.mapper.to(PublicUserInfo).map({"name": "John", "profession": "hero"})
+
+        self.mapper.add(UserInfo, PublicUserInfo)
+
+        assert list(self.mapper._plans) == [(dict, PublicUserInfo, MappingOptions())]
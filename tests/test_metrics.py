@@ -0,0 +1,202 @@
+import copy
+import pickle
+from typing import Any, List, Tuple
+
+import pytest
+from automapper import CircularReferenceError, create_mapper
+from automapper.metrics import MappingHook, MetricsCollector, PairMetrics
+
+
+class Settings:
+    def __init__(self, level: int):
+        self.level = level
+
+
+class Address:
+    def __init__(self, city: str):
+        self.city = city
+
+
+class PublicAddress:
+    def __init__(self, city: str):
+        self.city = city
+
+
+class Person:
+    def __init__(self, name: str, address: Any, settings: Any = None):
+        self.name = name
+        self.address = address
+        self.settings = settings
+
+
+class PublicPerson:
+    def __init__(self, name: str, address: Any, settings: Any = None):
+        self.name = name
+        self.address = address
+        self.settings = settings
+
+
+class RecordingHook(MappingHook):
+    def __init__(self) -> None:
+        self.events: List[Tuple[Any, ...]] = []
+
+    def on_map_start(self, source_cls: type, target_cls: type) -> None:
+        self.events.append(("start", source_cls.__name__))
+
+    def on_map_end(
+        self,
+        source_cls: type,
+        target_cls: type,
+        fields_count: int,
+        elapsed: float,
+        failed: bool,
+    ) -> None:
+        self.events.append(("end", source_cls.__name__, fields_count, failed))
+
+
+@pytest.fixture(
+    params=[{}, {"codegen": True}, {"iterative": True}],
+    ids=["generic", "codegen", "iterative"],
+)
+def mapper(request):
+    mapper = create_mapper(**request.param)
+    mapper.add(Person, PublicPerson)
+    mapper.add(Address, PublicAddress)
+    return mapper
+
+
+def test_add_hook__metrics_are_collected_per_mapping_pair(mapper):
+    collector = MetricsCollector()
+    mapper.add_hook(collector)
+
+    for _ in range(3):
+        mapper.map(Person("John", Address("Kyiv"), Settings(1)))
+    snapshot = collector.snapshot()
+
+    person_metrics = snapshot.pairs[(Person, PublicPerson)]
+    address_metrics = snapshot.pairs[(Address, PublicAddress)]
+    assert (person_metrics.calls, address_metrics.calls) == (3, 3)
+    assert person_metrics.fields_copied == 9
+    assert person_metrics.deepcopy_fallbacks == 3
+    assert address_metrics.deepcopy_fallbacks == 0
+    assert snapshot.deepcopy_types == {Settings: 3}
+    assert person_metrics.total_time >= address_metrics.total_time > 0
+    assert 0 < person_metrics.p50 <= person_metrics.p90 <= person_metrics.p99
+    assert person_metrics.mean_time == person_metrics.total_time / 3
+    assert (person_metrics.plan_cache_hits, person_metrics.plan_cache_misses) == (
+        2,
+        1,
+    )
+    assert person_metrics.plan_cache_hit_rate == 2 / 3
+
+
+def test_add_hook__hooks_see_nested_mappings_and_errors(mapper):
+    hook = RecordingHook()
+    mapper.add_hook(hook)
+    mapper.add_hook(hook)
+    person = Person("John", Address("Kyiv"))
+
+    mapper.map(person)
+    person.address.city = person
+    with pytest.raises(CircularReferenceError):
+        mapper.map(person)
+
+    assert hook.events == [
+        ("start", "Person"),
+        ("start", "Address"),
+        ("end", "Address", 1, False),
+        ("end", "Person", 3, False),
+        ("start", "Person"),
+        ("start", "Address"),
+        ("end", "Address", 0, True),
+        ("end", "Person", 0, True),
+    ]
+
+
+def test_add_hook__copied_objects_are_not_reported_as_fallbacks(mapper):
+    collector = MetricsCollector()
+    mapper.add_hook(collector)
+
+    mapper.map(Person("John", Address("Kyiv"), {"level": [1]}))
+    mapper.map(Person("John", Address("Kyiv")), preserve_references=True)
+
+    snapshot = collector.snapshot()
+    assert snapshot.pairs[(Person, PublicPerson)].deepcopy_fallbacks == 0
+    assert snapshot.deepcopy_types == {}
+
+
+def test_add_hook__only_mapped_values_are_counted(mapper):
+    collector = MetricsCollector()
+    mapper.add_hook(collector)
+    address = Address("Kyiv")
+
+    mapper.map(Person("John", Address("Kyiv")), skip_none_values=True)
+    mapper.to(PublicPerson).map({"name": "John", "address": "Kyiv"})
+    mapper.map(Person("John", address, address), preserve_references=True)
+    snapshot = collector.snapshot()
+
+    assert snapshot.pairs[(Person, PublicPerson)].fields_copied == 5
+    assert snapshot.pairs[(dict, PublicPerson)].fields_copied == 2
+    assert snapshot.pairs[(Address, PublicAddress)].fields_copied == 2
+
+
+def test_remove_hook__mappings_are_not_measured_without_hooks(mapper):
+    collector = MetricsCollector()
+    mapper.add_hook(collector)
+    derived = mapper.derive()
+    mapper.remove_hook(collector)
+
+    mapper.map(Person("John", Address("Kyiv")))
+    derived.map(Address("Kyiv"))
+
+    assert list(collector.snapshot().pairs) == [(Address, PublicAddress)]
+    with pytest.raises(ValueError):
+        mapper.remove_hook(collector)
+
+
+def test_snapshot__metrics_are_exported_and_reset():
+    mapper = create_mapper()
+    mapper.add(Address, PublicAddress)
+    collector = MetricsCollector(samples_count=2)
+    mapper.add_hook(collector)
+    for city in ("Kyiv", "Lviv", "Odesa"):
+        mapper.map(Address(city))
+
+    snapshot = collector.snapshot()
+    collector.reset()
+
+    metrics: PairMetrics = snapshot.pairs[(Address, PublicAddress)]
+    assert metrics.calls == 3
+    assert snapshot.as_dicts() == [
+        {
+            "source": f"{__name__}.Address",
+            "target": f"{__name__}.PublicAddress",
+            **metrics._asdict(),
+            "mean_time": metrics.mean_time,
+            "plan_cache_hit_rate": metrics.plan_cache_hit_rate,
+        }
+    ]
+    assert collector.snapshot().pairs == {}
+    with pytest.raises(ValueError):
+        MetricsCollector(samples_count=0)
+
+
+def test_snapshot__empty_metrics():
+    metrics = PairMetrics(0, 0, 0.0, 0.0, 0.0, 0.0, 0, 0, 0, 0)
+
+    assert (metrics.mean_time, metrics.plan_cache_hit_rate) == (0.0, 0.0)
+
+
+def test_add_hook__hooks_are_not_copied_with_mapper():
+    mapper = create_mapper()
+    mapper.add(Address, PublicAddress)
+    collector = MetricsCollector()
+    mapper.add_hook(collector)
+
+    restored = copy.deepcopy(mapper)
+    exported: Any = pickle.loads(pickle.dumps(collector.snapshot()))
+    result: Any = restored.map(Address("Kyiv"))
+
+    assert result.city == "Kyiv"
+    assert restored._hooks == ()
+    assert exported == collector.snapshot()
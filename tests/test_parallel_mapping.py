@@ -0,0 +1,112 @@
+import multiprocessing
+import subprocess
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, List
+from unittest import TestCase
+
+import pytest
+from automapper import create_mapper
+
+
+class Address:
+    def __init__(self, city: str, zip_code: int):
+        self.city = city
+        self.zip_code = zip_code
+
+
+class UserInfo:
+    def __init__(self, name: str, age: int, addresses: List[Address]):
+        self.name = name
+        self.age = age
+        self.addresses = addresses
+
+
+class PublicUserInfo:
+    def __init__(self, name: str, addresses: List[Address]):
+        self.name = name
+        self.addresses = addresses
+
+
+class ParallelMappingTest(TestCase):
+    def setUp(self):
+        self.mapper = create_mapper()
+        self.mapper.add(UserInfo, PublicUserInfo)
+        self.users = [
+            UserInfo(f"user_{i}", i, [Address(f"city_{i}", i)]) for i in range(25)
+        ]
+
+    def assert_mapped(self, results: List[PublicUserInfo]) -> None:
+        assert [r.name for r in results] == [u.name for u in self.users]
+        assert all(isinstance(r, PublicUserInfo) for r in results)
+        assert [r.addresses[0].city for r in results] == [
+            u.addresses[0].city for u in self.users
+        ]
+
+    def test_map_many__on_process_pool(self):
+        results = self.mapper.map_many(
+            self.users, workers=2, chunk_size=4, as_list=True
+        )
+
+        self.assert_mapped(results)
+        assert results[-1].addresses[0] is not self.users[-1].addresses[0]
+
+    def test_map_many__on_process_pool_with_compiled_plans(self):
+        mapper = create_mapper(codegen=True)
+
+        results = mapper.to(PublicUserInfo).map_many(
+            self.users, workers=2, chunk_size=10, as_list=True
+        )
+
+        self.assert_mapped(results)
+
+    def test_map_many__on_process_pool_with_empty_input(self):
+        assert self.mapper.map_many([], workers=2, as_list=True) == []
+
+    def test_map_many__on_spawned_process_pool(self):
+        # spawned processes receive pickled mapper, unlike forked ones
+        addresses: List[Any] = self.users[0].addresses
+        addresses.append(len)
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=2, mp_context=context) as executor:
+            results = self.mapper.map_many(
+                self.users, executor=executor, chunk_size=10, as_list=True
+            )
+
+        self.assert_mapped(results)
+        assert results[0].addresses[1] is len
+
+    def test_map_many__on_provided_executor(self):
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = self.mapper.to(PublicUserInfo).map_many(
+                self.users, executor=executor, chunk_size=3, as_list=True
+            )
+
+        self.assert_mapped(results)
+
+    def test_map_many__unordered_returns_all_objects(self):
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            results = self.mapper.map_many(
+                self.users,
+                executor=executor,
+                workers=1,
+                chunk_size=2,
+                ordered=False,
+                as_list=True,
+            )
+
+        assert sorted(r.name for r in results) == sorted(u.name for u in self.users)
+
+    def test_map_many__fails_on_wrong_chunk_size(self):
+        with pytest.raises(ValueError):
+            self.mapper.map_many(self.users, workers=2, chunk_size=0)
+
+
+def test_import__process_pool_is_not_imported_with_package():
+    code = "import sys, automapper; print('concurrent.futures.process' in sys.modules)"
+
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    ).stdout
+
+    assert output.strip() == "False"
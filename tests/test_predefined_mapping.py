@@ -1,3 +1,4 @@
+from abc import ABC
 from typing import Any, Iterable, Optional, Protocol, Type, TypeVar, cast
 from unittest import TestCase
 
@@ -44,6 +45,18 @@ class ClassWithFieldsMethodProtocol(Protocol):
     def fields(self) -> Iterable[str]: ...
 
 
+class AbstractRecord(ABC):
+    pass
+
+
+class VirtualRecord:
+    def __init__(self, text: str) -> None:
+        self.text = text
+
+
+AbstractRecord.register(VirtualRecord)
+
+
 def custom_spec_func(concrete_class: Type[T]) -> Iterable[str]:
     fields = []
     for val_name in concrete_class.__init__.__annotations__:
@@ -138,3 +151,87 @@ class AutomapperTest(TestCase):
         assert "num" in obj.data
         assert obj.data.get("text") is None
         assert obj.data.get("num") == 11
+
+    def test_get_fields__spec_of_closest_base_class_is_used(self):
+        self.mapper.add_spec(ParentClass, lambda target_cls: ["num"])
+        self.mapper.add_spec(ChildClass, lambda target_cls: ["flag"])
+
+        assert list(self.mapper._get_fields(ChildClass)) == ["flag"]
+        assert list(self.mapper._get_fields(ParentClass)) == ["num"]
+
+    def test_get_fields__spec_of_abstract_base_class_is_used_for_virtual_subclass(
+        self,
+    ):
+        self.mapper.add_spec(AbstractRecord, lambda target_cls: ["text"])
+
+        assert list(self.mapper._get_fields(VirtualRecord)) == ["text"]
+
+    def test_get_fields__fields_are_cached_until_add_spec(self):
+        assert list(self.mapper._get_fields(AnotherClass)) == ["text", "num"]
+        assert AnotherClass in self.mapper._fields
+
+        self.mapper.add_spec(classifier_func, spec_func)
+
+        assert not self.mapper._fields
+        assert list(self.mapper._get_fields(ClassWithoutInitAttrDef)) == ["text", "num"]
+
+    def test_clear_caches__fields_are_resolved_again(self):
+        fields = ["text"]
+        self.mapper.add_spec(ParentClass, lambda target_cls: fields)
+        self.mapper.to(AnotherClass).map(ChildClass(10, "test_text", False))
+        assert self.mapper._get_fields(ParentClass) == ("text",)
+
+        fields.append("num")
+        assert self.mapper._get_fields(ParentClass) == ("text",)
+
+        self.mapper.clear_caches()
+
+        assert not self.mapper._plans
+        assert self.mapper._get_fields(ParentClass) == ("text", "num")
+
+    def test_add_constructor__target_objects_are_created_with_constructor(self):
+        calls = []
+
+        def constructor_func(target_cls: Any) -> Any:
+            calls.append(target_cls)
+            return lambda mapped_values: target_cls(num=0, **mapped_values)
+
+        self.mapper.add_spec(ParentClass, lambda target_cls: ["text", "flag"])
+        self.mapper.add_constructor(ParentClass, constructor_func)
+        fields_mapping = {"flag": True}
+
+        first = self.mapper.to(ChildClass).map(
+            AnotherClass("text", 10), fields_mapping=fields_mapping
+        )
+        second = self.mapper.to(ChildClass).map(
+            AnotherClass("next", 10), fields_mapping=fields_mapping
+        )
+
+        assert (first.text, first.num, first.flag) == ("text", 0, True)
+        assert second.text == "next"
+        assert calls == [ChildClass]
+
+    def test_add_constructor__constructor_of_last_added_classifier_is_used(self):
+        self.mapper.add_constructor(
+            classifier_func, lambda target_cls: lambda mapped_values: "first"
+        )
+        self.mapper.add_constructor(
+            lambda target_cls: target_cls.__name__ == "ClassWithoutInitAttrDef",
+            lambda target_cls: lambda mapped_values: "second",
+        )
+        self.mapper.add_spec(classifier_func, spec_func)
+
+        result: Any = self.mapper.to(ClassWithoutInitAttrDef).map(AnotherClass("t", 1))
+
+        assert result == "second"
+
+    def test_add_constructor__error_on_duplicated_registration(self):
+        self.mapper.add_constructor(ParentClass, lambda target_cls: target_cls)
+        self.mapper.add_constructor(classifier_func, lambda target_cls: target_cls)
+
+        with pytest.raises(DuplicatedRegistrationError):
+            self.mapper.add_constructor(ParentClass, lambda target_cls: target_cls)
+        with pytest.raises(DuplicatedRegistrationError):
+            self.mapper.add_constructor(classifier_func, lambda target_cls: target_cls)
+        with pytest.raises(ValueError):
+            self.mapper.add_constructor(None, lambda target_cls: target_cls)  # type: ignore [arg-type]
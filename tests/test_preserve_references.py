@@ -0,0 +1,226 @@
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+import pytest
+from automapper import CircularReferenceError, create_mapper
+from pydantic import BaseModel
+
+
+class Customer:
+    def __init__(self, name: str, tags: List[str]):
+        self.name = name
+        self.tags = tags
+
+
+class PublicCustomer:
+    created = 0
+
+    def __init__(self, name: str, tags: List[str]):
+        PublicCustomer.created += 1
+        self.name = name
+        self.tags = tags
+
+
+class Order:
+    def __init__(self, number: int, customer: Customer, tags: List[str]):
+        self.number = number
+        self.customer = customer
+        self.tags = tags
+
+
+class PublicOrder:
+    def __init__(self, number: int, customer: PublicCustomer, tags: List[str]):
+        self.number = number
+        self.customer = customer
+        self.tags = tags
+
+
+class Batch:
+    def __init__(self, orders: List[Order], owner: Customer):
+        self.orders = orders
+        self.owner = owner
+
+
+class PublicBatch:
+    def __init__(self, orders: List[PublicOrder], owner: PublicCustomer):
+        self.orders = orders
+        self.owner = owner
+
+
+class Node:
+    def __init__(self, name: str, parent: Optional["Node"], children: List["Node"]):
+        self.name = name
+        self.parent = parent
+        self.children = children
+
+
+class PublicNode:
+    def __init__(self, name: str, parent: Any, children: List[Any]):
+        self.name = name
+        self.parent = parent
+        self.children = children
+
+
+@dataclass(frozen=True)
+class FrozenNode:
+    name: str
+    parent: Any
+    children: List[Any]
+
+
+class NodeModel(BaseModel):
+    name: str
+    parent: Optional["NodeModel"]
+    children: List["NodeModel"]
+
+
+class NewNode(PublicNode):
+    def __new__(cls, *args: Any, **kwargs: Any) -> "NewNode":
+        return super().__new__(cls)
+
+
+def create_batch() -> Batch:
+    customer = Customer("John", ["vip"])
+    tags = ["new"]
+    orders = [Order(1, customer, tags), Order(2, customer, tags)]
+    return Batch(orders, customer)
+
+
+def create_tree() -> Node:
+    root = Node("root", None, [])
+    root.children.append(Node("child", root, []))
+    return root
+
+
+@pytest.fixture
+def mapper():
+    mapper = create_mapper()
+    mapper.add(Customer, PublicCustomer)
+    mapper.add(Order, PublicOrder)
+    mapper.add(Batch, PublicBatch)
+    PublicCustomer.created = 0
+    return mapper
+
+
+def test_map__shared_objects_are_mapped_once(mapper):
+    result: PublicBatch = mapper.map(create_batch(), preserve_references=True)
+
+    assert PublicCustomer.created == 1
+    assert result.owner is result.orders[0].customer is result.orders[1].customer
+    assert result.orders[0].tags is result.orders[1].tags
+    assert result.owner.tags == ["vip"]
+
+
+def test_map__shared_objects_are_mapped_for_every_reference_by_default(mapper):
+    result: PublicBatch = mapper.map(create_batch())
+
+    assert PublicCustomer.created == 3
+    assert result.owner is not result.orders[0].customer
+    assert result.orders[0].tags is not result.orders[1].tags
+
+
+@pytest.mark.parametrize("codegen", [False, True])
+def test_map__circular_references_are_mapped(codegen):
+    mapper = create_mapper(codegen=codegen)
+    mapper.add(Node, PublicNode)
+
+    result: PublicNode = mapper.map(create_tree(), preserve_references=True)
+
+    assert result.name == "root"
+    assert result.parent is None
+    assert result.children[0].name == "child"
+    assert result.children[0].parent is result
+
+
+def test_map__circular_references_of_frozen_dataclasses_are_mapped():
+    mapper = create_mapper()
+
+    result = mapper.to(FrozenNode).map(create_tree(), preserve_references=True)
+
+    assert isinstance(result, FrozenNode)
+    assert result.children[0].parent is not result
+    assert result.children[0].parent.children[0] is result.children[0]
+
+
+def test_map__circular_references_of_pydantic_models_are_mapped():
+    mapper = create_mapper()
+    mapper.add(Node, NodeModel)
+
+    result: NodeModel = mapper.map(create_tree(), preserve_references=True)
+
+    assert result.children[0].name == "child"
+    assert result.children[0].parent is result
+
+
+def test_map__circular_references_of_builtin_collections_are_mapped():
+    mapper = create_mapper()
+    items: List[Any] = ["item"]
+    items.append(items)
+    values: Any = {"items": items}
+    values["self"] = values
+
+    result = mapper.to(PublicNode).map(
+        Node("root", None, items), preserve_references=True
+    )
+    result_values = mapper.to(PublicNode).map(
+        Node("root", values, []), preserve_references=True
+    )
+
+    assert result.children is not items
+    assert result.children[1] is result.children
+    assert result_values.parent["self"] is result_values.parent
+    assert result_values.parent["items"][1] is result_values.parent["items"]
+
+
+def test_map__circular_references_of_classes_with_custom_new_raise_error():
+    mapper = create_mapper()
+    mapper.add(Node, NewNode)
+
+    with pytest.raises(CircularReferenceError):
+        mapper.map(create_tree(), preserve_references=True)
+
+
+def test_map_many__references_are_preserved_per_object(mapper):
+    batches = [create_batch(), create_batch()]
+
+    results: List[PublicBatch] = mapper.map_many(
+        batches, preserve_references=True, as_list=True
+    )
+
+    assert PublicCustomer.created == 2
+    assert results[0].owner is results[0].orders[1].customer
+    assert results[0].owner is not results[1].owner
+
+
+def test_map__lazy_child_objects_preserve_references(mapper):
+    result: PublicBatch = mapper.map(
+        create_batch(), lazy=True, preserve_references=True
+    )
+
+    assert result.orders[0].customer.name == "John"
+    assert result.owner.name == "John"
+    assert PublicCustomer.created == 1
+
+
+@pytest.mark.parametrize("iterative", [False, True])
+def test_map__shared_lazy_child_objects_have_one_proxy(iterative):
+    mapper = create_mapper(iterative=iterative)
+    mapper.add(Customer, PublicCustomer)
+    mapper.add(Order, PublicOrder)
+    mapper.add(Batch, PublicBatch)
+    mapper.add(Node, PublicNode)
+    PublicCustomer.created = 0
+    root = Node("root", None, [])
+    root.children.append(Node("child", root, []))
+
+    result: PublicBatch = mapper.map(
+        create_batch(), lazy=True, preserve_references=True
+    )
+    node: PublicNode = mapper.map(root, lazy=True, preserve_references=True)
+
+    assert result.owner.name == "John"
+    assert result.orders[0].customer is result.owner
+    assert result.orders[1].customer is result.owner
+    assert result.orders[0].tags is result.orders[1].tags
+    assert PublicCustomer.created == 1
+    assert node.children[0].parent is node
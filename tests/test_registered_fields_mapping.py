@@ -0,0 +1,183 @@
+from operator import attrgetter
+from typing import Any, List
+
+import pytest
+from automapper import create_mapper
+from automapper.plan import ATTRIBUTE, CONSTANT, GETTER, compile_fields_mapping
+
+
+class Address:
+    def __init__(self, city: str, street: str):
+        self.city = city
+        self.street = street
+
+
+class User:
+    def __init__(self, name: str, address: Address):
+        self.name = name
+        self.address = address
+
+
+class PublicUser:
+    def __init__(self, full_name: str, city: str, source: Any):
+        self.full_name = full_name
+        self.city = city
+        self.source = source
+
+
+class Team:
+    def __init__(self, title: str, members: List[User]):
+        self.title = title
+        self.members = members
+
+
+class PublicTeam:
+    def __init__(self, title: str, members: List[Any]):
+        self.title = title
+        self.members = members
+
+
+USER_FIELDS_MAPPING = {
+    "full_name": "User.name",
+    "city": "User.address.city",
+    "source": "crm",
+    "unknown": "User.unknown",
+}
+
+
+def create_user(name: str = "John") -> User:
+    return User(name, Address("Kyiv", "Main"))
+
+
+def test_compile_fields_mapping__getters_and_constants():
+    compiled = compile_fields_mapping(User, USER_FIELDS_MAPPING)
+
+    assert compiled["full_name"][0] == GETTER
+    assert compiled["city"][1](create_user()) == "Kyiv"
+    assert compiled["source"] == (CONSTANT, "crm")
+
+
+@pytest.mark.parametrize("codegen", [False, True])
+def test_map__registered_fields_mapping_with_nested_paths(codegen):
+    mapper = create_mapper(codegen=codegen)
+    mapper.add(User, PublicUser, fields_mapping=USER_FIELDS_MAPPING)
+
+    result: PublicUser = mapper.map(create_user())
+
+    assert result.full_name == "John"
+    assert result.city == "Kyiv"
+    assert result.source == "crm"
+    plan = mapper._get_plan(User, PublicUser)
+    assert plan.fields == (
+        ("full_name", GETTER),
+        ("city", GETTER),
+        ("source", CONSTANT),
+    )
+
+
+@pytest.mark.parametrize("codegen", [False, True])
+def test_map__custom_mapping_has_priority_over_registered(codegen):
+    mapper = create_mapper(codegen=codegen)
+    mapper.add(User, PublicUser, fields_mapping=USER_FIELDS_MAPPING)
+
+    result: PublicUser = mapper.map(
+        create_user(), fields_mapping={"city": "Lviv", "source": None}
+    )
+
+    assert result.full_name == "John"
+    assert result.city == "Lviv"
+    assert result.source is None
+
+
+def test_map__registered_fields_mapping_is_used_for_nested_objects():
+    mapper = create_mapper()
+    mapper.add(User, PublicUser, fields_mapping=USER_FIELDS_MAPPING)
+    mapper.add(Team, PublicTeam)
+
+    result: PublicTeam = mapper.map(
+        Team("team", [create_user("John"), create_user("Jane")])
+    )
+
+    assert [member.full_name for member in result.members] == ["John", "Jane"]
+    assert all(isinstance(member, PublicUser) for member in result.members)
+
+
+def test_to_map__registered_fields_mapping_is_used_for_registered_target_class():
+    mapper = create_mapper()
+    mapper.add(User, PublicUser, fields_mapping=USER_FIELDS_MAPPING)
+
+    result = mapper.to(PublicUser).map(create_user())
+
+    assert result.full_name == "John"
+
+
+def test_add__override_replaces_registered_fields_mapping():
+    mapper = create_mapper()
+    mapper.add(User, PublicUser, fields_mapping=USER_FIELDS_MAPPING)
+    mapper.map(create_user())
+
+    mapper.add(
+        User,
+        PublicUser,
+        override=True,
+        fields_mapping={"full_name": "User.address.street", "city": "", "source": ""},
+    )
+
+    result: PublicUser = mapper.map(create_user())
+    assert result.full_name == "Main"
+    mapper.add(User, Address, override=True)
+    assert User not in mapper._fields_mappings
+    assert mapper._get_plan(User, Address).fields == (
+        ("city", ATTRIBUTE),
+        ("street", ATTRIBUTE),
+    )
+
+
+def format_name(user: User) -> str:
+    return user.name.upper()
+
+
+@pytest.mark.parametrize("codegen", [False, True])
+def test_map__registered_functions_are_called_with_source_object(codegen):
+    mapper = create_mapper(codegen=codegen)
+    calls: List[User] = []
+
+    def read_city(user: User) -> str:
+        calls.append(user)
+        return user.address.city
+
+    mapper.add(
+        User,
+        PublicUser,
+        fields_mapping={
+            "full_name": format_name,
+            "city": read_city,
+            "source": Address,
+            "unknown": lambda user: pytest.fail("not a field of target class"),
+        },
+    )
+    user = create_user()
+
+    result: PublicUser = mapper.map(user)
+
+    assert result.full_name == "JOHN"
+    assert result.city == "Kyiv"
+    assert result.source is Address
+    assert calls == [user]
+
+
+def test_map__custom_mapping_functions_are_called_with_source_object():
+    mapper = create_mapper()
+
+    result = mapper.to(PublicUser).map(
+        create_user(),
+        fields_mapping={
+            "full_name": attrgetter("name"),
+            "city": lambda user: user.address.city,
+            "source": lambda user: format_name,
+        },
+    )
+
+    assert result.full_name == "John"
+    assert result.city == "Kyiv"
+    assert result.source is format_name
@@ -0,0 +1,166 @@
+from dataclasses import dataclass
+from typing import Any, FrozenSet, List, NamedTuple, Tuple
+
+from automapper import create_mapper
+from automapper.copier import Copier
+
+
+@dataclass(frozen=True)
+class Coordinates:
+    lat: float
+    lon: float
+
+
+@dataclass(frozen=True)
+class FrozenTags:
+    names: Tuple[str, ...]
+    extra: Any = None
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+
+
+class Tag:
+    def __init__(self, name: str):
+        self.name = name
+
+
+class PublicTag:
+    def __init__(self, name: str):
+        self.name = name
+
+
+class Document:
+    def __init__(
+        self,
+        title: str,
+        words: Tuple[Any, ...],
+        labels: FrozenSet[str],
+        coordinates: Any,
+    ):
+        self.title = title
+        self.words = words
+        self.labels = labels
+        self.coordinates = coordinates
+
+
+class PublicDocument:
+    def __init__(
+        self,
+        title: str,
+        words: Tuple[Any, ...],
+        labels: FrozenSet[str],
+        coordinates: Any,
+    ):
+        self.title = title
+        self.words = words
+        self.labels = labels
+        self.coordinates = coordinates
+
+
+def create_document(
+    words: Tuple[Any, ...] = ("a", "b"), coordinates: Any = None
+) -> Document:
+    return Document(
+        "doc", words, frozenset({"x", "y"}), coordinates or Coordinates(1.0, 2.0)
+    )
+
+
+def test_is_immutable__immutable_values():
+    copier = Copier()
+
+    for obj in [
+        ("a", (1, 2)),
+        frozenset({"a"}),
+        Coordinates(1.0, 2.0),
+        Point(1, 2),
+        FrozenTags(("a",)),
+    ]:
+        assert copier.is_immutable(obj)
+
+
+def test_is_immutable__values_with_mutable_parts():
+    copier = Copier()
+
+    for obj in [("a", ["b"]), [1], {"a": 1}, FrozenTags(("a",), extra=[1]), Tag("a")]:
+        assert not copier.is_immutable(obj)
+
+
+def test_is_immutable__mutable_types_are_not_shared():
+    assert not Copier().is_immutable((Tag("a"),), mutable_types={Tag})
+
+
+def test_is_immutable__verdict_is_cached_per_type():
+    copier = Copier()
+
+    copier.is_immutable(Coordinates(1.0, 2.0))
+
+    assert Coordinates in copier._immutability
+    copier.register(Tag, lambda obj, memo: obj)
+    assert not copier._immutability
+
+
+def test_map__share_immutable_shares_immutable_values():
+    mapper = create_mapper()
+    mapper.add(Document, PublicDocument)
+    document = create_document()
+
+    result: PublicDocument = mapper.map(document, share_immutable=True)
+
+    assert result.words is document.words
+    assert result.labels is document.labels
+    assert result.coordinates is document.coordinates
+
+
+def test_map__share_immutable_copies_mutable_values():
+    mapper = create_mapper()
+    mapper.add(Document, PublicDocument)
+    items: List[str] = ["b"]
+    document = create_document(words=("a", items))
+
+    result: PublicDocument = mapper.map(document, share_immutable=True)
+
+    assert result.words == document.words
+    assert result.words is not document.words
+    assert result.words[1] is not items
+
+
+def test_map__share_immutable_maps_registered_types():
+    mapper = create_mapper()
+    mapper.add(Document, PublicDocument)
+    mapper.add(Tag, PublicTag)
+    document = create_document(words=("a", Tag("b")))
+
+    result: PublicDocument = mapper.map(document, share_immutable=True)
+
+    assert result.words[0] == "a"
+    assert isinstance(result.words[1], PublicTag)
+    assert result.labels is document.labels
+
+
+def test_map__values_are_copied_by_default():
+    mapper = create_mapper()
+    mapper.add(Document, PublicDocument)
+    document = create_document(words=("a", "b", ("c",)))
+
+    result: PublicDocument = mapper.map(document)
+
+    assert result.words == document.words
+    assert result.words is not document.words
+    assert result.coordinates is not document.coordinates
+
+
+def test_map_many__share_immutable_shares_immutable_values():
+    mapper = create_mapper()
+    mapper.add(Document, PublicDocument)
+    documents = [create_document(), create_document(words=("c",))]
+
+    results: List[PublicDocument] = mapper.map_many(
+        documents, share_immutable=True, as_list=True
+    )
+
+    for result, document in zip(results, documents):
+        assert result.words is document.words
+        assert result.coordinates is document.coordinates
@@ -0,0 +1,120 @@
+from collections import UserList
+from enum import Enum
+from typing import Any, Callable, List
+
+import pytest
+from automapper import CircularReferenceError, create_mapper
+from automapper.plan import COPIED, DICTIONARY, IMMEDIATE, MAPPED, SEQUENCE
+
+
+class Color(Enum):
+    RED = "red"
+
+
+class Item:
+    def __init__(self, name: str):
+        self.name = name
+
+
+class PublicItem:
+    def __init__(self, name: str):
+        self.name = name
+
+
+class Bag(UserList):  # type: ignore [type-arg]
+    pass
+
+
+class FrozenBag(Bag):
+    pass
+
+
+class Holder:
+    def __init__(self, value: Any):
+        self.value = value
+
+
+def map_bag(bag: Bag, map_child: Callable[[Any], Any]) -> Bag:
+    return type(bag)(map_child(item) for item in bag)
+
+
+@pytest.fixture
+def mapper():
+    mapper = create_mapper()
+    mapper.add(Item, PublicItem)
+    return mapper
+
+
+def test_subobject_kind__types_are_classified_once(mapper):
+    mapper.to(Holder).map(Holder([1, Color.RED, {"a": Item("x")}, None, object()]))
+
+    assert mapper._subobject_kinds[list] == SEQUENCE
+    assert mapper._subobject_kinds[dict] == DICTIONARY
+    assert mapper._subobject_kinds[Color] == IMMEDIATE
+    assert mapper._subobject_kinds[Item] == MAPPED
+    assert mapper._subobject_kinds[object] == COPIED
+    assert mapper._subobject_kinds[int] == IMMEDIATE
+
+
+def test_subobject_kind__is_updated_when_mapping_is_added():
+    mapper = create_mapper()
+    item = Item("x")
+
+    copied = mapper.to(Holder).map(Holder(item))
+    mapper.add(Item, PublicItem)
+    mapped = mapper.to(Holder).map(Holder(item))
+
+    assert type(copied.value) is Item
+    assert type(mapped.value) is PublicItem
+
+
+@pytest.mark.parametrize("iterative", [False, True])
+def test_add_handler__child_objects_are_mapped_with_handler(iterative):
+    mapper = create_mapper(iterative=iterative)
+    mapper.add(Item, PublicItem)
+    mapper.add_handler(Bag, map_bag)
+    bag = FrozenBag([Item("x"), [Item("y")]])
+
+    result = mapper.to(Holder).map(Holder(bag))
+
+    assert type(result.value) is FrozenBag
+    assert result.value is not bag
+    assert isinstance(result.value[0], PublicItem)
+    assert isinstance(result.value[1][0], PublicItem)
+
+
+@pytest.mark.parametrize("iterative", [False, True])
+def test_add_handler__circular_references_raise_error(iterative):
+    mapper = create_mapper(iterative=iterative)
+    mapper.add_handler(Bag, map_bag)
+    bag = Bag()
+    bag.append(bag)
+
+    with pytest.raises(CircularReferenceError):
+        mapper.to(Holder).map(Holder(bag))
+
+
+def test_add_handler__handled_objects_preserve_references(mapper):
+    calls: List[Bag] = []
+
+    def handler(bag: Bag, map_child: Callable[[Any], Any]) -> Bag:
+        calls.append(bag)
+        return map_bag(bag, map_child)
+
+    mapper.add_handler(Bag, handler)
+    bag = Bag([Item("x")])
+
+    result = mapper.to(Holder).map(Holder([bag, bag]), preserve_references=True)
+
+    assert result.value[0] is result.value[1]
+    assert calls == [bag]
+
+
+def test_add_handler__handlers_of_derived_mapper_are_not_visible_in_parent(mapper):
+    mapper.to(Holder).map(Holder(Bag([1])))
+    derived = mapper.derive()
+
+    derived.add_handler(Bag, lambda bag, map_child: "handled")
+
+    assert derived.to(Holder).map(Holder(Bag([1]))).value == "handled"
+    assert mapper.to(Holder).map(Holder(Bag([1]))).value == Bag([1])
@@ -0,0 +1,169 @@
+import copy
+from dataclasses import dataclass, field
+from typing import Any, List, Optional
+
+import pytest
+from automapper import create_mapper
+
+
+class Customer:
+    def __init__(self, name: str, tags: Optional[List[str]], parent: Any = None):
+        self.name = name
+        self.tags = tags
+        self.parent = parent
+
+
+class PublicCustomer:
+    created = 0
+
+    def __init__(self, name: str, tags: Optional[List[str]], parent: Any = None):
+        PublicCustomer.created += 1
+        if not name:
+            raise ValueError("name is required")
+        self.name = name
+        self.tags = tags
+        self.parent = parent
+
+
+class SlotsCustomer:
+    __slots__ = ("name", "tags", "parent")
+
+    def __init__(self, name: str, tags: List[str], parent: Any = "none"):
+        raise AssertionError("__init__ is not called in trusted mode")
+
+
+@dataclass
+class CustomerData:
+    name: str
+    tags: List[str] = field(default_factory=list)
+    parent: Any = None
+    created: bool = field(init=False, default=True)
+
+    def __post_init__(self) -> None:
+        raise AssertionError("__post_init__ is not called in trusted mode")
+
+
+class NewCustomer(PublicCustomer):
+    def __new__(cls, *args: Any, **kwargs: Any) -> "NewCustomer":
+        return super().__new__(cls)
+
+
+class PropertyCustomer:
+    def __init__(self, name: str, tags: List[str], parent: Any = None):
+        self._name = name
+        self.tags = tags
+        self.parent = parent
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+
+@pytest.fixture(autouse=True)
+def reset_counter():
+    PublicCustomer.created = 0
+
+
+@pytest.mark.parametrize("codegen", [False, True])
+def test_add__trusted_mapping_skips_init(codegen):
+    mapper = create_mapper(codegen=codegen)
+    mapper.add(Customer, PublicCustomer, trusted=True)
+    source = Customer("", ["vip"])
+
+    result: PublicCustomer = mapper.map(source)
+
+    assert PublicCustomer.created == 0
+    assert type(result) is PublicCustomer
+    assert vars(result) == {"name": "", "tags": ["vip"], "parent": None}
+    assert result.tags is not source.tags
+
+
+def test_add__mappings_are_not_trusted_by_default():
+    mapper = create_mapper()
+    mapper.add(Customer, PublicCustomer)
+
+    with pytest.raises(ValueError):
+        mapper.map(Customer("", []))
+    mapper.add(Customer, PublicCustomer, override=True, trusted=True)
+    mapper.map(Customer("", []))
+    mapper.add(Customer, PublicCustomer, override=True)
+    with pytest.raises(ValueError):
+        mapper.map(Customer("", []))
+
+
+@pytest.mark.parametrize("codegen", [False, True])
+def test_add__skipped_values_get_default_values_in_trusted_mode(codegen):
+    mapper = create_mapper(codegen=codegen)
+    mapper.add(Customer, SlotsCustomer, trusted=True)
+    mapper.add(PublicCustomer, CustomerData, trusted=True)
+    source = PublicCustomer("John", None)
+
+    result: Any = mapper.map(Customer("John", ["a"]), skip_none_values=True)
+    data: CustomerData = mapper.map(source, skip_none_values=True)
+
+    assert (result.name, result.tags, result.parent) == ("John", ["a"], "none")
+    assert vars(data) == {
+        "name": "John",
+        "tags": [],
+        "parent": None,
+        "created": True,
+    }
+
+
+def test_add__classes_with_custom_new_are_called_in_trusted_mode():
+    mapper = create_mapper()
+    mapper.add(Customer, NewCustomer, trusted=True)
+
+    result: Any = mapper.map(Customer("John", []))
+
+    assert type(result) is NewCustomer
+    assert PublicCustomer.created == 1
+
+
+@pytest.mark.parametrize("codegen", [False, True])
+def test_add__classes_with_property_fields_are_called_in_trusted_mode(codegen):
+    mapper = create_mapper(codegen=codegen)
+    mapper.add(Customer, PropertyCustomer, trusted=True)
+
+    result: Any = mapper.map(Customer("John", ["vip"]))
+
+    assert (result.name, result.tags) == ("John", ["vip"])
+    assert "name" not in vars(result)
+
+
+@pytest.mark.parametrize("iterative", [False, True])
+def test_add__circular_references_are_preserved_in_trusted_mode(iterative):
+    mapper = create_mapper(iterative=iterative)
+    mapper.add(Customer, CustomerData, trusted=True)
+    source = Customer("John", [])
+    source.parent = source
+
+    result: CustomerData = mapper.map(source, preserve_references=True)
+
+    assert result.parent is result
+    assert result.created
+
+
+def test_add__trusted_mapping_is_kept_in_restored_mapper():
+    mapper = create_mapper(codegen=True)
+    mapper.add(Customer, PublicCustomer, trusted=True)
+    mapper.map(Customer("John", []))
+
+    # plans are restored with `__setstate__`, same as in worker processes
+    restored = copy.deepcopy(mapper)
+    result: Any = restored.map(Customer("", []))
+
+    assert result.name == ""
+    assert PublicCustomer.created == 0
+
+
+def test_add__trusted_mapping_of_derived_mapper_is_not_visible_in_parent():
+    mapper = create_mapper()
+    mapper.add(Customer, PublicCustomer)
+    derived = mapper.derive()
+
+    derived.add(Customer, PublicCustomer, override=True, trusted=True)
+
+    derived.map(Customer("", []))
+    with pytest.raises(ValueError):
+        mapper.map(Customer("", []))
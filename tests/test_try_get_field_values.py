@@ -1,6 +1,7 @@
 from dataclasses import dataclass
+from typing import Any, Dict, Optional
 
-from automapper.mapper import _try_get_field_value
+from automapper import create_mapper
 
 
 @dataclass
@@ -8,33 +9,35 @@ class DummyClass:
     map_field: str
 
 
-def test_try_get_field_value__if_in_custom_mapping():
-    is_found, mapped_value = _try_get_field_value("field1", None, {"field1": 123})
+class EmptyClass:
+    pass
 
-    assert is_found
-    assert mapped_value == 123
 
+def map_values(obj: Any, custom_mapping: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    mapper = create_mapper()
+    plan = mapper._get_plan(type(obj), DummyClass)
+    return plan.map_values(mapper, obj, set(), custom_mapping)
 
-def test_try_get_field_value__if_origin_has_same_field_attr():
-    is_found, mapped_value = _try_get_field_value(
-        "map_field", DummyClass("Hello world"), None
-    )
 
-    assert is_found
-    assert mapped_value == "Hello world"
+def test_map_values__if_in_custom_mapping():
+    mapped_values = map_values(EmptyClass(), {"map_field": 123})
 
+    assert mapped_values == {"map_field": 123}
 
-def test_try_get_field_value__if_origin_contains_same_field_as_item():
-    is_found, mapped_value = _try_get_field_value(
-        "map_field", {"map_field": "Hello world. Again"}, None
-    )
 
-    assert is_found
-    assert mapped_value == "Hello world. Again"
+def test_map_values__if_origin_has_same_field_attr():
+    mapped_values = map_values(DummyClass("Hello world"), None)
 
+    assert mapped_values == {"map_field": "Hello world"}
 
-def test_try_get_field_value__if_field_not_found():
-    is_found, mapped_value = _try_get_field_value("field1", None, None)
 
-    assert not is_found
-    assert mapped_value is None
+def test_map_values__if_origin_contains_same_field_as_item():
+    mapped_values = map_values({"map_field": "Hello world. Again"}, None)
+
+    assert mapped_values == {"map_field": "Hello world. Again"}
+
+
+def test_map_values__if_field_not_found():
+    mapped_values = map_values(EmptyClass(), None)
+
+    assert mapped_values == {}
@@ -1,9 +1,12 @@
 from collections import OrderedDict
 from enum import Enum
+from functools import partial
+from operator import attrgetter
 
 from automapper.utils import (
     is_dictionary,
     is_enum,
+    is_function,
     is_primitive,
     is_sequence,
     is_subscriptable,
@@ -77,3 +80,15 @@ def test_is_enum__object_is_enum():
 
 def test_is_enum__dict_is_not_enum():
     assert not is_enum({"A": 1, "B": 2})
+
+
+def test_is_function__functions_and_getters():
+    assert is_function(lambda obj: obj)
+    assert is_function(len)
+    assert is_function(attrgetter("name"))
+    assert is_function(partial(max, 1))
+
+
+def test_is_function__classes_and_values_are_not_functions():
+    assert not is_function(OrderedDict)
+    assert not is_function("UserInfo.name")